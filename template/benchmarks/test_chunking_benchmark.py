@@ -0,0 +1,55 @@
+"""Benchmarks comparing chunk sizes on a workload with skewed per-item cost.
+
+Run with ``uv run pytest benchmarks/ --benchmark-only``.
+"""
+
+import time
+from typing import Any
+
+import pytest
+from template_package.core.example import process_data
+
+ITEM_COUNT = 400
+MAX_WORKERS = 4
+LIGHT_COST = 0.0001  # 秒
+HEAVY_COST = 0.01  # 軽いアイテムの100倍
+
+
+class SkewedCostProcessor:
+    """Picklable processor whose per-item cost is encoded in ``value``."""
+
+    def process(self, data: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Sleep for each item's cost, then return the data unchanged."""
+        for item in data:
+            time.sleep(HEAVY_COST if item["value"] else LIGHT_COST)
+        return data
+
+
+@pytest.fixture(scope="module")
+def skewed_items() -> list[dict[str, Any]]:
+    """Create items whose expensive tenth is clustered at the start."""
+    return [
+        {"id": i, "name": f"item-{i}", "value": int(i < ITEM_COUNT // 10)}
+        for i in range(ITEM_COUNT)
+    ]
+
+
+@pytest.mark.benchmark(group="chunking-skewed")
+@pytest.mark.parametrize(
+    "chunk_size",
+    [ITEM_COUNT // MAX_WORKERS, None],
+    ids=["one_chunk_per_worker", "default"],
+)
+def test_skewed_workload(
+    benchmark: Any,
+    skewed_items: list[dict[str, Any]],
+    chunk_size: int | None,
+) -> None:
+    """Measure wall time until the last chunk of a skewed workload finishes."""
+    result = benchmark.pedantic(
+        process_data,
+        args=(skewed_items, SkewedCostProcessor()),
+        kwargs={"max_workers": MAX_WORKERS, "chunk_size": chunk_size},
+        rounds=3,
+    )
+    assert len(result) == ITEM_COUNT
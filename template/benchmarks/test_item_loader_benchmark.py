@@ -0,0 +1,55 @@
+"""Benchmarks comparing per-item and bulk loading of validated items.
+
+Run with ``uv run pytest benchmarks/ --benchmark-only``.
+"""
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+from template_package.core.example import ExampleClass, ExampleConfig
+from template_package.core.item_loader import load_items_json
+from template_package.utils.helpers import save_json_array
+
+ITEM_COUNT = 200_000
+
+
+@pytest.fixture(scope="module")
+def items_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Write a large array of items once."""
+    path = tmp_path_factory.mktemp("item_loader") / "items.json"
+    save_json_array(
+        ({"id": i, "name": f"item-{i:08d}", "value": i * 7} for i in range(ITEM_COUNT)),
+        path,
+    )
+    return path
+
+
+def _new_instance() -> ExampleClass:
+    return ExampleClass(ExampleConfig(name="benchmark", max_items=ITEM_COUNT))
+
+
+@pytest.mark.benchmark(group="item-loader")
+def test_load_and_add_item(benchmark: Any, items_file: Path) -> None:
+    """Decode with json.loads and validate in add_item, one item at a time."""
+
+    def load() -> ExampleClass:
+        instance = _new_instance()
+        for item in json.loads(items_file.read_text(encoding="utf-8")):
+            instance.add_item(item)
+        return instance
+
+    assert len(benchmark.pedantic(load, rounds=3)) == ITEM_COUNT
+
+
+@pytest.mark.benchmark(group="item-loader")
+def test_load_items_json_and_add_items(benchmark: Any, items_file: Path) -> None:
+    """Validate with load_items_json and insert with add_items in bulk."""
+
+    def load() -> ExampleClass:
+        instance = _new_instance()
+        instance.add_items(load_items_json(items_file), validated=True)
+        return instance
+
+    assert len(benchmark.pedantic(load, rounds=3)) == ITEM_COUNT
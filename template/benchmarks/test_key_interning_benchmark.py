@@ -0,0 +1,80 @@
+"""Benchmarks of flattening many records with and without key interning.
+
+Besides wall time, each benchmark records the memory held by the flattened
+records, measured with :mod:`tracemalloc`, in ``extra_info``.
+
+Run with ``uv run pytest benchmarks/ --benchmark-only``.
+"""
+
+import tracemalloc
+from typing import Any
+
+import pytest
+from template_package.utils.helpers import flatten_dict
+from template_package.utils.key_pool import KeyInternPool
+
+RECORD_COUNT = 100_000
+
+
+def make_records() -> list[dict[str, Any]]:
+    """Create records sharing one nested shape."""
+    return [
+        {
+            "id": i,
+            "user": {"profile": {"name": "name", "email": "mail"}, "score": i},
+            "metadata": {"source": "api", "version": 2},
+        }
+        for i in range(RECORD_COUNT)
+    ]
+
+
+def flatten_all(
+    records: list[dict[str, Any]],
+    *,
+    intern: bool,
+) -> list[Any]:
+    """Flatten every record, sharing one pool if ``intern`` is True."""
+    pool = KeyInternPool() if intern else None
+    return [flatten_dict(record, key_pool=pool) for record in records]
+
+
+def retained_bytes(records: list[dict[str, Any]], *, intern: bool) -> int:
+    """Return the memory still allocated by the flattened records."""
+    tracemalloc.start()
+    try:
+        flattened = flatten_all(records, intern=intern)
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del flattened
+    return current
+
+
+@pytest.fixture(scope="module")
+def records() -> list[dict[str, Any]]:
+    """Create the records once per module."""
+    return make_records()
+
+
+@pytest.mark.benchmark(group="flatten-key-interning")
+@pytest.mark.parametrize("intern", [False, True], ids=["copies", "interned"])
+def test_flatten_many_records(
+    benchmark: Any,
+    records: list[dict[str, Any]],
+    intern: bool,
+) -> None:
+    """Measure flattening time and the memory retained by the results."""
+    benchmark.extra_info["retained_bytes"] = retained_bytes(records, intern=intern)
+
+    result = benchmark.pedantic(
+        flatten_all, args=(records,), kwargs={"intern": intern}, rounds=3
+    )
+    assert len(result) == RECORD_COUNT
+
+
+def test_interning_reduces_retained_memory(records: list[dict[str, Any]]) -> None:
+    """Interned keys must retain clearly less memory than per-record copies."""
+    copies = retained_bytes(records, intern=False)
+    interned = retained_bytes(records, intern=True)
+
+    assert interned < copies * 0.8
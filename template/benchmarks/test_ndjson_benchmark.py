@@ -0,0 +1,59 @@
+"""Benchmarks comparing serial and parallel JSON Lines parsing.
+
+Run with ``uv run pytest benchmarks/ --benchmark-only``.
+"""
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+from template_package.utils.ndjson import (
+    append_ndjson,
+    iter_ndjson,
+    load_ndjson_parallel,
+)
+
+RECORD_COUNT = 500_000
+CHUNK_SIZE = 4 * 1024 * 1024
+
+
+@pytest.fixture(scope="module")
+def ndjson_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Write a JSON Lines file of nested records (about 50 MB)."""
+    path = tmp_path_factory.mktemp("ndjson") / "records.ndjson"
+    append_ndjson(
+        (
+            {
+                "id": i,
+                "name": f"item-{i}",
+                "tags": ["a", "b", "c"],
+                "attributes": {"score": i * 0.5, "active": i % 2 == 0},
+            }
+            for i in range(RECORD_COUNT)
+        ),
+        path,
+    )
+    return path
+
+
+@pytest.mark.benchmark(group="ndjson-parse")
+def test_serial(benchmark: Any, ndjson_file: Path) -> None:
+    """Parse line by line in the calling process."""
+    records = benchmark.pedantic(
+        lambda: list(iter_ndjson(ndjson_file)),
+        rounds=3,
+    )
+    assert len(records) == RECORD_COUNT
+
+
+@pytest.mark.benchmark(group="ndjson-parse")
+@pytest.mark.parametrize("max_workers", [2, 4])
+def test_parallel(benchmark: Any, ndjson_file: Path, max_workers: int) -> None:
+    """Parse byte ranges in a process pool."""
+    records = benchmark.pedantic(
+        load_ndjson_parallel,
+        args=(ndjson_file,),
+        kwargs={"max_workers": max_workers, "chunk_size": CHUNK_SIZE},
+        rounds=3,
+    )
+    assert len(records) == RECORD_COUNT
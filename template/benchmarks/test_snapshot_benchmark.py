@@ -0,0 +1,96 @@
+"""Benchmarks comparing JSON files and binary snapshots of items.
+
+Run with ``uv run pytest benchmarks/ --benchmark-only``.
+"""
+
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pytest
+from template_package.core.snapshot import (
+    ItemSnapshot,
+    load_item_snapshot,
+    save_item_snapshot,
+)
+from template_package.utils.helpers import load_json_file, save_json_file
+
+ITEM_COUNT = 200_000
+
+
+@pytest.fixture(scope="module")
+def items() -> list[dict[str, Any]]:
+    """Create a large list of items."""
+    return [
+        {"id": i, "name": f"item-{i:08d}", "value": i * 7} for i in range(ITEM_COUNT)
+    ]
+
+
+@pytest.fixture(scope="module")
+def saved_files(
+    items: list[dict[str, Any]], tmp_path_factory: pytest.TempPathFactory
+) -> tuple[Path, Path]:
+    """Write the items once in both formats."""
+    directory = tmp_path_factory.mktemp("snapshot")
+    json_path = directory / "items.json"
+    snapshot_path = directory / "items.snap"
+    save_json_file({"items": items}, json_path)
+    save_item_snapshot(items, snapshot_path)
+    return json_path, snapshot_path
+
+
+@pytest.mark.benchmark(group="snapshot-save")
+def test_save_json(benchmark: Any, items: list[dict[str, Any]], tmp_path: Path) -> None:
+    """Write the items with save_json_file."""
+    benchmark.pedantic(
+        save_json_file, args=({"items": items}, tmp_path / "items.json"), rounds=3
+    )
+
+
+@pytest.mark.benchmark(group="snapshot-save")
+def test_save_snapshot(
+    benchmark: Any, items: list[dict[str, Any]], tmp_path: Path
+) -> None:
+    """Write the items with save_item_snapshot."""
+    benchmark.pedantic(
+        save_item_snapshot, args=(items, tmp_path / "items.snap"), rounds=3
+    )
+
+
+@pytest.mark.benchmark(group="snapshot-load")
+def test_load_json(benchmark: Any, saved_files: tuple[Path, Path]) -> None:
+    """Read the items with load_json_file."""
+    result = benchmark.pedantic(load_json_file, args=(saved_files[0],), rounds=3)
+    assert len(result["items"]) == ITEM_COUNT  # type: ignore[arg-type]
+
+
+@pytest.mark.benchmark(group="snapshot-load")
+def test_load_snapshot(benchmark: Any, saved_files: tuple[Path, Path]) -> None:
+    """Read the items with load_item_snapshot."""
+    result = benchmark.pedantic(load_item_snapshot, args=(saved_files[1],), rounds=3)
+    assert len(result) == ITEM_COUNT
+
+
+@pytest.mark.benchmark(group="snapshot-column")
+def test_sum_values_json(benchmark: Any, saved_files: tuple[Path, Path]) -> None:
+    """Sum the value field after loading the JSON file."""
+
+    def sum_values() -> int:
+        data = load_json_file(saved_files[0])
+        return sum(item["value"] for item in data["items"])  # type: ignore[index, union-attr]
+
+    assert benchmark.pedantic(sum_values, rounds=3) == 7 * sum(range(ITEM_COUNT))
+
+
+@pytest.mark.benchmark(group="snapshot-column")
+def test_sum_values_snapshot(benchmark: Any, saved_files: tuple[Path, Path]) -> None:
+    """Sum the memory-mapped value column with NumPy."""
+
+    def sum_values() -> int:
+        with ItemSnapshot.open(saved_files[1]) as snapshot:
+            values = np.frombuffer(snapshot.values, dtype="<i8")
+            total = int(values.sum())
+            del values
+        return total
+
+    assert benchmark.pedantic(sum_values, rounds=3) == 7 * sum(range(ITEM_COUNT))
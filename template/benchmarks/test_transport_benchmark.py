@@ -0,0 +1,70 @@
+"""Benchmarks comparing pickled and shared-memory chunk transport.
+
+Run with ``uv run pytest benchmarks/ --benchmark-only``.
+"""
+
+import pickle
+from typing import Any
+
+import pytest
+from template_package.core.example import process_data
+from template_package.core.shared_memory import SharedItemChunk
+from template_package.types import ChunkTransport
+
+ITEM_COUNT = 200_000
+
+
+class IdentityProcessor:
+    """Picklable processor that returns its input unchanged."""
+
+    def process(self, data: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Return the data as-is so only transport cost is measured."""
+        return data
+
+
+@pytest.fixture(scope="module")
+def items() -> list[dict[str, Any]]:
+    """Create a large list of items."""
+    return [
+        {"id": i, "name": f"item-{i:08d}", "value": i * 7} for i in range(ITEM_COUNT)
+    ]
+
+
+@pytest.mark.benchmark(group="transport-round-trip")
+def test_pickle_round_trip(benchmark: Any, items: list[dict[str, Any]]) -> None:
+    """Serialize and deserialize a chunk with pickle."""
+    result = benchmark(lambda: pickle.loads(pickle.dumps(items, protocol=-1)))
+    assert len(result) == ITEM_COUNT
+
+
+@pytest.mark.benchmark(group="transport-round-trip")
+def test_shared_memory_round_trip(benchmark: Any, items: list[dict[str, Any]]) -> None:
+    """Encode a chunk into shared memory and decode it from another handle."""
+
+    def round_trip() -> list[dict[str, Any]]:
+        with SharedItemChunk.create(items) as block:
+            reader = SharedItemChunk.attach(block.handle)
+            try:
+                return reader.to_items()
+            finally:
+                reader.close()
+
+    result = benchmark(round_trip)
+    assert len(result) == ITEM_COUNT
+
+
+@pytest.mark.benchmark(group="transport-process-data")
+@pytest.mark.parametrize("transport", ["pickle", "shared_memory"])
+def test_process_data_transport(
+    benchmark: Any,
+    items: list[dict[str, Any]],
+    transport: ChunkTransport,
+) -> None:
+    """Run process_data end to end in a process pool with each transport."""
+    result = benchmark.pedantic(
+        process_data,
+        args=(items, IdentityProcessor()),
+        kwargs={"max_workers": 4, "chunk_size": 10_000, "transport": transport},
+        rounds=3,
+    )
+    assert len(result) == ITEM_COUNT
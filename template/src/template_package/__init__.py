@@ -1,10 +1,14 @@
+from .core.deadline import ProcessingTimeoutError
 from .core.example import ExampleClass, process_data
+from .core.pool import shutdown_worker_pools
 from .utils.logging_config import get_logger, set_log_level, setup_logging
 
 __all__ = [
     "ExampleClass",
+    "ProcessingTimeoutError",
     "get_logger",
     "process_data",
     "set_log_level",
     "setup_logging",
+    "shutdown_worker_pools",
 ]
@@ -0,0 +1,183 @@
+"""Chunk-level checkpointing for long-running processing jobs."""
+
+import hashlib
+import json
+from collections.abc import Sequence
+from pathlib import Path
+from typing import cast
+
+from ..types import ItemDict, JSONObject
+from ..utils.helpers import load_json_file, save_json_file
+from ..utils.logging_config import get_logger
+
+# モジュールレベルのロガー
+logger = get_logger(__name__)
+
+MANIFEST_FILENAME = "manifest.json"
+CHUNK_FILENAME_TEMPLATE = "chunk_{index:08d}.json"
+
+
+def compute_fingerprint(data: Sequence[ItemDict], chunk_size: int) -> str:
+    """Compute a fingerprint identifying a chunked processing job.
+
+    Parameters
+    ----------
+    data : Sequence[ItemDict]
+        Input items of the job
+    chunk_size : int
+        Number of items per chunk
+
+    Returns
+    -------
+    str
+        Hex digest that changes whenever the input or the chunking changes
+    """
+    digest = hashlib.sha256(f"{len(data)}:{chunk_size}:".encode())
+    for item in data:
+        digest.update(json.dumps(item, sort_keys=True, default=str).encode("utf-8"))
+        digest.update(b"\n")
+    return digest.hexdigest()
+
+
+class ChunkCheckpoint:
+    """Persist completed chunk outputs so an interrupted run can resume.
+
+    Each completed chunk is stored as its own JSON file in ``directory``.
+    Files are written to a temporary name and atomically renamed, so a
+    crash while saving never leaves a truncated chunk behind and at most
+    the chunk in flight has to be processed again.
+
+    A manifest records the fingerprint of the job that created the
+    directory. Reopening the directory for a different input or chunk
+    size raises instead of silently mixing outputs of different jobs.
+
+    Examples
+    --------
+    >>> checkpoint = ChunkCheckpoint("ckpt", fingerprint="abc", total_chunks=3)
+    >>> checkpoint.save_chunk(0, [{"id": 1, "name": "a", "value": 1}])
+    >>> checkpoint.is_completed(0)
+    True
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        *,
+        fingerprint: str,
+        total_chunks: int,
+    ) -> None:
+        """Open or create a checkpoint directory.
+
+        Parameters
+        ----------
+        directory : str | Path
+            Directory holding the checkpoint files
+        fingerprint : str
+            Job fingerprint, see :func:`compute_fingerprint`
+        total_chunks : int
+            Number of chunks in the job
+
+        Raises
+        ------
+        ValueError
+            If the directory belongs to a different job
+        """
+        self.directory = Path(directory)
+        self.fingerprint = fingerprint
+        self.total_chunks = total_chunks
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        manifest_path = self.directory / MANIFEST_FILENAME
+        if manifest_path.exists():
+            manifest = load_json_file(manifest_path)
+            if manifest.get("fingerprint") != fingerprint:
+                logger.error(
+                    f"Checkpoint fingerprint mismatch in {self.directory}: "
+                    f"expected {fingerprint}, found {manifest.get('fingerprint')}"
+                )
+                raise ValueError(
+                    f"Checkpoint directory {self.directory} belongs to a "
+                    "different job (input data or chunk_size changed)"
+                )
+        else:
+            self._write_atomic(
+                manifest_path,
+                {"fingerprint": fingerprint, "total_chunks": total_chunks},
+            )
+
+        self._completed = {
+            index for index in range(total_chunks) if self._chunk_path(index).exists()
+        }
+        logger.debug(
+            f"Opened checkpoint {self.directory}: "
+            f"{len(self._completed)}/{total_chunks} chunks completed"
+        )
+
+    @property
+    def completed_indices(self) -> frozenset[int]:
+        """Return indices of chunks that are already completed."""
+        return frozenset(self._completed)
+
+    def is_completed(self, index: int) -> bool:
+        """Return whether the chunk at ``index`` is already completed."""
+        return index in self._completed
+
+    def load_chunk(self, index: int) -> list[ItemDict]:
+        """Load the stored output of a completed chunk.
+
+        Parameters
+        ----------
+        index : int
+            Chunk index
+
+        Returns
+        -------
+        list[ItemDict]
+            Output items recorded for the chunk
+
+        Raises
+        ------
+        KeyError
+            If the chunk has not been completed
+        """
+        if index not in self._completed:
+            raise KeyError(f"Chunk {index} has not been checkpointed")
+
+        payload = load_json_file(self._chunk_path(index))
+        return cast("list[ItemDict]", payload["items"])
+
+    def save_chunk(self, index: int, items: list[ItemDict]) -> None:
+        """Record the output of a completed chunk.
+
+        Parameters
+        ----------
+        index : int
+            Chunk index
+        items : list[ItemDict]
+            Output items of the chunk
+        """
+        payload = cast("JSONObject", {"index": index, "items": items})
+        self._write_atomic(self._chunk_path(index), payload)
+        self._completed.add(index)
+        logger.debug(
+            f"Checkpointed chunk {index} ({len(self._completed)}/"
+            f"{self.total_chunks} completed)"
+        )
+
+    def clear(self) -> None:
+        """Remove all checkpoint files of this job."""
+        for index in range(self.total_chunks):
+            self._chunk_path(index).unlink(missing_ok=True)
+        (self.directory / MANIFEST_FILENAME).unlink(missing_ok=True)
+        self._completed.clear()
+        logger.info(f"Cleared checkpoint directory {self.directory}")
+
+    def _chunk_path(self, index: int) -> Path:
+        return self.directory / CHUNK_FILENAME_TEMPLATE.format(index=index)
+
+    @staticmethod
+    def _write_atomic(path: Path, payload: JSONObject) -> None:
+        # 書き込み途中のクラッシュで壊れたチャンクが残らないようにrenameで確定する
+        tmp_path = path.with_name(f"{path.name}.tmp")
+        save_json_file(payload, tmp_path)
+        tmp_path.replace(path)
@@ -0,0 +1,50 @@
+"""Column-wise decomposition of ItemDict collections."""
+
+from collections.abc import Sequence
+
+from ..types import ItemDict
+
+_ITEM_KEY_COUNT = len(ItemDict.__required_keys__)
+
+
+def extract_item_columns(
+    items: Sequence[ItemDict],
+) -> tuple[list[int], list[str], list[int]] | None:
+    """Split items into id, name and value columns.
+
+    The checks run over whole columns so that the per-item work stays in C.
+    Used by the shared memory transport and by snapshot files, which both
+    store items column-wise.
+
+    Parameters
+    ----------
+    items : Sequence[ItemDict]
+        Items to split
+
+    Returns
+    -------
+    tuple[list[int], list[str], list[int]] | None
+        The ``id``, ``name`` and ``value`` columns, or None if any item has
+        other keys or values of other types
+
+    Examples
+    --------
+    >>> extract_item_columns([{"id": 1, "name": "a", "value": 10}])
+    ([1], ['a'], [10])
+    """
+    if not all(map(_ITEM_KEY_COUNT.__eq__, map(len, items))):
+        return None
+    try:
+        ids = [item["id"] for item in items]
+        names = [item["name"] for item in items]
+        values = [item["value"] for item in items]
+    except KeyError:
+        return None
+
+    if (
+        set(map(type, ids)) <= {int}
+        and set(map(type, values)) <= {int}
+        and set(map(type, names)) <= {str}
+    ):
+        return ids, names, values
+    return None
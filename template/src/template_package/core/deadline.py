@@ -0,0 +1,99 @@
+"""Deadline tracking for time-bounded processing."""
+
+import time
+
+from ..types import ItemDict, ProcessingResult
+
+
+class Deadline:
+    """Point in time after which no new work should be started.
+
+    Deadlines are measured with :func:`time.monotonic`, so they are not
+    affected by system clock changes.
+
+    Examples
+    --------
+    >>> deadline = Deadline(5.0)
+    >>> deadline.expired()
+    False
+    >>> Deadline(None).remaining() is None
+    True
+    """
+
+    def __init__(self, timeout: float | None) -> None:
+        """Start a deadline ``timeout`` seconds from now.
+
+        Parameters
+        ----------
+        timeout : float | None
+            Seconds until the deadline, or None for no deadline
+
+        Raises
+        ------
+        ValueError
+            If timeout is negative
+        """
+        if timeout is not None and timeout < 0:
+            raise ValueError(f"timeout must be non-negative, got {timeout}")
+
+        self.timeout = timeout
+        self.expires_at = None if timeout is None else time.monotonic() + timeout
+
+    def remaining(self) -> float | None:
+        """Return seconds left before the deadline.
+
+        Returns
+        -------
+        float | None
+            Non-negative number of seconds, or None if there is no deadline
+        """
+        if self.expires_at is None:
+            return None
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self) -> bool:
+        """Return whether the deadline has passed."""
+        return self.expires_at is not None and time.monotonic() >= self.expires_at
+
+    def __repr__(self) -> str:
+        """Return string representation."""
+        return f"Deadline(timeout={self.timeout!r}, remaining={self.remaining()!r})"
+
+
+class ProcessingTimeoutError(TimeoutError):
+    """Raised when processing stops at its deadline.
+
+    The work finished before the deadline is not lost: :attr:`result` holds
+    the completed output and :attr:`pending` the input items that were never
+    processed, so callers can persist partial output or retry the remainder.
+
+    Attributes
+    ----------
+    result : ProcessingResult
+        Partial result with status ``"pending"``; ``skipped_count`` is the
+        number of unprocessed input items
+    pending : list[ItemDict]
+        Unprocessed input items in their original order
+    """
+
+    def __init__(
+        self,
+        message: str,
+        *,
+        result: ProcessingResult,
+        pending: list[ItemDict],
+    ) -> None:
+        """Initialize with the partial result.
+
+        Parameters
+        ----------
+        message : str
+            Error message
+        result : ProcessingResult
+            Partial result of the interrupted run
+        pending : list[ItemDict]
+            Unprocessed input items
+        """
+        super().__init__(message)
+        self.result = result
+        self.pending = pending
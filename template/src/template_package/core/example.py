@@ -1,14 +1,27 @@
 """Example module demonstrating best practices."""
 
+from collections.abc import Sequence
 from dataclasses import dataclass
-from typing import Any, Protocol
+from pathlib import Path
+from typing import Any, NoReturn, Protocol
 
-from ..types import ItemDict
+from ..types import ChunkTransport, ItemDict, ProcessingResult
+from ..utils.helpers import chunk_list
 from ..utils.logging_config import get_logger
+from .checkpoint import ChunkCheckpoint, compute_fingerprint
+from .deadline import Deadline, ProcessingTimeoutError
+from .parallel import run_chunks_in_pool
+from .pool import WorkerPoolRegistry, default_registry
 
 # モジュールレベルのロガー
 logger = get_logger(__name__)
 
+# checkpoint_dir指定時にchunk_size未指定の場合のチャンクサイズ
+DEFAULT_CHUNK_SIZE = 1000
+# max_workers指定時にchunk_size未指定の場合のワーカーあたりチャンク数
+# (処理コストに偏りがあっても、空いたワーカーが残りのチャンクを引き取れる)
+CHUNKS_PER_WORKER = 16
+
 
 class DataProcessor(Protocol):
     """Protocol for data processors."""
@@ -109,6 +122,64 @@ class ExampleClass:
         self.data.append(item)
         logger.debug(f"Item added successfully. Total items: {len(self.data)}")
 
+    def add_items(self, items: Sequence[ItemDict], *, validated: bool = False) -> None:
+        """Add several items at once.
+
+        Either all items are added or none are. The max_items limit is
+        checked once for the whole batch, and valid items are neither logged
+        nor validated one by one through :meth:`add_item`.
+
+        Parameters
+        ----------
+        items : Sequence[ItemDict]
+            Items to add
+        validated : bool
+            Whether the items were already checked, e.g. by
+            :func:`~template_package.core.item_loader.load_items_json`.
+            Skips the per-item validation of :meth:`add_item`
+
+        Raises
+        ------
+        ValueError
+            If the items would exceed the max_items limit or validation fails
+        """
+        logger.debug(f"Adding {len(items)} items (validated={validated})")
+
+        if len(self.data) + len(items) > self.config.max_items:
+            logger.warning(
+                f"Cannot add {len(items)} items: max_items limit "
+                f"({self.config.max_items}) would be exceeded. "
+                f"Current items: {len(self.data)}"
+            )
+            raise ValueError(
+                f"Cannot add {len(items)} items: max_items limit "
+                f"({self.config.max_items}) reached"
+            )
+
+        if self.config.enable_validation and not validated:
+            self._validate_items(items)
+
+        self.data.extend(items)
+        logger.debug(f"Items added successfully. Total items: {len(self.data)}")
+
+    def _validate_items(self, items: Sequence[ItemDict]) -> None:
+        """Validate a batch of items with the rules of :meth:`_validate_item`.
+
+        Valid items are checked without logging; the first invalid item is
+        passed to :meth:`_validate_item` to log and raise the error.
+
+        Raises
+        ------
+        ValueError
+            If an item is invalid
+        """
+        required_fields = {"id", "name", "value"}
+        for item in items:
+            # 欠けたフィールドもNoneとして検出される
+            if any(item.get(field) is None for field in required_fields):
+                self._validate_item(item)
+        logger.debug(f"Validated {len(items)} items")
+
     def _validate_item(self, item: ItemDict) -> None:
         """Validate an item before adding.
 
@@ -186,11 +257,17 @@ class ExampleClass:
         )
 
 
-def process_data(
+def process_data(  # noqa: PLR0913
     data: list[ItemDict],
     processor: DataProcessor,
     *,
     validate: bool = True,
+    chunk_size: int | None = None,
+    checkpoint_dir: str | Path | None = None,
+    max_workers: int | None = None,
+    transport: ChunkTransport = "pickle",
+    timeout: float | None = None,
+    reuse_workers: bool = True,
 ) -> list[ItemDict]:
     """Process data using a processor.
 
@@ -202,6 +279,35 @@ def process_data(
         Processor to use
     validate : bool
         Whether to validate data before processing
+    chunk_size : int | None
+        Process the data in chunks of this size instead of a single call.
+        Defaults to ``DEFAULT_CHUNK_SIZE`` when ``checkpoint_dir`` is given,
+        so that an interrupted run can be resumed with a different
+        ``max_workers``. Otherwise defaults to ``CHUNKS_PER_WORKER`` chunks
+        per worker when ``max_workers`` is given, so that workers which
+        finish early pick up the remaining chunks when per-item cost is
+        uneven, and to ``DEFAULT_CHUNK_SIZE`` when only ``timeout`` is given
+    checkpoint_dir : str | Path | None
+        Directory in which completed chunk outputs are recorded. Re-running
+        the same job with the same directory skips chunks that were already
+        completed, so an interrupted run only repeats the chunk in flight
+    max_workers : int | None
+        Process chunks in a pool of this many worker processes. The
+        processor must be picklable
+    transport : ChunkTransport
+        How chunks are sent to worker processes: ``"pickle"`` or
+        ``"shared_memory"`` (columnar shared memory blocks, see
+        :mod:`template_package.core.shared_memory`)
+    timeout : float | None
+        Seconds the call may take, typically ``ConfigDict["timeout"]``.
+        Once the deadline passes no new chunks are started and outstanding
+        chunks are cancelled. A chunk already running in this process cannot
+        be interrupted, so the deadline is checked between chunks
+    reuse_workers : bool
+        Keep the worker processes alive after the call and reuse them for
+        later calls with the same processor type and ``max_workers`` (see
+        :mod:`template_package.core.pool`). Set to False to start and stop
+        a private pool for this call only
 
     Returns
     -------
@@ -211,7 +317,11 @@ def process_data(
     Raises
     ------
     ValueError
-        If validation fails
+        If validation fails, or if ``checkpoint_dir`` holds the checkpoint
+        of a different job
+    ProcessingTimeoutError
+        If the deadline passes before all chunks are processed. The error
+        carries the partial result and the unprocessed items
     """
     logger.debug(f"Processing data with {len(data)} items, validate={validate}")
 
@@ -219,11 +329,138 @@ def process_data(
         logger.error("Data validation failed: empty data provided")
         raise ValueError("Data cannot be empty")
 
-    logger.debug(f"Calling processor: {processor}")
-    result = processor.process(data)
+    # チェックポイントのフィンガープリントはチャンクサイズを含むため、
+    # ワーカー数に依存しない固定値にして再開時の変更を許す
+    if chunk_size is None and checkpoint_dir is not None:
+        chunk_size = DEFAULT_CHUNK_SIZE
+    if chunk_size is None and max_workers is not None:
+        chunk_size = max(1, -(-len(data) // (max_workers * CHUNKS_PER_WORKER)))
+    if chunk_size is None and timeout is not None:
+        chunk_size = DEFAULT_CHUNK_SIZE
+
+    if chunk_size is None:
+        logger.debug(f"Calling processor: {processor}")
+        result = processor.process(data)
+    else:
+        result = _process_in_chunks(
+            data,
+            processor,
+            chunk_size=chunk_size,
+            checkpoint_dir=checkpoint_dir,
+            max_workers=max_workers,
+            transport=transport,
+            deadline=Deadline(timeout),
+            registry=default_registry if reuse_workers else None,
+        )
+
     logger.info(
         f"Data processing completed. Input: {len(data)} items, "
         f"Output: {len(result)} items"
     )
 
     return result
+
+
+def _process_in_chunks(  # noqa: PLR0913
+    data: list[ItemDict],
+    processor: DataProcessor,
+    *,
+    chunk_size: int,
+    checkpoint_dir: str | Path | None,
+    max_workers: int | None,
+    transport: ChunkTransport,
+    deadline: Deadline,
+    registry: WorkerPoolRegistry | None,
+) -> list[ItemDict]:
+    """Run the processor chunk by chunk, optionally resuming from a checkpoint."""
+    chunks = chunk_list(data, chunk_size)
+
+    checkpoint: ChunkCheckpoint | None = None
+    if checkpoint_dir is not None:
+        checkpoint = ChunkCheckpoint(
+            checkpoint_dir,
+            fingerprint=compute_fingerprint(data, chunk_size),
+            total_chunks=len(chunks),
+        )
+        if checkpoint.completed_indices:
+            logger.info(
+                f"Resuming from checkpoint {checkpoint_dir}: "
+                f"{len(checkpoint.completed_indices)}/{len(chunks)} chunks "
+                "already completed"
+            )
+
+    outputs: dict[int, list[ItemDict]] = {}
+    pending: list[int] = []
+    for index in range(len(chunks)):
+        if checkpoint is not None and checkpoint.is_completed(index):
+            outputs[index] = checkpoint.load_chunk(index)
+        else:
+            pending.append(index)
+
+    def record(index: int, output: list[ItemDict]) -> None:
+        if checkpoint is not None:
+            checkpoint.save_chunk(index, output)
+        outputs[index] = output
+
+    unfinished: list[int] = []
+    if max_workers is None:
+        for position, index in enumerate(pending):
+            if deadline.expired():
+                unfinished = pending[position:]
+                break
+            logger.debug(f"Processing chunk {index + 1}/{len(chunks)}")
+            record(index, processor.process(chunks[index]))
+    else:
+        unfinished = run_chunks_in_pool(
+            processor,
+            chunks,
+            pending,
+            max_workers=max_workers,
+            on_complete=record,
+            transport=transport,
+            deadline=deadline,
+            registry=registry,
+        )
+
+    result = [item for index in sorted(outputs) for item in outputs[index]]
+    if unfinished:
+        _raise_timeout(data, chunks, result, unfinished, deadline)
+
+    return result
+
+
+def _raise_timeout(
+    data: list[ItemDict],
+    chunks: list[list[ItemDict]],
+    completed: list[ItemDict],
+    unfinished: list[int],
+    deadline: Deadline,
+) -> NoReturn:
+    """Raise ProcessingTimeoutError describing an interrupted chunked run."""
+    remaining = [item for index in unfinished for item in chunks[index]]
+    message = (
+        f"Processing exceeded timeout of {deadline.timeout} seconds: "
+        f"{len(unfinished)}/{len(chunks)} chunks ({len(remaining)} items) "
+        "were not processed"
+    )
+    logger.error(message)
+
+    partial: ProcessingResult = {
+        "status": "pending",
+        "data": completed,
+        "errors": [
+            {
+                "code": "deadline_exceeded",
+                "message": message,
+                "details": {
+                    "timeout": str(deadline.timeout),
+                    "total_chunks": len(chunks),
+                    "unfinished_chunks": len(unfinished),
+                    "first_unfinished_chunk": unfinished[0],
+                },
+            }
+        ],
+        "processed_count": len(data) - len(remaining),
+        "skipped_count": len(remaining),
+    }
+    raise ProcessingTimeoutError(message, result=partial, pending=remaining)
@@ -0,0 +1,185 @@
+"""Loading ItemDict records from JSON files with schema validation."""
+
+import json
+from collections.abc import Callable, Sequence
+from operator import itemgetter
+from pathlib import Path
+from typing import Any, Final, cast, get_type_hints
+
+from ..types import Compression, ItemDict
+from ..utils.helpers import read_json_text
+from ..utils.logging_config import get_logger
+
+# モジュールレベルのロガー
+logger = get_logger(__name__)
+
+# ItemDictの注釈から作る、必須フィールドとその型(宣言順)
+ITEM_FIELD_TYPES: Final[dict[str, type]] = get_type_hints(ItemDict)
+
+
+def _compile_item_check(field_types: dict[str, type]) -> Callable[[Any], bool]:
+    """Build a predicate that accepts records matching ``field_types`` exactly.
+
+    The fields are fetched with a single :func:`operator.itemgetter` call
+    and their types compared as one tuple, so a valid record costs a few C
+    calls. Types must match exactly: JSON ``true`` decodes to ``bool``,
+    which is not accepted as an ``int`` field. Extra fields are allowed.
+    ``field_types`` needs at least two fields for ``itemgetter`` to return
+    a tuple.
+    """
+    get_fields = itemgetter(*field_types)
+    expected = tuple(field_types.values())
+
+    def is_valid_item(record: Any) -> bool:
+        if type(record) is not dict:
+            return False
+        try:
+            values = get_fields(record)
+        except KeyError:
+            return False
+        return tuple(map(type, values)) == expected
+
+    return is_valid_item
+
+
+_is_valid_item: Final = _compile_item_check(ITEM_FIELD_TYPES)
+
+
+def validate_items(records: Sequence[Any]) -> list[ItemDict]:
+    """Check that every record is a well-formed :class:`ItemDict`.
+
+    Each record must be a dictionary holding every field of ``ItemDict``
+    with a non-null value of the annotated type. Other fields are kept.
+    The result can be passed to ``ExampleClass.add_items(...,
+    validated=True)`` to skip the per-item checks of ``add_item``.
+
+    Parameters
+    ----------
+    records : Sequence[Any]
+        Decoded records, e.g. the elements of a JSON array
+
+    Returns
+    -------
+    list[ItemDict]
+        The records themselves, not copied if given as a list
+
+    Raises
+    ------
+    ValueError
+        If a record is invalid; the message includes its index
+
+    Examples
+    --------
+    >>> validate_items([{"id": 1, "name": "a", "value": 10}])
+    [{'id': 1, 'name': 'a', 'value': 10}]
+    """
+    _check_items(records, "")
+    items = records if isinstance(records, list) else list(records)
+    return cast("list[ItemDict]", items)
+
+
+def load_items_json(
+    filepath: str | Path,
+    *,
+    key: str | None = None,
+    compression: Compression | None = "infer",
+) -> list[ItemDict]:
+    """Load and validate ItemDict records from a JSON file.
+
+    The file is decoded with the C parser and the records are checked by a
+    predicate compiled once from the ``ItemDict`` annotations (see
+    :func:`validate_items`), without logging or building sets per record.
+    Use the result with ``ExampleClass.add_items(items, validated=True)``.
+
+    Parameters
+    ----------
+    filepath : str | Path
+        Path to a JSON file holding an array of items, such as one written
+        by :func:`~template_package.utils.helpers.save_json_array`
+    key : str | None
+        Read the array from this member of a top-level object instead,
+        e.g. ``"items"``
+    compression : Compression | None
+        ``"gzip"``, ``"bz2"`` or ``"lzma"``; ``"infer"`` chooses by the
+        file extension and ``None`` reads the file as plain text
+
+    Returns
+    -------
+    list[ItemDict]
+        Validated items in file order
+
+    Raises
+    ------
+    FileNotFoundError
+        If file doesn't exist
+    ValueError
+        If the file is not valid JSON, does not hold an array where
+        expected, or an item is invalid; the message includes its index
+
+    Examples
+    --------
+    >>> items = load_items_json("items.json")
+    >>> example.add_items(items, validated=True)
+    """
+    path = Path(filepath)
+    logger.debug(f"Loading items from: {path} (key={key!r})")
+
+    text = read_json_text(path, compression=compression)
+    try:
+        document = json.loads(text)
+    except json.JSONDecodeError as e:
+        logger.error(f"Failed to parse JSON from {path}: {e}")
+        raise ValueError(f"Invalid JSON in {path}: {e}") from e
+
+    records = _select_array(document, key, path)
+    _check_items(records, f" in {path}")
+    logger.info(f"Loaded {len(records)} validated items from {path}")
+    return cast("list[ItemDict]", records)
+
+
+def _select_array(document: Any, key: str | None, path: Path) -> list[Any]:
+    """Return the array of records held by a decoded document."""
+    if key is not None:
+        if not isinstance(document, dict):
+            type_name = type(document).__name__
+            logger.error(f"Expected JSON object in {path}, got {type_name}")
+            raise ValueError(f"Expected JSON object in {path}, got {type_name}")
+        if key not in document:
+            logger.error(f"Missing key {key!r} in {path}")
+            raise ValueError(f"Missing key {key!r} in {path}")
+        document = document[key]
+
+    if not isinstance(document, list):
+        type_name = type(document).__name__
+        logger.error(f"Expected JSON array of items in {path}, got {type_name}")
+        raise ValueError(f"Expected JSON array of items in {path}, got {type_name}")
+    return document
+
+
+def _check_items(records: Sequence[Any], location: str) -> None:
+    """Raise ValueError for the first invalid record."""
+    if all(map(_is_valid_item, records)):
+        return
+    # 不正なレコードがある場合だけ、先頭から原因を調べ直す
+    for index, record in enumerate(records):
+        if not _is_valid_item(record):
+            reason = _describe_invalid_item(record)
+            logger.error(f"Invalid item at index {index}{location}: {reason}")
+            raise ValueError(f"Invalid item at index {index}{location}: {reason}")
+
+
+def _describe_invalid_item(record: Any) -> str:
+    """Explain why a record is not a valid ItemDict."""
+    if not isinstance(record, dict):
+        return f"expected object, got {type(record).__name__}"
+
+    missing_fields = set(ITEM_FIELD_TYPES) - record.keys()
+    if missing_fields:
+        return f"Missing required fields: {missing_fields}"
+    if any(record[field] is None for field in ITEM_FIELD_TYPES):
+        return "Required fields cannot be None"
+    for field, expected in ITEM_FIELD_TYPES.items():
+        actual = type(record[field])
+        if actual is not expected:
+            return f"Field {field!r} must be {expected.__name__}, got {actual.__name__}"
+    return f"expected dict, got {type(record).__name__}"
@@ -0,0 +1,261 @@
+"""Process-pool execution of chunked processing jobs."""
+
+from collections.abc import Callable, Sequence
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    BrokenExecutor,
+    Future,
+    ProcessPoolExecutor,
+    wait,
+)
+from contextlib import AbstractContextManager, nullcontext
+from typing import TYPE_CHECKING
+
+from ..types import ChunkTransport, ItemDict
+from ..utils.logging_config import get_logger
+from ..utils.multiprocessing_config import default_mp_context
+from .deadline import Deadline
+from .pool import WorkerPoolRegistry, terminate_workers
+from .shared_memory import SharedChunkHandle, SharedItemChunk
+
+if TYPE_CHECKING:
+    from .example import DataProcessor
+
+# モジュールレベルのロガー
+logger = get_logger(__name__)
+
+# ワーカー1つあたりに先行投入するチャンク数
+PREFETCH_PER_WORKER = 2
+
+type _ChunkOutput = list[ItemDict] | SharedChunkHandle
+
+
+def run_chunks_in_pool(  # noqa: PLR0913
+    processor: "DataProcessor",
+    chunks: Sequence[list[ItemDict]],
+    indices: Sequence[int],
+    *,
+    max_workers: int,
+    on_complete: Callable[[int, list[ItemDict]], None],
+    transport: ChunkTransport = "pickle",
+    deadline: Deadline | None = None,
+    registry: WorkerPoolRegistry | None = None,
+) -> list[int]:
+    """Process chunks in a process pool.
+
+    At most ``max_workers * PREFETCH_PER_WORKER`` chunks are in flight at
+    once, so shared memory blocks and pickled payloads are only created for
+    chunks that are about to run. Each worker process takes the next queued
+    chunk as soon as it is free, so uneven per-chunk cost is balanced
+    dynamically as long as there are several chunks per worker.
+
+    Parameters
+    ----------
+    processor : DataProcessor
+        Picklable processor applied to each chunk in a worker process
+    chunks : Sequence[list[ItemDict]]
+        All chunks of the job
+    indices : Sequence[int]
+        Indices of the chunks to process, in dispatch order
+    max_workers : int
+        Number of worker processes
+    on_complete : Callable[[int, list[ItemDict]], None]
+        Called in the parent process with the index and output of each chunk
+        as soon as it completes; completion order is not dispatch order
+    transport : ChunkTransport
+        ``"pickle"`` sends chunks as pickled lists. ``"shared_memory"``
+        encodes them into columnar shared memory blocks and only pickles a
+        handle; chunks that do not fit the ``ItemDict`` layout fall back to
+        pickling
+    deadline : Deadline | None
+        When the deadline passes, no further chunks are dispatched, queued
+        chunks are cancelled and workers still running a chunk are stopped
+    registry : WorkerPoolRegistry | None
+        Borrow a long-lived pool keyed by the processor's type from this
+        registry instead of starting and stopping a private pool. A borrowed
+        pool that hit the deadline or broke is retired from the registry
+        rather than terminated, so concurrent calls sharing it can finish
+
+    Returns
+    -------
+    list[int]
+        Sorted indices of chunks that did not complete before the deadline;
+        empty when every chunk completed
+
+    Raises
+    ------
+    ValueError
+        If max_workers is not positive
+    """
+    if max_workers <= 0:
+        logger.error(f"Invalid max_workers: {max_workers}")
+        raise ValueError(f"max_workers must be positive, got {max_workers}")
+
+    logger.debug(
+        f"Dispatching {len(indices)} chunks to {max_workers} workers "
+        f"(transport={transport!r}, deadline={deadline!r})"
+    )
+
+    pending = list(reversed(indices))
+    in_flight: dict[Future[_ChunkOutput], tuple[int, SharedItemChunk | None]] = {}
+    max_in_flight = max_workers * PREFETCH_PER_WORKER
+    expired = False
+
+    broken = False
+
+    with _lease_pool(processor, max_workers, registry) as executor:
+        try:
+            while pending or in_flight:
+                if deadline is not None and deadline.expired():
+                    expired = True
+                    break
+
+                while pending and len(in_flight) < max_in_flight:
+                    index = pending.pop()
+                    future, block = _submit(
+                        executor, processor, chunks[index], transport
+                    )
+                    in_flight[future] = (index, block)
+
+                done, _ = wait(
+                    in_flight,
+                    timeout=None if deadline is None else deadline.remaining(),
+                    return_when=FIRST_COMPLETED,
+                )
+                for future in done:
+                    index, block = in_flight.pop(future)
+                    _release(block)
+                    on_complete(index, _receive(future.result()))
+        except BrokenExecutor:
+            broken = True
+            raise
+        finally:
+            unfinished = sorted([*pending, *(index for index, _ in in_flight.values())])
+            for future, (_, block) in in_flight.items():
+                if not future.cancel():
+                    # 実行中・完了済みのチャンクの出力は誰も受け取らないので、
+                    # 共有メモリで返された場合は完了時に破棄する
+                    future.add_done_callback(_discard_output)
+                _release(block)
+            if expired:
+                logger.warning(
+                    f"Deadline exceeded: cancelling {len(unfinished)} unfinished chunks"
+                )
+            _close_pool(executor, registry, abandon=expired or broken)
+
+    return unfinished
+
+
+def _lease_pool(
+    processor: "DataProcessor",
+    max_workers: int,
+    registry: WorkerPoolRegistry | None,
+) -> AbstractContextManager[ProcessPoolExecutor]:
+    """Borrow a pool from ``registry``, or start a private one."""
+    if registry is None:
+        return nullcontext(
+            ProcessPoolExecutor(
+                max_workers=max_workers, mp_context=default_mp_context()
+            )
+        )
+    return registry.lease(type(processor), max_workers)
+
+
+def _close_pool(
+    executor: ProcessPoolExecutor,
+    registry: WorkerPoolRegistry | None,
+    *,
+    abandon: bool,
+) -> None:
+    """Shut down a private pool, or retire a borrowed one that is unusable.
+
+    ``abandon`` means workers may still be running chunks nobody waits for.
+    """
+    if registry is not None:
+        if abandon:
+            registry.retire(executor)
+        return
+
+    if abandon:
+        terminate_workers(executor)
+    executor.shutdown(wait=not abandon, cancel_futures=True)
+
+
+def _submit(
+    executor: ProcessPoolExecutor,
+    processor: "DataProcessor",
+    chunk: list[ItemDict],
+    transport: ChunkTransport,
+) -> tuple[Future[_ChunkOutput], SharedItemChunk | None]:
+    """Submit one chunk using the requested transport."""
+    if transport == "shared_memory":
+        try:
+            block = SharedItemChunk.create(chunk)
+        except ValueError:
+            logger.debug("Chunk does not fit the columnar layout, pickling instead")
+        else:
+            future = executor.submit(_process_shared_chunk, processor, block.handle)
+            return future, block
+
+    return executor.submit(_process_chunk, processor, chunk), None
+
+
+def _release(block: SharedItemChunk | None) -> None:
+    """Destroy an input block once its chunk no longer needs it."""
+    if block is not None:
+        block.close()
+        block.unlink()
+
+
+def _receive(output: _ChunkOutput) -> list[ItemDict]:
+    """Turn a worker result into items, releasing shared memory if used."""
+    if not isinstance(output, SharedChunkHandle):
+        return output
+
+    block = SharedItemChunk.attach(output)
+    try:
+        return block.to_items()
+    finally:
+        block.close()
+        block.unlink()
+
+
+def _discard_output(future: Future[_ChunkOutput]) -> None:
+    """Unlink the shared memory output of a chunk whose result is abandoned."""
+    if future.cancelled() or future.exception() is not None:
+        return
+    output = future.result()
+    if isinstance(output, SharedChunkHandle):
+        block = SharedItemChunk.attach(output)
+        block.close()
+        block.unlink()
+
+
+def _process_chunk(processor: "DataProcessor", chunk: list[ItemDict]) -> _ChunkOutput:
+    """Worker entry point for pickled chunks."""
+    return processor.process(chunk)
+
+
+def _process_shared_chunk(
+    processor: "DataProcessor",
+    handle: SharedChunkHandle,
+) -> _ChunkOutput:
+    """Worker entry point for shared memory chunks.
+
+    The output is written back through shared memory as well when it fits
+    the columnar layout; ownership of that block passes to the parent.
+    """
+    block = SharedItemChunk.attach(handle)
+    try:
+        chunk = block.to_items()
+    finally:
+        block.close()
+
+    output = processor.process(chunk)
+    try:
+        result = SharedItemChunk.create(output)
+    except ValueError:
+        return output
+
+    result.close()
+    return result.handle
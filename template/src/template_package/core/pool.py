@@ -0,0 +1,274 @@
+"""Registry of long-lived worker process pools."""
+
+import atexit
+import threading
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor, wait
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from multiprocessing.context import BaseContext
+
+from ..types import WarmupHook
+from ..utils.logging_config import get_logger
+from ..utils.multiprocessing_config import default_mp_context
+
+# モジュールレベルのロガー
+logger = get_logger(__name__)
+
+
+@dataclass
+class _PoolEntry:
+    """A pool together with its bookkeeping."""
+
+    executor: ProcessPoolExecutor
+    leases: int = 0
+    retired: bool = False
+    key: tuple[type, int] = field(default=(object, 0))
+
+
+class WorkerPoolRegistry:
+    """Lazily started process pools reused across calls.
+
+    Starting a process pool costs hundreds of milliseconds per call once
+    worker start-up and module imports are included. The registry keeps one
+    pool per ``(processor type, max_workers)`` and hands it out to every
+    call that processes data with that processor type, so later calls run
+    on warm workers.
+
+    Warm-up hooks registered for a processor type run once in every worker
+    of that type's pools when the worker starts, which is the place to
+    import heavy modules or load models. Hooks must be picklable, i.e.
+    module-level functions.
+
+    A pool is used through :meth:`lease`. A pool can be retired, for example
+    after a deadline abandoned chunks on it; it is then no longer handed
+    out, and its workers are stopped once the last lease is released.
+
+    Workers are started with
+    :func:`~template_package.utils.multiprocessing_config.default_mp_context`
+    (``"forkserver"`` where available, otherwise ``"spawn"``) rather than
+    the platform default. Pools live as long as the service and start workers lazily,
+    and forking the parent then, while the executor's threads are running,
+    may deadlock. Processors and hooks must therefore be importable from
+    a module.
+
+    Examples
+    --------
+    >>> registry = WorkerPoolRegistry()
+    >>> with registry.lease(MyProcessor, max_workers=4) as pool:
+    ...     future = pool.submit(pow, 2, 10)
+    >>> registry.shutdown()
+    """
+
+    def __init__(self, *, mp_context: BaseContext | None = None) -> None:
+        """Initialize an empty registry.
+
+        Parameters
+        ----------
+        mp_context : BaseContext | None
+            Multiprocessing context used to start workers, defaults to
+            :func:`default_mp_context`
+        """
+        self.mp_context = mp_context if mp_context is not None else default_mp_context()
+        self._lock = threading.Lock()
+        self._entries: dict[tuple[type, int], _PoolEntry] = {}
+        self._by_executor: dict[int, _PoolEntry] = {}
+        self._warmups: dict[type, list[WarmupHook]] = {}
+
+    def register_warmup(self, processor_type: type, hook: WarmupHook) -> None:
+        """Register a hook run in each new worker for ``processor_type``.
+
+        Only pools started after registration run the hook.
+
+        Parameters
+        ----------
+        processor_type : type
+            Processor class the hook belongs to
+        hook : WarmupHook
+            Picklable callable without arguments
+        """
+        with self._lock:
+            self._warmups.setdefault(processor_type, []).append(hook)
+        logger.debug(f"Registered warm-up hook {hook!r} for {processor_type!r}")
+
+    @contextmanager
+    def lease(
+        self,
+        processor_type: type,
+        max_workers: int,
+    ) -> Iterator[ProcessPoolExecutor]:
+        """Borrow the pool for ``processor_type``, starting it if needed.
+
+        Parameters
+        ----------
+        processor_type : type
+            Processor class the pool is keyed by
+        max_workers : int
+            Number of worker processes
+
+        Yields
+        ------
+        ProcessPoolExecutor
+            Shared pool; do not shut it down directly
+        """
+        entry = self._acquire(processor_type, max_workers)
+        try:
+            yield entry.executor
+        finally:
+            self._release(entry)
+
+    def warm_up(self, processor_type: type, max_workers: int) -> None:
+        """Start the pool and all of its workers ahead of the first call.
+
+        Parameters
+        ----------
+        processor_type : type
+            Processor class the pool is keyed by
+        max_workers : int
+            Number of worker processes
+        """
+        with self.lease(processor_type, max_workers) as executor:
+            # 全ワーカーを起動させるため、ワーカー数分の空タスクを投入する
+            wait([executor.submit(_noop) for _ in range(max_workers)])
+        logger.info(f"Warmed up {max_workers} workers for {processor_type!r}")
+
+    def retire(self, executor: ProcessPoolExecutor) -> None:
+        """Stop handing out ``executor``; stop its workers when unused.
+
+        Parameters
+        ----------
+        executor : ProcessPoolExecutor
+            Pool previously obtained from :meth:`lease`
+        """
+        with self._lock:
+            entry = self._by_executor.get(id(executor))
+            if entry is None or entry.retired:
+                return
+            entry.retired = True
+            self._entries.pop(entry.key, None)
+            idle = entry.leases == 0
+        logger.info(f"Retired worker pool for {entry.key[0]!r}")
+        if idle:
+            self._stop(entry)
+
+    def shutdown(self, *, wait: bool = True) -> None:
+        """Shut down every pool.
+
+        Idle pools are shut down immediately, waiting for their workers to
+        exit if ``wait`` is True; pools still leased are retired and stop
+        when their last lease is released.
+
+        Parameters
+        ----------
+        wait : bool
+            Whether to wait for idle pools' workers to exit
+        """
+        with self._lock:
+            entries = list(self._entries.values())
+            self._entries.clear()
+            for entry in entries:
+                entry.retired = True
+            idle = [entry for entry in entries if entry.leases == 0]
+            for entry in idle:
+                self._by_executor.pop(id(entry.executor), None)
+
+        for entry in idle:
+            entry.executor.shutdown(wait=wait)
+        if entries:
+            logger.info(f"Shut down {len(idle)}/{len(entries)} worker pools")
+
+    def __len__(self) -> int:
+        """Return the number of live pools."""
+        return len(self._entries)
+
+    def _acquire(self, processor_type: type, max_workers: int) -> _PoolEntry:
+        if max_workers <= 0:
+            logger.error(f"Invalid max_workers: {max_workers}")
+            raise ValueError(f"max_workers must be positive, got {max_workers}")
+
+        key = (processor_type, max_workers)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                hooks = tuple(self._warmups.get(processor_type, ()))
+                executor = ProcessPoolExecutor(
+                    max_workers=max_workers,
+                    mp_context=self.mp_context,
+                    initializer=_run_warmups,
+                    initargs=(hooks,),
+                )
+                entry = _PoolEntry(executor=executor, key=key)
+                self._entries[key] = entry
+                self._by_executor[id(executor)] = entry
+                logger.info(
+                    f"Started worker pool for {processor_type!r} "
+                    f"with {max_workers} workers"
+                )
+            entry.leases += 1
+            return entry
+
+    def _release(self, entry: _PoolEntry) -> None:
+        with self._lock:
+            entry.leases -= 1
+            stop = entry.retired and entry.leases == 0
+        if stop:
+            self._stop(entry)
+
+    def _stop(self, entry: _PoolEntry) -> None:
+        """Terminate a retired pool that nobody is waiting on any more."""
+        with self._lock:
+            self._by_executor.pop(id(entry.executor), None)
+        terminate_workers(entry.executor)
+        entry.executor.shutdown(wait=False, cancel_futures=True)
+
+
+def terminate_workers(executor: ProcessPoolExecutor) -> None:
+    """Stop worker processes that may still be running abandoned tasks.
+
+    A running task cannot be cancelled through its future, and a hung
+    processor would otherwise keep its worker busy forever.
+
+    Parameters
+    ----------
+    executor : ProcessPoolExecutor
+        Pool whose workers should be stopped
+    """
+    terminate = getattr(executor, "terminate_workers", None)
+    if terminate is not None:
+        # Python 3.14以降は公開APIで停止できる
+        terminate()
+        return
+
+    for process in list((executor._processes or {}).values()):
+        process.terminate()
+
+
+def _run_warmups(hooks: tuple[WarmupHook, ...]) -> None:
+    """Worker initializer running the registered warm-up hooks."""
+    for hook in hooks:
+        hook()
+
+
+def _noop() -> None:
+    """Task used to force worker start-up."""
+
+
+# デフォルトのレジストリ(プロセス終了時に自動でシャットダウン)
+default_registry = WorkerPoolRegistry()
+atexit.register(default_registry.shutdown)
+
+
+def register_warmup(processor_type: type, hook: WarmupHook) -> None:
+    """Register a warm-up hook on the default registry.
+
+    See :meth:`WorkerPoolRegistry.register_warmup`.
+    """
+    default_registry.register_warmup(processor_type, hook)
+
+
+def shutdown_worker_pools(*, wait: bool = True) -> None:
+    """Shut down every pool of the default registry.
+
+    See :meth:`WorkerPoolRegistry.shutdown`.
+    """
+    default_registry.shutdown(wait=wait)
@@ -0,0 +1,284 @@
+"""Columnar shared-memory transport for ItemDict chunks.
+
+Sending ``list[ItemDict]`` to a process pool pickles every dictionary in the
+parent and unpickles it again in the worker. This module instead encodes a
+chunk into a single :class:`multiprocessing.shared_memory.SharedMemory` block
+with one column per field, and only a small :class:`SharedChunkHandle` is
+pickled. Workers attach to the block and read the columns in place.
+
+Block layout (all integers are native-endian int64)::
+
+    [ids: count][values: count][name offsets: count + 1][names: UTF-8 bytes]
+
+The name column is decoded with a single ``bytes.decode`` call. When no name
+contains a NUL character the names are stored NUL-delimited and the offsets
+column is omitted, so decoding is one ``str.split``; otherwise name offsets
+are character offsets into the decoded text.
+"""
+
+from array import array
+from collections.abc import Sequence
+from dataclasses import dataclass, replace
+from itertools import accumulate
+from multiprocessing.shared_memory import SharedMemory
+from types import TracebackType
+from typing import Final, Self
+
+from ..types import ItemDict
+from ..utils.logging_config import get_logger
+from .columns import extract_item_columns
+
+# モジュールレベルのロガー
+logger = get_logger(__name__)
+
+_INT_FORMAT: Final = "q"
+_INT_SIZE = array(_INT_FORMAT).itemsize
+_NAME_DELIMITER = "\x00"
+
+
+@dataclass(frozen=True)
+class SharedChunkHandle:
+    """Picklable reference to a chunk stored in shared memory.
+
+    Attributes
+    ----------
+    name : str
+        Name of the shared memory block
+    count : int
+        Number of items in the chunk
+    names_size : int
+        Size in bytes of the UTF-8 encoded name column
+    delimited : bool
+        Whether names are NUL-delimited instead of described by offsets
+    """
+
+    name: str
+    count: int
+    names_size: int
+    delimited: bool
+
+    @property
+    def names_start(self) -> int:
+        """Return the byte offset of the name column."""
+        offset_count = 0 if self.delimited else self.count + 1
+        return _INT_SIZE * (2 * self.count + offset_count)
+
+    @property
+    def nbytes(self) -> int:
+        """Return the number of bytes used by the chunk."""
+        return self.names_start + self.names_size
+
+
+def is_columnar_compatible(items: Sequence[ItemDict]) -> bool:
+    """Check whether items can be encoded without losing information.
+
+    Parameters
+    ----------
+    items : Sequence[ItemDict]
+        Items to check
+
+    Returns
+    -------
+    bool
+        True if every item has exactly the ``ItemDict`` keys with ``int``
+        ids and values and ``str`` names
+    """
+    return extract_item_columns(items) is not None
+
+
+class SharedItemChunk:
+    """ItemDict chunk encoded column-wise in a shared memory block.
+
+    The creating process owns the block and is responsible for calling
+    :meth:`unlink` once every reader is done. Readers created with
+    :meth:`attach` only :meth:`close` their mapping. Views returned by
+    :attr:`ids` and :attr:`values` must be released before closing.
+
+    Examples
+    --------
+    >>> items = [{"id": 1, "name": "a", "value": 10}]
+    >>> with SharedItemChunk.create(items) as chunk:
+    ...     reader = SharedItemChunk.attach(chunk.handle)
+    ...     reader.to_items() == items
+    ...     reader.close()
+    True
+    """
+
+    def __init__(
+        self,
+        shm: SharedMemory,
+        handle: SharedChunkHandle,
+        *,
+        owner: bool,
+    ) -> None:
+        """Wrap an existing shared memory block.
+
+        Use :meth:`create` or :meth:`attach` instead of calling this directly.
+
+        Parameters
+        ----------
+        shm : SharedMemory
+            Mapped shared memory block
+        handle : SharedChunkHandle
+            Description of the chunk layout
+        owner : bool
+            Whether this instance unlinks the block on exit
+        """
+        self._shm = shm
+        self.handle = handle
+        self.owner = owner
+
+    @classmethod
+    def create(cls, items: Sequence[ItemDict]) -> Self:
+        """Encode items into a new shared memory block.
+
+        Parameters
+        ----------
+        items : Sequence[ItemDict]
+            Items with exactly the ``id``, ``name`` and ``value`` fields
+
+        Returns
+        -------
+        SharedItemChunk
+            Owning chunk
+
+        Raises
+        ------
+        ValueError
+            If the items cannot be represented in the columnar layout
+        """
+        columns = extract_item_columns(items)
+        if columns is None:
+            raise ValueError(
+                "Items must contain exactly int 'id', str 'name' and int 'value'"
+            )
+
+        id_column, names, value_column = columns
+        text = _NAME_DELIMITER.join(names)
+        delimited = text.count(_NAME_DELIMITER) == max(0, len(names) - 1)
+        if not delimited:
+            text = "".join(names)
+        encoded_names = text.encode("utf-8")
+        try:
+            ids = array(_INT_FORMAT, id_column)
+            values = array(_INT_FORMAT, value_column)
+        except OverflowError as e:
+            raise ValueError(f"Item id or value does not fit in int64: {e}") from e
+        columns_out = [ids, values]
+        if not delimited:
+            columns_out.append(
+                array(_INT_FORMAT, accumulate(map(len, names), initial=0))
+            )
+
+        handle = SharedChunkHandle(
+            name="",
+            count=len(items),
+            names_size=len(encoded_names),
+            delimited=delimited,
+        )
+        # SharedMemoryはサイズ0で作成できないため最低1バイト確保する
+        shm = SharedMemory(create=True, size=max(1, handle.nbytes))
+        handle = replace(handle, name=shm.name)
+
+        buffer = cls._require_buffer(shm)
+        position = 0
+        for column in columns_out:
+            raw = memoryview(column).cast("B")
+            buffer[position : position + len(raw)] = raw
+            position += len(raw)
+        buffer[position : position + len(encoded_names)] = encoded_names
+
+        logger.debug(
+            f"Encoded {handle.count} items into shared memory {shm.name} "
+            f"({handle.nbytes} bytes)"
+        )
+        return cls(shm, handle, owner=True)
+
+    @classmethod
+    def attach(cls, handle: SharedChunkHandle) -> Self:
+        """Attach to a chunk created by another process.
+
+        Parameters
+        ----------
+        handle : SharedChunkHandle
+            Handle returned by the creating process
+
+        Returns
+        -------
+        SharedItemChunk
+            Non-owning chunk
+        """
+        return cls(SharedMemory(name=handle.name), handle, owner=False)
+
+    @property
+    def ids(self) -> memoryview:
+        """Return the ``id`` column as an int64 view over the block."""
+        return self._column(0)
+
+    @property
+    def values(self) -> memoryview:
+        """Return the ``value`` column as an int64 view over the block."""
+        return self._column(1)
+
+    def names(self) -> list[str]:
+        """Decode the ``name`` column."""
+        count = self.handle.count
+        start = self.handle.names_start
+        buffer = self._require_buffer(self._shm)
+        text = bytes(buffer[start : start + self.handle.names_size]).decode("utf-8")
+        if count == 0:
+            return []
+        if self.handle.delimited:
+            return text.split(_NAME_DELIMITER)
+
+        offsets = self._column(2, length=count + 1).tolist()
+        return [text[offsets[i] : offsets[i + 1]] for i in range(count)]
+
+    def to_items(self) -> list[ItemDict]:
+        """Materialize the chunk as a list of items."""
+        return [
+            {"id": item_id, "name": name, "value": value}
+            for item_id, name, value in zip(
+                self.ids.tolist(), self.names(), self.values.tolist(), strict=True
+            )
+        ]
+
+    def __len__(self) -> int:
+        """Return the number of items."""
+        return self.handle.count
+
+    def close(self) -> None:
+        """Release this process's mapping of the block."""
+        self._shm.close()
+
+    def unlink(self) -> None:
+        """Destroy the block. Only the owner should call this."""
+        self._shm.unlink()
+
+    def __enter__(self) -> Self:
+        """Enter context manager."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the mapping and unlink the block if owned."""
+        self.close()
+        if self.owner:
+            self.unlink()
+
+    def _column(self, index: int, *, length: int | None = None) -> memoryview:
+        count = self.handle.count
+        start = _INT_SIZE * count * index
+        end = start + _INT_SIZE * (count if length is None else length)
+        return self._require_buffer(self._shm)[start:end].cast(_INT_FORMAT)
+
+    @staticmethod
+    def _require_buffer(shm: SharedMemory) -> memoryview:
+        buffer = shm.buf
+        if buffer is None:
+            raise ValueError(f"Shared memory block {shm.name} is closed")
+        return buffer
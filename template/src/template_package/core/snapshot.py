@@ -0,0 +1,329 @@
+"""Binary snapshot files for ItemDict collections.
+
+A snapshot stores ``list[ItemDict]`` column-wise, so loading it needs no
+text parsing or number conversion. All integers are little-endian::
+
+    header  32 bytes: magic b"ITEMSNAP", version u16, flags u16,
+            reserved u32, item count u64, string table size u64
+    ids     int64[count]
+    values  int64[count]
+    offsets int64[count + 1]   byte offsets of each name in the string table
+    names   UTF-8 string table, every name followed by a NUL byte
+
+Name ``i`` spans bytes ``offsets[i]`` to ``offsets[i + 1] - 1``.
+
+Every column starts at a multiple of 8 bytes, so it can be read in place
+from a memory map, e.g. with ``numpy.frombuffer(snapshot.ids, "<i8")``.
+"""
+
+import mmap
+import struct
+import sys
+from array import array
+from collections.abc import Sequence
+from itertools import accumulate
+from pathlib import Path
+from types import TracebackType
+from typing import Final, NoReturn, Self
+
+from ..types import ItemDict
+from ..utils.logging_config import get_logger
+from .columns import extract_item_columns
+
+# モジュールレベルのロガー
+logger = get_logger(__name__)
+
+SNAPSHOT_MAGIC: Final = b"ITEMSNAP"
+SNAPSHOT_VERSION: Final = 1
+
+# マジック、バージョン、フラグ、予約領域、件数、文字列テーブルのサイズ
+_HEADER: Final = struct.Struct("<8sHHIQQ")
+
+# フラグ: 名前にNUL文字が含まれない(終端文字で分割するだけで復元できる)
+_FLAG_SPLITTABLE: Final = 1
+
+_NAME_TERMINATOR: Final = "\x00"
+
+_INT_FORMAT: Final = "q"
+_INT_SIZE = array(_INT_FORMAT).itemsize
+_LITTLE_ENDIAN = sys.byteorder == "little"
+
+
+def save_item_snapshot(items: Sequence[ItemDict], filepath: str | Path) -> int:
+    """Write items to a binary snapshot file.
+
+    Parameters
+    ----------
+    items : Sequence[ItemDict]
+        Items with exactly the ``id``, ``name`` and ``value`` fields
+    filepath : str | Path
+        Path to save to
+
+    Returns
+    -------
+    int
+        Size of the written file in bytes
+
+    Raises
+    ------
+    ValueError
+        If the items have other fields or types, or an id or value does not
+        fit in int64
+
+    Examples
+    --------
+    >>> size = save_item_snapshot(items, "items.snap")
+    >>> load_item_snapshot("items.snap") == items
+    True
+    """
+    path = Path(filepath)
+    logger.debug(f"Saving {len(items)} items as snapshot to: {path}")
+
+    columns = extract_item_columns(items)
+    if columns is None:
+        logger.error(f"Items cannot be stored in a snapshot: {path}")
+        raise ValueError(
+            "Items must contain exactly int 'id', str 'name' and int 'value'"
+        )
+    id_column, names, value_column = columns
+
+    text = _NAME_TERMINATOR.join(names) + _NAME_TERMINATOR if names else ""
+    encoded_names = text.encode("utf-8")
+    splittable = text.count(_NAME_TERMINATOR) == len(names)
+    try:
+        ids = array(_INT_FORMAT, id_column)
+        values = array(_INT_FORMAT, value_column)
+    except OverflowError as e:
+        raise ValueError(f"Item id or value does not fit in int64: {e}") from e
+    # ASCIIなら文字数とバイト数が等しいので、エンコードせずに長さがわかる
+    if len(encoded_names) == len(text):
+        lengths = [len(name) + 1 for name in names]
+    else:
+        lengths = [len(name.encode("utf-8")) + 1 for name in names]
+    offsets = array(_INT_FORMAT, accumulate(lengths, initial=0))
+
+    header = _HEADER.pack(
+        SNAPSHOT_MAGIC,
+        SNAPSHOT_VERSION,
+        _FLAG_SPLITTABLE if splittable else 0,
+        0,
+        len(items),
+        len(encoded_names),
+    )
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("wb") as f:
+        f.write(header)
+        for column in (ids, values, offsets):
+            if not _LITTLE_ENDIAN:
+                column.byteswap()
+            f.write(column)
+        f.write(encoded_names)
+        size = f.tell()
+
+    logger.info(f"Saved {len(items)} items as snapshot to {path} ({size} bytes)")
+    return size
+
+
+def load_item_snapshot(filepath: str | Path) -> list[ItemDict]:
+    """Read all items from a binary snapshot file.
+
+    Parameters
+    ----------
+    filepath : str | Path
+        Path to a file written by :func:`save_item_snapshot`
+
+    Returns
+    -------
+    list[ItemDict]
+        Items in the order they were saved
+
+    Raises
+    ------
+    FileNotFoundError
+        If file doesn't exist
+    ValueError
+        If the file is not a valid snapshot
+    """
+    with ItemSnapshot.open(filepath) as snapshot:
+        items = snapshot.to_items()
+    logger.info(f"Loaded {len(items)} items from snapshot {filepath}")
+    return items
+
+
+class ItemSnapshot:
+    """Memory-mapped, read-only view of a snapshot file.
+
+    The ``id`` and ``value`` columns are exposed as int64 views over the
+    mapping without copying; names are decoded on request. The views hold
+    the file's little-endian bytes, so read them as ``"<i8"`` with NumPy on
+    big-endian hosts. Views returned by :attr:`ids`, :attr:`values` and
+    :attr:`name_offsets` must be released before closing.
+
+    Examples
+    --------
+    >>> with ItemSnapshot.open("items.snap") as snapshot:
+    ...     ids = numpy.frombuffer(snapshot.ids, dtype="<i8")
+    ...     total = int(ids.sum())
+    ...     del ids
+    """
+
+    def __init__(self, mapping: mmap.mmap, path: Path) -> None:
+        """Wrap a mapped snapshot file.
+
+        Use :meth:`open` instead of calling this directly.
+
+        Parameters
+        ----------
+        mapping : mmap.mmap
+            Read-only mapping of the whole file
+        path : Path
+            Path of the file, used in messages
+
+        Raises
+        ------
+        ValueError
+            If the mapping is not a valid snapshot
+        """
+        self.path = path
+        self._mmap = mapping
+        self.count, self.names_size, self._splittable = self._read_header()
+
+    @classmethod
+    def open(cls, filepath: str | Path) -> Self:
+        """Map a snapshot file.
+
+        Parameters
+        ----------
+        filepath : str | Path
+            Path to a file written by :func:`save_item_snapshot`
+
+        Returns
+        -------
+        ItemSnapshot
+            Open snapshot; close it or use it as a context manager
+
+        Raises
+        ------
+        FileNotFoundError
+            If file doesn't exist
+        ValueError
+            If the file is not a valid snapshot
+        """
+        path = Path(filepath)
+        logger.debug(f"Opening snapshot: {path}")
+        if not path.exists():
+            logger.error(f"File not found: {path}")
+            raise FileNotFoundError(f"File not found: {path}")
+
+        with path.open("rb") as f:
+            if path.stat().st_size < _HEADER.size:
+                logger.error(f"Snapshot too short: {path}")
+                raise ValueError(f"Invalid snapshot {path}: file too short")
+            mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            return cls(mapping, path)
+        except ValueError:
+            mapping.close()
+            raise
+
+    @property
+    def ids(self) -> memoryview:
+        """Return the ``id`` column as an int64 view over the file."""
+        return self._column(0, self.count)
+
+    @property
+    def values(self) -> memoryview:
+        """Return the ``value`` column as an int64 view over the file."""
+        return self._column(1, self.count)
+
+    @property
+    def name_offsets(self) -> memoryview:
+        """Return the ``count + 1`` byte offsets of names in the string table."""
+        return self._column(2, self.count + 1)
+
+    def names(self) -> list[str]:
+        """Decode the ``name`` column."""
+        start = self._names_start
+        raw = self._mmap[start : start + self.names_size]
+        if self.count == 0:
+            return []
+        if self._splittable:
+            return raw.decode("utf-8").split(_NAME_TERMINATOR)[:-1]
+
+        offsets = self._int_list(self.name_offsets)
+        return [
+            raw[offsets[i] : offsets[i + 1] - 1].decode("utf-8")
+            for i in range(self.count)
+        ]
+
+    def to_items(self) -> list[ItemDict]:
+        """Materialize the snapshot as a list of items."""
+        return [
+            {"id": item_id, "name": name, "value": value}
+            for item_id, name, value in zip(
+                self._int_list(self.ids),
+                self.names(),
+                self._int_list(self.values),
+                strict=True,
+            )
+        ]
+
+    def __len__(self) -> int:
+        """Return the number of items."""
+        return self.count
+
+    def close(self) -> None:
+        """Unmap the file."""
+        self._mmap.close()
+
+    def __enter__(self) -> Self:
+        """Enter context manager."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Unmap the file."""
+        self.close()
+
+    def __repr__(self) -> str:
+        """Return string representation."""
+        return f"ItemSnapshot({str(self.path)!r}, count={self.count})"
+
+    @property
+    def _names_start(self) -> int:
+        return _HEADER.size + _INT_SIZE * (3 * self.count + 1)
+
+    def _read_header(self) -> tuple[int, int, bool]:
+        magic, version, flags, _, count, names_size = _HEADER.unpack_from(self._mmap)
+        if magic != SNAPSHOT_MAGIC:
+            self._fail("not a snapshot file")
+        if version != SNAPSHOT_VERSION:
+            self._fail(f"unsupported version {version}")
+        expected = _HEADER.size + _INT_SIZE * (3 * count + 1) + names_size
+        if len(self._mmap) != expected:
+            self._fail(f"expected {expected} bytes, got {len(self._mmap)}")
+        return count, names_size, bool(flags & _FLAG_SPLITTABLE)
+
+    def _fail(self, reason: str) -> NoReturn:
+        logger.error(f"Invalid snapshot {self.path}: {reason}")
+        raise ValueError(f"Invalid snapshot {self.path}: {reason}")
+
+    def _column(self, index: int, length: int) -> memoryview:
+        start = _HEADER.size + _INT_SIZE * self.count * index
+        end = start + _INT_SIZE * length
+        with memoryview(self._mmap) as view:
+            return view[start:end].cast(_INT_FORMAT)
+
+    @staticmethod
+    def _int_list(column: memoryview) -> list[int]:
+        """Convert a little-endian int64 view into Python ints."""
+        with column:
+            if _LITTLE_ENDIAN:
+                return column.tolist()
+            swapped = array(_INT_FORMAT, column.tobytes())
+            swapped.byteswap()
+            return swapped.tolist()
@@ -1,12 +1,16 @@
 """Common type definitions for the project."""
 
-from collections.abc import Mapping
+from collections.abc import Callable, Mapping
 from typing import Literal, TypedDict
 
 # Status types
 type ProcessorStatus = Literal["success", "error", "pending"]
 type ValidationStatus = Literal["valid", "invalid", "skipped"]
 
+# Parallel processing types
+type ChunkTransport = Literal["pickle", "shared_memory"]
+type WarmupHook = Callable[[], None]
+
 
 # Common data structures
 class ItemDict(TypedDict):
@@ -65,10 +69,32 @@ class ValidationResult(TypedDict):
 type JSONPrimitive = str | int | float | bool | None
 type JSONValue = JSONPrimitive | Mapping[str, "JSONValue"] | list["JSONValue"]
 type JSONObject = Mapping[str, JSONValue]
+type FrozenJSONValue = (
+    JSONPrimitive | Mapping[str, "FrozenJSONValue"] | tuple["FrozenJSONValue", ...]
+)
+type FrozenJSONObject = Mapping[str, FrozenJSONValue]
+type KeyConflictPolicy = Literal["error", "overwrite", "skip"]
+
+
+class DictPatch(TypedDict):
+    """Difference between two nested dictionaries, keyed by flattened path."""
+
+    added: dict[str, JSONValue]
+    changed: dict[str, JSONValue]
+    removed: list[str]
+
+
+class JSONFilesResult(TypedDict):
+    """Result of loading several JSON files, keyed by path."""
+
+    data: dict[str, JSONObject]
+    errors: dict[str, ErrorInfo]
+
 
 # File operation types
 type FileOperation = Literal["read", "write", "append", "delete"]
 type FileFormat = Literal["json", "yaml", "csv", "txt"]
+type Compression = Literal["infer", "gzip", "bz2", "lzma"]
 
 # Sorting and filtering
 type SortOrder = Literal["asc", "desc"]
@@ -0,0 +1,149 @@
+"""Read-only flattened view of a nested dictionary."""
+
+from collections.abc import Iterator, Mapping
+
+from ..types import JSONValue
+from .helpers import iter_flat_items
+from .logging_config import get_logger
+
+# モジュールレベルのロガー
+logger = get_logger(__name__)
+
+
+class FlattenedView(Mapping[str, JSONValue]):
+    """Mapping presenting a nested dictionary under flattened keys.
+
+    The view has the same keys and values as :func:`flatten_dict` would
+    return, but nothing is copied up front. Looking a key up walks the
+    nested structure along its segments, costing O(depth) instead of the
+    O(size) of flattening the whole document; keys are only enumerated
+    when the view is iterated, and ``len()`` walks the whole document.
+
+    The view reflects later changes to the underlying dictionary.
+
+    Examples
+    --------
+    >>> view = FlattenedView({"a": {"b": {"c": 1}}, "d": 2})
+    >>> view["a.b.c"]
+    1
+    >>> "a.b" in view  # containers are not flattened keys
+    False
+    >>> list(view)
+    ['a.b.c', 'd']
+    """
+
+    def __init__(
+        self,
+        nested_dict: Mapping[str, JSONValue],
+        *,
+        separator: str = ".",
+        flatten_lists: bool = False,
+    ) -> None:
+        """Create a view over ``nested_dict``.
+
+        Parameters
+        ----------
+        nested_dict : Mapping[str, JSONValue]
+            Dictionary to present; it is not copied
+        separator : str
+            Separator for keys
+        flatten_lists : bool
+            Whether lists are flattened as well, see :func:`flatten_dict`
+
+        Raises
+        ------
+        ValueError
+            If separator is empty
+        """
+        if not separator:
+            logger.error("Empty separator provided")
+            raise ValueError("separator must not be empty")
+
+        self._data = nested_dict
+        self.separator = separator
+        self.flatten_lists = flatten_lists
+
+    def __getitem__(self, key: str) -> JSONValue:
+        """Return the leaf value stored under flattened ``key``.
+
+        Raises
+        ------
+        KeyError
+            If ``key`` does not name a leaf value
+        """
+        segments = key.split(self.separator)
+
+        # 通常はキーを区切り文字で分割して辿るだけで見つかる
+        node: JSONValue = self._data
+        for segment in segments:
+            found, node = self._child(node, segment)
+            if not found:
+                break
+        else:
+            if self._is_leaf(node):
+                return node
+
+        # 区切り文字を含むキーがある場合に備え、分割位置を変えて探索する
+        return self._search(key, segments)
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over flattened keys in depth-first order."""
+        for key, _ in iter_flat_items(
+            self._data,
+            separator=self.separator,
+            flatten_lists=self.flatten_lists,
+        ):
+            yield key
+
+    def __len__(self) -> int:
+        """Return the number of flattened keys; walks the whole document."""
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        """Return string representation."""
+        return (
+            f"FlattenedView(keys={len(self._data)} top-level, "
+            f"separator={self.separator!r}, flatten_lists={self.flatten_lists})"
+        )
+
+    def _search(self, key: str, segments: list[str]) -> JSONValue:
+        """Find ``key`` when dictionary keys themselves contain the separator."""
+        # (コンテナ, 未消費のセグメントの開始位置)
+        stack: list[tuple[JSONValue, int]] = [(self._data, 0)]
+        while stack:
+            node, start = stack.pop()
+            # 短い候補が先に取り出されるよう、長い候補から積む
+            for end in range(len(segments), start, -1):
+                candidate = self.separator.join(segments[start:end])
+                found, child = self._child(node, candidate)
+                if not found:
+                    continue
+                if end < len(segments):
+                    stack.append((child, end))
+                elif self._is_leaf(child):
+                    return child
+
+        raise KeyError(key)
+
+    def _child(self, node: JSONValue, segment: str) -> tuple[bool, JSONValue]:
+        """Return whether ``node`` has a child named ``segment``, and the child."""
+        # flatten_dictと同様、ネストした値はdictのみをコンテナとして扱う
+        if isinstance(node, dict) or (node is self._data and isinstance(node, Mapping)):
+            if segment in node:
+                return True, node[segment]
+        elif (
+            self.flatten_lists
+            and isinstance(node, list)
+            and segment.isascii()
+            and segment.isdigit()
+            and str(int(segment)) == segment
+            and int(segment) < len(node)
+        ):
+            return True, node[int(segment)]
+        return False, None
+
+    def _is_leaf(self, value: JSONValue) -> bool:
+        """Return whether ``value`` is a flattened value, not a container."""
+        return not isinstance(value, dict) and not (
+            self.flatten_lists and isinstance(value, list)
+        )
@@ -0,0 +1,195 @@
+"""Precompiled flattening of records that share one nested shape."""
+
+from collections.abc import Iterable, Mapping
+from typing import Any, Final
+
+from ..types import JSONValue
+from .helpers import flatten_dict
+from .logging_config import get_logger
+
+# モジュールレベルのロガー
+logger = get_logger(__name__)
+
+# 命令の種類
+_LEAF: Final = 0
+_DICT: Final = 1
+_LIST: Final = 2
+
+# (親コンテナの深さ, キー, 命令の種類, 出力キー, コンテナの要素数)
+type _Instruction = tuple[int, str | int, int, str, int]
+
+
+class _ShapeMismatchError(Exception):
+    """Raised internally when a record does not have the plan's shape."""
+
+
+class FlattenPlan:
+    """Flattening plan compiled from the shape of a template record.
+
+    :func:`flatten_dict` discovers the structure of every record it
+    flattens, building each output key and type-checking each value anew.
+    When records share one shape, the structure can be discovered once:
+    the plan stores the key path and the prebuilt output key of every leaf
+    as a flat list of instructions, and :meth:`apply` only looks values up
+    along those paths.
+
+    The template is either a sample record or a schema written the same
+    way, with any non-container placeholder (such as a type) as leaves.
+    Records whose shape differs from the template are flattened with
+    :func:`flatten_dict` instead, so the output is always the same as that
+    of :func:`flatten_dict`, apart from key order following the template.
+
+    Attributes
+    ----------
+    keys : tuple[str, ...]
+        Output keys in plan order
+    fallbacks : int
+        Number of records that did not match the plan
+
+    Examples
+    --------
+    >>> plan = FlattenPlan({"a": {"b": int}, "c": str})
+    >>> plan.apply({"a": {"b": 1}, "c": "x"})
+    {"a.b": 1, "c": "x"}
+    >>> plan.apply({"a": 1})  # different shape: generic path
+    {"a": 1}
+    """
+
+    def __init__(
+        self,
+        template: Mapping[str, Any],
+        *,
+        separator: str = ".",
+        flatten_lists: bool = False,
+    ) -> None:
+        """Compile a plan from a template record.
+
+        Parameters
+        ----------
+        template : Mapping[str, Any]
+            Sample record or schema describing the shared shape
+        separator : str
+            Separator for keys
+        flatten_lists : bool
+            Whether lists are flattened as well, see :func:`flatten_dict`.
+            Lists in the template then fix the length of matching lists
+        """
+        self.separator = separator
+        self.flatten_lists = flatten_lists
+        self.fallbacks = 0
+        self._root_size = len(template)
+        self._instructions = self._compile(template)
+        self._max_depth = max(
+            (depth + 1 for depth, *_ in self._instructions), default=0
+        )
+        self.keys = tuple(
+            out_key for _, _, kind, out_key, _ in self._instructions if kind == _LEAF
+        )
+        logger.debug(
+            f"Compiled flatten plan with {len(self.keys)} keys and "
+            f"{len(self._instructions)} instructions"
+        )
+
+    def apply(self, record: Mapping[str, JSONValue]) -> dict[str, JSONValue]:
+        """Flatten one record.
+
+        Parameters
+        ----------
+        record : Mapping[str, JSONValue]
+            Record to flatten
+
+        Returns
+        -------
+        dict[str, JSONValue]
+            Same content as ``flatten_dict(record, ...)``
+        """
+        try:
+            return self._apply_plan(record)
+        except _ShapeMismatchError:
+            pass
+
+        self.fallbacks += 1
+        logger.debug("Record does not match the flatten plan, using flatten_dict")
+        return dict(
+            flatten_dict(
+                record,
+                separator=self.separator,
+                flatten_lists=self.flatten_lists,
+            )
+        )
+
+    def apply_many(
+        self,
+        records: Iterable[Mapping[str, JSONValue]],
+    ) -> list[dict[str, JSONValue]]:
+        """Flatten many records.
+
+        Parameters
+        ----------
+        records : Iterable[Mapping[str, JSONValue]]
+            Records to flatten
+
+        Returns
+        -------
+        list[dict[str, JSONValue]]
+            Flattened records in input order
+        """
+        return [self.apply(record) for record in records]
+
+    def __repr__(self) -> str:
+        """Return string representation."""
+        return f"FlattenPlan(keys={len(self.keys)}, fallbacks={self.fallbacks})"
+
+    def _compile(self, template: Mapping[str, Any]) -> list[_Instruction]:
+        """Turn the template into instructions in depth-first key order."""
+        instructions: list[_Instruction] = []
+        # (コンテナの深さ, 出力キーの接頭辞, 未処理の要素のイテレータ)
+        stack: list[tuple[int, str, Any]] = [(0, "", iter(template.items()))]
+
+        while stack:
+            depth, parent, entries = stack[-1]
+            for key, value in entries:
+                new_key = f"{parent}{self.separator}{key}" if parent else str(key)
+
+                if isinstance(value, dict):
+                    instructions.append((depth, key, _DICT, new_key, len(value)))
+                    stack.append((depth + 1, new_key, iter(value.items())))
+                    break
+                if self.flatten_lists and isinstance(value, list):
+                    instructions.append((depth, key, _LIST, new_key, len(value)))
+                    stack.append((depth + 1, new_key, enumerate(value)))
+                    break
+                instructions.append((depth, key, _LEAF, new_key, 0))
+            else:
+                stack.pop()
+
+        return instructions
+
+    def _apply_plan(self, record: Mapping[str, JSONValue]) -> dict[str, JSONValue]:
+        """Flatten a record along the plan, or raise on a shape mismatch."""
+        if not isinstance(record, dict) or len(record) != self._root_size:
+            raise _ShapeMismatchError
+
+        flatten_lists = self.flatten_lists
+        result: dict[str, JSONValue] = {}
+        # containers[d]は深さdで現在処理中のコンテナ
+        containers: list[Any] = [record] + [None] * self._max_depth
+        try:
+            for depth, key, kind, out_key, size in self._instructions:
+                value = containers[depth][key]
+                if kind == _LEAF:
+                    if isinstance(value, dict) or (
+                        flatten_lists and isinstance(value, list)
+                    ):
+                        raise _ShapeMismatchError
+                    result[out_key] = value
+                    continue
+
+                expected_type = dict if kind == _DICT else list
+                if not isinstance(value, expected_type) or len(value) != size:
+                    raise _ShapeMismatchError
+                containers[depth + 1] = value
+        except (KeyError, IndexError, TypeError) as e:
+            raise _ShapeMismatchError from e
+
+        return result
@@ -1,104 +1,617 @@
 """Utility helper functions."""
 
+import glob
+import heapq
 import json
-from collections.abc import Mapping
+import sys
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import ExitStack
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import TypeVar
+from types import MappingProxyType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Literal,
+    NoReturn,
+    TextIO,
+    TypeVar,
+    cast,
+    overload,
+)
 
-from ..types import JSONObject, JSONValue
+from ..types import (
+    Compression,
+    DictPatch,
+    ErrorInfo,
+    FrozenJSONObject,
+    FrozenJSONValue,
+    JSONFilesResult,
+    JSONObject,
+    JSONValue,
+    KeyConflictPolicy,
+)
 from ..utils.logging_config import get_logger
+from .key_pool import KeyInternPool
+from .multiprocessing_config import default_mp_context
+
+if TYPE_CHECKING:
+    from collections.abc import Buffer
+
+    import pandas as pd
+    from numpy.typing import NDArray
+
+    from .json_cache import JSONFileCache
 
 T = TypeVar("T")
 
 # モジュールレベルのロガー
 logger = get_logger(__name__)
 
+# unflatten_dictで分割済みのキーをキャッシュする件数
+KEY_SPLIT_CACHE_SIZE = 65536
+
+# load_json_filesでプロセスプールで読み込むファイルサイズの既定値(バイト)
+LARGE_JSON_FILE_BYTES = 16 * 1024 * 1024
+
+# save_json_arrayで1回にエンコードして書き込む要素数
+JSON_ARRAY_WRITE_BATCH = 1000
+
+# compression="infer"のときに拡張子から選ぶ圧縮形式
+COMPRESSION_SUFFIXES: dict[str, Compression] = {
+    ".gz": "gzip",
+    ".bz2": "bz2",
+    ".xz": "lzma",
+    ".lzma": "lzma",
+}
+
+# 圧縮形式ごとの圧縮レベルの範囲(lzmaはpreset)
+_COMPRESSION_LEVELS: dict[Compression, range] = {
+    "gzip": range(10),
+    "bz2": range(1, 10),
+    "lzma": range(10),
+}
+
+
+@overload
+def load_json_file(
+    filepath: str | Path,
+    *,
+    compression: Compression | None = ...,
+    cache: "JSONFileCache | None" = ...,
+    frozen: Literal[False] = ...,
+) -> JSONObject: ...
+
+
+@overload
+def load_json_file(
+    filepath: str | Path,
+    *,
+    compression: Compression | None = ...,
+    cache: "JSONFileCache | None" = ...,
+    frozen: Literal[True],
+) -> FrozenJSONObject: ...
 
-def load_json_file(filepath: str | Path) -> JSONObject:
+
+def load_json_file(
+    filepath: str | Path,
+    *,
+    compression: Compression | None = "infer",
+    cache: "JSONFileCache | None" = None,
+    frozen: bool = False,
+) -> JSONObject | FrozenJSONObject:
     """Load JSON data from a file.
 
+    Compressed files are decompressed while they are read.
+
     Parameters
     ----------
     filepath : str | Path
         Path to JSON file
+    compression : Compression | None
+        ``"gzip"``, ``"bz2"`` or ``"lzma"``; ``"infer"`` chooses by the
+        file extension (see ``COMPRESSION_SUFFIXES``) and ``None`` reads
+        the file as plain text
+    cache : JSONFileCache | None
+        Serve unchanged files from this cache instead of reading them
+        again, see :class:`~template_package.utils.json_cache.JSONFileCache`
+    frozen : bool
+        Return a read-only structure of :class:`types.MappingProxyType`
+        and tuples instead of dictionaries and lists. With a cache, the
+        frozen structure is cached and shared without copying or parsing
 
     Returns
     -------
-    JSONObject
-        Loaded JSON data as a dictionary
+    JSONObject | FrozenJSONObject
+        Loaded JSON data as a dictionary, or as a read-only mapping if
+        frozen is True
 
     Raises
     ------
     FileNotFoundError
         If file doesn't exist
     ValueError
-        If file contains invalid JSON
+        If file contains invalid JSON or invalid compressed data, or if
+        compression is unknown
+
+    Examples
+    --------
+    >>> cache = JSONFileCache()
+    >>> config = load_json_file("config.json", cache=cache, frozen=True)
     """
     path = Path(filepath)
     logger.debug(f"Loading JSON file from: {path}")
 
+    codec = _resolve_compression(path, compression)
+    if not path.exists():
+        logger.error(f"File not found: {path}")
+        raise FileNotFoundError(f"File not found: {path}")
+
+    def read(p: Path) -> str:
+        return _read_json_text(p, codec)
+
+    def parse_frozen(text: str) -> FrozenJSONObject:
+        return _freeze_json(_parse_json_object(text, path))
+
+    if cache is None:
+        text = read(path)
+        return parse_frozen(text) if frozen else _parse_json_object(text, path)
+    if frozen:
+        return cache.get_or_freeze(path, read, parse_frozen, variant=codec)
+    return _parse_json_object(cache.get_or_read(path, read, variant=codec), path)
+
+
+def read_json_text(
+    filepath: str | Path,
+    *,
+    compression: Compression | None = "infer",
+) -> str:
+    """Read the text of a JSON file without parsing it.
+
+    For callers that decode the text themselves, e.g. with a custom
+    decoder or into something other than an object. Compressed files are
+    decompressed while they are read.
+
+    Parameters
+    ----------
+    filepath : str | Path
+        Path to JSON file
+    compression : Compression | None
+        ``"gzip"``, ``"bz2"`` or ``"lzma"``; ``"infer"`` chooses by the
+        file extension (see ``COMPRESSION_SUFFIXES``) and ``None`` reads
+        the file as plain text
+
+    Returns
+    -------
+    str
+        Text of the file
+
+    Raises
+    ------
+    FileNotFoundError
+        If file doesn't exist
+    ValueError
+        If the file holds invalid compressed data, or if compression is
+        unknown
+
+    Examples
+    --------
+    >>> records = json.loads(read_json_text("items.json.gz"))
+    """
+    path = Path(filepath)
+    logger.debug(f"Reading JSON text from: {path}")
+
+    codec = _resolve_compression(path, compression)
     if not path.exists():
         logger.error(f"File not found: {path}")
         raise FileNotFoundError(f"File not found: {path}")
 
+    return _read_json_text(path, codec)
+
+
+def _read_json_text(path: Path, codec: Compression | None) -> str:
+    """Read a JSON file as text, decompressing it if needed."""
+    codec_errors = _decompression_errors(codec)
     try:
-        logger.debug(f"Opening file: {path}")
-        with path.open("r", encoding="utf-8") as f:
-            result = json.load(f)
-            logger.debug(f"Successfully loaded JSON data from {path}")
-
-            # json.load returns Any, but we expect dict[str, Any]
-            if not isinstance(result, dict):
-                type_name = type(result).__name__
-                logger.error(
-                    f"Invalid JSON structure in {path}: expected object, "
-                    f"got {type_name}"
-                )
-                raise ValueError(f"Expected JSON object in {path}, got {type_name}")
+        logger.debug(f"Opening file: {path} (compression={codec})")
+        with _open_text(path, "r", codec) as f:
+            return f.read()
+    except codec_errors as e:
+        logger.error(f"Failed to decompress {path} as {codec}: {e}")
+        raise ValueError(f"Invalid {codec} data in {path}: {e}") from e
+
 
-            logger.debug(f"JSON object contains {len(result)} keys")
-            return result
+def _parse_json_object(text: str, path: Path) -> JSONObject:
+    """Parse JSON text whose top-level value must be an object."""
+    try:
+        result = json.loads(text)
     except json.JSONDecodeError as e:
         logger.error(f"Failed to parse JSON from {path}: {e}")
         raise ValueError(f"Invalid JSON in {path}: {e}") from e
+    logger.debug(f"Successfully loaded JSON data from {path}")
+
+    # json.loads returns Any, but we expect dict[str, Any]
+    if not isinstance(result, dict):
+        type_name = type(result).__name__
+        logger.error(
+            f"Invalid JSON structure in {path}: expected object, got {type_name}"
+        )
+        raise ValueError(f"Expected JSON object in {path}, got {type_name}")
+
+    logger.debug(f"JSON object contains {len(result)} keys")
+    return result
+
+
+def _freeze_json(data: JSONObject) -> FrozenJSONObject:
+    """Convert a parsed JSON object into read-only mappings and tuples."""
+    return MappingProxyType({key: _freeze_value(value) for key, value in data.items()})
+
 
+def _freeze_value(value: JSONValue) -> FrozenJSONValue:
+    if isinstance(value, Mapping):
+        return _freeze_json(value)
+    if isinstance(value, list):
+        return tuple(_freeze_value(item) for item in value)
+    return value
 
-def save_json_file(
+
+def load_json_files(
+    paths: str | Iterable[str | Path],
+    *,
+    max_workers: int | None = None,
+    process_threshold: int | None = LARGE_JSON_FILE_BYTES,
+    compression: Compression | None = "infer",
+) -> JSONFilesResult:
+    """Load many JSON files concurrently.
+
+    Files are opened, read and parsed by a thread pool, so the latency of
+    opening and reading each file overlaps with the others. Files of at
+    least ``process_threshold`` bytes are loaded in a process pool instead,
+    so their parsing runs in parallel; the parsed data is pickled back to
+    the caller, which only pays off for large files. The process pool is
+    started with
+    :func:`~template_package.utils.multiprocessing_config.default_mp_context`,
+    as forking while the thread pool is running may deadlock the workers.
+
+    A file that cannot be loaded does not abort the others; its error is
+    recorded in the result.
+
+    Parameters
+    ----------
+    paths : str | Iterable[str | Path]
+        A glob pattern such as ``"configs/**/*.json"`` (``**`` matches
+        subdirectories), or the paths to load
+    max_workers : int | None
+        Number of threads, and of processes if any file is large; defaults
+        to the :class:`~concurrent.futures.ThreadPoolExecutor` default
+    process_threshold : int | None
+        Size in bytes from which a file is loaded in a process pool; None
+        loads every file in threads
+    compression : Compression | None
+        Codec, as for :func:`load_json_file`
+
+    Returns
+    -------
+    JSONFilesResult
+        ``data`` maps each loaded path to its JSON object and ``errors``
+        maps each failed path to an :class:`~template_package.types.ErrorInfo`,
+        both in input order; paths are the given strings or the glob matches
+
+    Raises
+    ------
+    ValueError
+        If max_workers or process_threshold is not positive
+
+    Examples
+    --------
+    >>> result = load_json_files("fixtures/*.json")
+    >>> for path, error in result["errors"].items():
+    ...     print(path, error["message"])
+    """
+    if max_workers is not None and max_workers <= 0:
+        logger.error(f"Invalid max_workers: {max_workers}")
+        raise ValueError(f"max_workers must be positive, got {max_workers}")
+    if process_threshold is not None and process_threshold <= 0:
+        logger.error(f"Invalid process_threshold: {process_threshold}")
+        raise ValueError(f"process_threshold must be positive, got {process_threshold}")
+
+    if isinstance(paths, str):
+        keys = sorted(glob.glob(paths, recursive=True))  # noqa: PTH207
+        logger.debug(f"Pattern {paths!r} matched {len(keys)} files")
+    else:
+        # 重複を除きつつ入力順を保つ
+        keys = list(dict.fromkeys(str(path) for path in paths))
+
+    large = {key for key in keys if _is_large_file(key, process_threshold)}
+    logger.debug(
+        f"Loading {len(keys)} JSON files ({len(large)} in processes, "
+        f"max_workers={max_workers})"
+    )
+
+    result: JSONFilesResult = {"data": {}, "errors": {}}
+    futures: dict[str, Future[JSONObject]] = {}
+    with ExitStack() as stack:
+        threads = stack.enter_context(ThreadPoolExecutor(max_workers=max_workers))
+        processes = (
+            stack.enter_context(
+                ProcessPoolExecutor(
+                    max_workers=max_workers, mp_context=default_mp_context()
+                )
+            )
+            if large
+            else None
+        )
+        for key in keys:
+            executor = processes if processes is not None and key in large else threads
+            futures[key] = executor.submit(load_json_file, key, compression=compression)
+
+        for key, future in futures.items():
+            try:
+                result["data"][key] = future.result()
+            except (OSError, ValueError) as e:
+                logger.warning(f"Failed to load {key}: {e}")
+                result["errors"][key] = _file_error_info(key, e)
+
+    logger.info(
+        f"Loaded {len(result['data'])} JSON files ({len(result['errors'])} failed)"
+    )
+    return result
+
+
+def _is_large_file(path: str, threshold: int | None) -> bool:
+    """Return whether ``path`` should be parsed in a worker process."""
+    if threshold is None:
+        return False
+    try:
+        return Path(path).stat().st_size >= threshold
+    except OSError:
+        # 読み込み時に同じエラーになり、そこで記録される
+        return False
+
+
+def _file_error_info(path: str, error: Exception) -> ErrorInfo:
+    """Describe why a file could not be loaded."""
+    if isinstance(error, FileNotFoundError):
+        code = "file_not_found"
+    elif isinstance(error, OSError):
+        code = "read_error"
+    else:
+        code = "invalid_json"
+    return {
+        "code": code,
+        "message": str(error),
+        "details": {"path": path, "exception": type(error).__name__},
+    }
+
+
+def save_json_file(  # noqa: PLR0913
     data: JSONObject,
     filepath: str | Path,
     *,
-    indent: int = 2,
+    indent: int | None = None,
     ensure_ascii: bool = False,
+    compression: Compression | None = "infer",
+    compression_level: int | None = None,
 ) -> None:
     """Save data to a JSON file.
 
+    Compact output (the default) is encoded in one call to the C encoder,
+    several times faster than the pure-Python encoder :func:`json.dump`
+    falls back to; the encoded document is held in memory once. Indented
+    output is encoded and written piece by piece. Use
+    :func:`save_json_array` for outputs too large to build in memory.
+
     Parameters
     ----------
     data : JSONObject
         JSON-compatible dictionary to save
     filepath : str | Path
         Path to save to
-    indent : int
-        JSON indentation level
+    indent : int | None
+        JSON indentation level; None writes compact output for machine
+        consumption
     ensure_ascii : bool
         Whether to escape non-ASCII characters
+    compression : Compression | None
+        ``"gzip"``, ``"bz2"`` or ``"lzma"``; ``"infer"`` chooses by the
+        file extension (see ``COMPRESSION_SUFFIXES``) and ``None`` writes
+        plain text
+    compression_level : int | None
+        Lower is faster, higher is smaller: 0-9 for gzip, 1-9 for bz2 and
+        the preset 0-9 for lzma. Defaults to the codec's default
+
+    Raises
+    ------
+    ValueError
+        If compression is unknown, or if compression_level is out of range
+        or given for an uncompressed file
+
+    Examples
+    --------
+    >>> save_json_file(data, "artifact.json.gz", compression_level=1)
     """
     path = Path(filepath)
     logger.debug(
         f"Saving JSON data to: {path} (indent={indent}, ensure_ascii={ensure_ascii})"
     )
 
+    codec = _resolve_compression(path, compression)
+    _check_compression_level(codec, compression_level)
+
     # ディレクトリが存在しない場合は作成
     if not path.parent.exists():
         logger.debug(f"Creating directory: {path.parent}")
     path.parent.mkdir(parents=True, exist_ok=True)
 
-    logger.debug(f"Writing {len(data)} keys to {path}")
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(data, f, indent=indent, ensure_ascii=ensure_ascii)
+    logger.debug(
+        f"Writing {len(data)} keys to {path} "
+        f"(compression={codec}, level={compression_level})"
+    )
+    with _open_text(path, "w", codec, compression_level) as f:
+        if indent is None:
+            f.write(json.dumps(data, ensure_ascii=ensure_ascii, separators=(",", ":")))
+        else:
+            json.dump(data, f, indent=indent, ensure_ascii=ensure_ascii)
     logger.info(f"Successfully saved JSON file to {path}")
 
 
+def save_json_array(
+    items: Iterable[JSONValue],
+    filepath: str | Path,
+    *,
+    ensure_ascii: bool = False,
+    compression: Compression | None = "infer",
+    compression_level: int | None = None,
+) -> int:
+    """Stream items into a file as a compact JSON array.
+
+    Items are consumed lazily and encoded in batches of
+    ``JSON_ARRAY_WRITE_BATCH`` with the C encoder, so a generator of any
+    length can be written while only one batch is held in memory. The
+    result can be read back lazily with
+    :func:`~template_package.utils.json_stream.iter_json_array`.
+
+    Parameters
+    ----------
+    items : Iterable[JSONValue]
+        JSON-compatible values to write
+    filepath : str | Path
+        Path to save to
+    ensure_ascii : bool
+        Whether to escape non-ASCII characters
+    compression : Compression | None
+        Codec, as for :func:`save_json_file`
+    compression_level : int | None
+        Codec level, as for :func:`save_json_file`
+
+    Returns
+    -------
+    int
+        Number of items written
+
+    Raises
+    ------
+    ValueError
+        If compression or compression_level is invalid
+    TypeError
+        If an item is not JSON serializable; the file is left incomplete
+
+    Examples
+    --------
+    >>> save_json_array(({"id": i} for i in range(10**7)), "items.json.gz")
+    10000000
+    """
+    path = Path(filepath)
+    logger.debug(f"Streaming JSON array to: {path} (ensure_ascii={ensure_ascii})")
+
+    codec = _resolve_compression(path, compression)
+    _check_compression_level(codec, compression_level)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    encode = json.JSONEncoder(ensure_ascii=ensure_ascii, separators=(",", ":")).encode
+    count = 0
+    with _open_text(path, "w", codec, compression_level) as f:
+        f.write("[")
+        for batch in iter_chunks(items, JSON_ARRAY_WRITE_BATCH):
+            # 2つ目以降のバッチの前には区切りのカンマが必要
+            f.write(("," if count else "") + ",".join(map(encode, batch)))
+            count += len(batch)
+        f.write("]")
+
+    logger.info(f"Successfully saved {count} items as JSON array to {path}")
+    return count
+
+
+def _resolve_compression(
+    path: Path, compression: Compression | None
+) -> Compression | None:
+    """Return the codec to use for ``path``, or None for plain text."""
+    if compression == "infer":
+        return COMPRESSION_SUFFIXES.get(path.suffix.lower())
+    if compression is not None and compression not in _COMPRESSION_LEVELS:
+        logger.error(f"Unknown compression: {compression!r}")
+        raise ValueError(
+            f"compression must be one of 'infer', 'gzip', 'bz2', 'lzma' or None, "
+            f"got {compression!r}"
+        )
+    return compression
+
+
+def _check_compression_level(codec: Compression | None, level: int | None) -> None:
+    """Validate ``level`` for ``codec`` before the file is created."""
+    if level is None:
+        return
+    if codec is None:
+        logger.error(f"compression_level={level} given for an uncompressed file")
+        raise ValueError("compression_level requires a compressed file")
+    levels = _COMPRESSION_LEVELS[codec]
+    if level not in levels:
+        logger.error(f"Invalid compression_level for {codec}: {level}")
+        raise ValueError(
+            f"compression_level for {codec} must be between "
+            f"{levels.start} and {levels.stop - 1}, got {level}"
+        )
+
+
+def _decompression_errors(codec: Compression | None) -> tuple[type[Exception], ...]:
+    """Return the exceptions ``codec`` raises for corrupt or truncated data."""
+    if codec is None:
+        return ()
+    errors: tuple[type[Exception], ...] = (OSError, EOFError)
+    if codec == "gzip":
+        import zlib  # noqa: PLC0415
+
+        return (*errors, zlib.error)
+    if codec == "lzma":
+        import lzma  # noqa: PLC0415
+
+        return (*errors, lzma.LZMAError)
+    return errors
+
+
+def _open_text(
+    path: Path,
+    mode: Literal["r", "w"],
+    codec: Compression | None,
+    level: int | None = None,
+) -> TextIO:
+    """Open ``path`` as UTF-8 text, streaming through ``codec`` if given."""
+    # 圧縮モジュールは使うときだけ読み込む(ビルドによってはlzmaやbz2がない)
+    if codec == "gzip":
+        import gzip  # noqa: PLC0415
+
+        return cast(
+            "TextIO",
+            gzip.open(
+                path,
+                f"{mode}t",
+                compresslevel=9 if level is None else level,
+                encoding="utf-8",
+            ),
+        )
+    if codec == "bz2":
+        import bz2  # noqa: PLC0415
+
+        return cast(
+            "TextIO",
+            bz2.open(
+                path,
+                f"{mode}t",
+                compresslevel=9 if level is None else level,
+                encoding="utf-8",
+            ),
+        )
+    if codec == "lzma":
+        import lzma  # noqa: PLC0415
+
+        return cast(
+            "TextIO", lzma.open(path, f"{mode}t", preset=level, encoding="utf-8")
+        )
+    return path.open(mode, encoding="utf-8")
+
+
 def chunk_list(items: list[T], chunk_size: int) -> list[list[T]]:
     """Split a list into chunks of specified size.
 
@@ -138,14 +651,236 @@ def chunk_list(items: list[T], chunk_size: int) -> list[list[T]]:
     return chunks
 
 
+def iter_chunks(items: Iterable[T], chunk_size: int) -> Iterator[list[T]]:
+    """Lazily split an iterable into chunks of specified size.
+
+    Unlike :func:`chunk_list`, chunks are produced one at a time, so only a
+    single chunk is held in memory and unbounded iterables such as
+    generators or file streams can be chunked. Sequences are sliced
+    directly instead of being iterated element by element.
+
+    Parameters
+    ----------
+    items : Iterable[T]
+        Items to chunk
+    chunk_size : int
+        Size of each chunk
+
+    Returns
+    -------
+    Iterator[list[T]]
+        Iterator over chunks; only the last chunk may be shorter
+
+    Raises
+    ------
+    ValueError
+        If chunk_size is not positive
+
+    Examples
+    --------
+    >>> list(iter_chunks(range(5), 2))
+    [[0, 1], [2, 3], [4]]
+    >>> next(iter_chunks(itertools.count(), 3))
+    [0, 1, 2]
+    """
+    # ジェネレータ本体と分離し、引数の検証を呼び出し時点で行う
+    if chunk_size <= 0:
+        logger.error(f"Invalid chunk_size: {chunk_size}")
+        raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+
+    if isinstance(items, Sequence):
+        logger.debug(
+            f"Chunking sequence of {len(items)} items into chunks of size "
+            f"{chunk_size} (slicing)"
+        )
+        return _iter_sequence_chunks(items, chunk_size)
+
+    logger.debug(f"Chunking iterable lazily into chunks of size {chunk_size}")
+    return _iter_iterable_chunks(iter(items), chunk_size)
+
+
+def _iter_sequence_chunks(items: Sequence[T], chunk_size: int) -> Iterator[list[T]]:
+    """Yield chunks of a sequence by slicing."""
+    for start in range(0, len(items), chunk_size):
+        chunk = items[start : start + chunk_size]
+        # listのスライスは既にlistなので再コピーしない
+        yield chunk if isinstance(chunk, list) else list(chunk)
+
+
+def _iter_iterable_chunks(iterator: Iterator[T], chunk_size: int) -> Iterator[list[T]]:
+    """Yield chunks of an arbitrary iterator."""
+    while chunk := list(islice(iterator, chunk_size)):
+        yield chunk
+
+
+def partition_by_weight(
+    items: Sequence[T],
+    num_chunks: int,
+    *,
+    weights: Sequence[float] | Callable[[T], float],
+) -> list[list[T]]:
+    """Split items into chunks of near-equal total weight.
+
+    Items are assigned heaviest first, each to the chunk with the smallest
+    total weight so far (longest-processing-time-first scheduling). The
+    heaviest chunk is then at most 4/3 of the optimum, so workers given one
+    chunk each finish at about the same time even when item costs differ
+    widely. Sorting takes O(n log n); the assignment itself uses a heap of
+    chunk totals and takes O(n log K).
+
+    Parameters
+    ----------
+    items : Sequence[T]
+        Items to partition
+    num_chunks : int
+        Number of chunks K
+    weights : Sequence[float] | Callable[[T], float]
+        Weight of each item, either aligned with ``items`` or computed by a
+        function called once per item
+
+    Returns
+    -------
+    list[list[T]]
+        Exactly ``num_chunks`` chunks, some empty if there are fewer items
+        than chunks. Items keep their relative input order within a chunk
+
+    Raises
+    ------
+    ValueError
+        If num_chunks is not positive, if the number of weights differs from
+        the number of items, or if a weight is negative
+
+    Examples
+    --------
+    >>> partition_by_weight(["a", "b", "c", "d"], 2, weights=[5, 1, 4, 2])
+    [['a', 'b'], ['c', 'd']]
+    """
+    logger.debug(f"Partitioning {len(items)} items into {num_chunks} weighted chunks")
+
+    if num_chunks <= 0:
+        logger.error(f"Invalid num_chunks: {num_chunks}")
+        raise ValueError(f"num_chunks must be positive, got {num_chunks}")
+
+    item_weights = (
+        [weights(item) for item in items] if callable(weights) else list(weights)
+    )
+    if len(item_weights) != len(items):
+        logger.error(
+            f"Weight count mismatch: {len(item_weights)} weights, {len(items)} items"
+        )
+        raise ValueError(f"Expected {len(items)} weights, got {len(item_weights)}")
+    if any(weight < 0 for weight in item_weights):
+        logger.error("Negative weight provided")
+        raise ValueError("weights must be non-negative")
+
+    # (合計重み, チャンク番号)のヒープ。同じ重みなら番号の小さいチャンクを優先
+    totals = [(0.0, chunk) for chunk in range(num_chunks)]
+    assigned: list[list[int]] = [[] for _ in range(num_chunks)]
+    for index in sorted(range(len(items)), key=item_weights.__getitem__, reverse=True):
+        total, chunk = totals[0]
+        assigned[chunk].append(index)
+        heapq.heapreplace(totals, (total + item_weights[index], chunk))
+
+    chunks = [[items[index] for index in sorted(indices)] for indices in assigned]
+    logger.debug(
+        f"Created {num_chunks} chunks with total weights "
+        f"{[total for total, _ in sorted(totals, key=lambda entry: entry[1])]}"
+    )
+
+    return chunks
+
+
+@overload
+def iter_buffer_chunks(  # type: ignore[overload-overlap]
+    buffer: "NDArray[Any]",
+    chunk_size: int,
+) -> Iterator["NDArray[Any]"]: ...
+
+
+@overload
+def iter_buffer_chunks(buffer: "Buffer", chunk_size: int) -> Iterator[memoryview]: ...
+
+
+def iter_buffer_chunks(
+    buffer: "Buffer | NDArray[Any]",
+    chunk_size: int,
+) -> Iterator[memoryview] | Iterator["NDArray[Any]"]:
+    """Split a binary or numeric buffer into chunks without copying.
+
+    ``bytes``, ``bytearray``, ``array.array`` and other buffer protocol
+    objects are split into :class:`memoryview` slices; NumPy arrays are
+    split along their first axis into array views. Every chunk refers to
+    the original memory, so no element data is copied. A ``bytearray``
+    cannot be resized while chunks of it are alive.
+
+    Parameters
+    ----------
+    buffer : Buffer | NDArray[Any]
+        One-dimensional buffer, or NumPy array of any dimension
+    chunk_size : int
+        Number of elements (rows for NumPy arrays) in each chunk
+
+    Returns
+    -------
+    Iterator[memoryview] | Iterator[NDArray[Any]]
+        Iterator over views; only the last view may be shorter
+
+    Raises
+    ------
+    ValueError
+        If chunk_size is not positive, or if a non-NumPy buffer is not
+        one-dimensional
+
+    Examples
+    --------
+    >>> [bytes(view) for view in iter_buffer_chunks(b"abcde", 2)]
+    [b'ab', b'cd', b'e']
+    """
+    if chunk_size <= 0:
+        logger.error(f"Invalid chunk_size: {chunk_size}")
+        raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+
+    # numpyが未インポートならndarrayであるはずがないので、ここではインポートしない
+    numpy = sys.modules.get("numpy")
+    if numpy is not None and isinstance(buffer, numpy.ndarray):
+        logger.debug(
+            f"Chunking array of shape {buffer.shape} into views of {chunk_size} rows"
+        )
+        return _iter_view_chunks(buffer, len(buffer), chunk_size)
+
+    view = memoryview(buffer)
+    if view.ndim != 1:
+        logger.error(f"Invalid buffer dimensions: {view.ndim}")
+        raise ValueError(f"buffer must be one-dimensional, got {view.ndim} dimensions")
+
+    logger.debug(
+        f"Chunking buffer of {len(view)} elements ({view.nbytes} bytes) "
+        f"into views of {chunk_size} elements"
+    )
+    return _iter_view_chunks(view, len(view), chunk_size)
+
+
+def _iter_view_chunks(view: Any, length: int, chunk_size: int) -> Iterator[Any]:
+    """Yield slices of a memoryview or NumPy array, which are views."""
+    for start in range(0, length, chunk_size):
+        yield view[start : start + chunk_size]
+
+
 def flatten_dict(
     nested_dict: Mapping[str, JSONValue],
     *,
     separator: str = ".",
     prefix: str = "",
+    flatten_lists: bool = False,
+    key_pool: KeyInternPool | None = None,
 ) -> Mapping[str, JSONValue]:
     """Flatten a nested dictionary.
 
+    The dictionary is walked with an explicit stack instead of recursion, so
+    arbitrarily deep documents do not hit the recursion limit, and each key
+    is written to the result exactly once, keeping the total work linear in
+    the size of the document. Empty nested containers produce no keys.
+
     Parameters
     ----------
     nested_dict : dict[str, JSONValue]
@@ -154,6 +889,12 @@ def flatten_dict(
         Separator for keys
     prefix : str
         Prefix for all keys
+    flatten_lists : bool
+        Whether to flatten lists as well, using element indices as key
+        segments. Lists are kept as values otherwise
+    key_pool : KeyInternPool | None
+        Pool to take keys from, so that results of many calls share one
+        string object per distinct key instead of each holding copies
 
     Returns
     -------
@@ -164,27 +905,540 @@ def flatten_dict(
     --------
     >>> flatten_dict({"a": {"b": 1, "c": 2}})
     {"a.b": 1, "a.c": 2}
+    >>> flatten_dict({"a": [1, {"b": 2}]}, flatten_lists=True)
+    {"a.0": 1, "a.1.b": 2}
     """
     logger.debug(
         f"Flattening dictionary with {len(nested_dict)} keys, "
-        f"separator={separator!r}, prefix={prefix!r}"
+        f"separator={separator!r}, prefix={prefix!r}, flatten_lists={flatten_lists}"
+    )
+
+    result = dict(
+        iter_flat_items(
+            nested_dict,
+            separator=separator,
+            prefix=prefix,
+            flatten_lists=flatten_lists,
+            key_pool=key_pool,
+        )
+    )
+    logger.debug(f"Flattened dictionary: {len(nested_dict)} keys -> {len(result)} keys")
+
+    return result
+
+
+@overload
+def flatten_records(
+    records: Iterable[Mapping[str, JSONValue]],
+    *,
+    separator: str = ...,
+    flatten_lists: bool = ...,
+    key_pool: KeyInternPool | None = ...,
+    as_dataframe: Literal[False] = ...,
+) -> dict[str, list[JSONValue]]: ...
+
+
+@overload
+def flatten_records(
+    records: Iterable[Mapping[str, JSONValue]],
+    *,
+    separator: str = ...,
+    flatten_lists: bool = ...,
+    key_pool: KeyInternPool | None = ...,
+    as_dataframe: Literal[True],
+) -> "pd.DataFrame": ...
+
+
+def flatten_records(
+    records: Iterable[Mapping[str, JSONValue]],
+    *,
+    separator: str = ".",
+    flatten_lists: bool = False,
+    key_pool: KeyInternPool | None = None,
+    as_dataframe: bool = False,
+) -> "dict[str, list[JSONValue]] | pd.DataFrame":
+    """Flatten a batch of records into columns.
+
+    Each record is flattened as by :func:`flatten_dict`, but its values are
+    appended straight to one list per flattened key instead of building a
+    dictionary per record. Columns are shared by all records; a record
+    without a key gets None in that column.
+
+    Parameters
+    ----------
+    records : Iterable[Mapping[str, JSONValue]]
+        Records to flatten; consumed once, so generators are accepted
+    separator : str
+        Separator for keys
+    flatten_lists : bool
+        Whether to flatten lists as well, see :func:`flatten_dict`
+    key_pool : KeyInternPool | None
+        Pool to take keys from, which also saves building the key strings
+        of every record
+    as_dataframe : bool
+        Return a :class:`pandas.DataFrame` instead of a dictionary of lists.
+        pandas is only imported in this case
+
+    Returns
+    -------
+    dict[str, list[JSONValue]] | pd.DataFrame
+        Columns in order of first appearance, each as long as the number of
+        records
+
+    Examples
+    --------
+    >>> flatten_records([{"a": {"b": 1}}, {"a": {"b": 2}, "c": 3}])
+    {"a.b": [1, 2], "c": [None, 3]}
+    """
+    logger.debug(
+        f"Flattening records into columns, separator={separator!r}, "
+        f"flatten_lists={flatten_lists}, as_dataframe={as_dataframe}"
     )
 
-    items: list[tuple[str, JSONValue]] = []
+    columns: dict[str, list[JSONValue]] = {}
+    count = 0
+    for count, record in enumerate(records, start=1):
+        row = count - 1
+        for key, value in iter_flat_items(
+            record,
+            separator=separator,
+            prefix="",
+            flatten_lists=flatten_lists,
+            key_pool=key_pool,
+        ):
+            column = columns.get(key)
+            if column is None:
+                column = columns[key] = [None] * row
+            elif len(column) < row:
+                # この列を持たなかったレコードの分をNoneで埋める
+                column.extend([None] * (row - len(column)))
+            elif len(column) > row:
+                # 同じレコード内でキーが重複した場合は後の値で上書きする
+                column[row] = value
+                continue
+            column.append(value)
+
+    for column in columns.values():
+        column.extend([None] * (count - len(column)))
+
+    logger.debug(f"Flattened {count} records into {len(columns)} columns")
 
-    for key, value in nested_dict.items():
-        new_key = f"{prefix}{separator}{key}" if prefix else key
-        logger.debug(f"Processing key: {key!r} -> {new_key!r}")
+    if as_dataframe:
+        import pandas as pd  # noqa: PLC0415
 
-        if isinstance(value, dict):
-            logger.debug(f"Key {key!r} contains nested dict with {len(value)} keys")
-            items.extend(
-                flatten_dict(value, separator=separator, prefix=new_key).items()
+        return pd.DataFrame(columns)
+    return columns
+
+
+def iter_flat_items(
+    nested_dict: Mapping[str, JSONValue],
+    *,
+    separator: str = ".",
+    prefix: str = "",
+    flatten_lists: bool = False,
+    key_pool: KeyInternPool | None = None,
+) -> Iterator[tuple[str, JSONValue]]:
+    """Lazily yield the items of a flattened dictionary.
+
+    This is the generator behind :func:`flatten_dict`; use it directly to
+    stream flattened items without building the result dictionary.
+
+    Parameters
+    ----------
+    nested_dict : Mapping[str, JSONValue]
+        Dictionary to flatten
+    separator : str
+        Separator for keys
+    prefix : str
+        Prefix for all keys
+    flatten_lists : bool
+        Whether to flatten lists as well, see :func:`flatten_dict`
+    key_pool : KeyInternPool | None
+        Pool to take keys from, see :func:`flatten_dict`
+
+    Yields
+    ------
+    tuple[str, JSONValue]
+        Flattened key and leaf value, in depth-first order
+    """
+    # 各階層の(キーの接頭辞, 未処理の要素のイテレータ)を積むスタック
+    stack: list[tuple[str, Iterator[tuple[str | int, JSONValue]]]] = [
+        (prefix, iter(nested_dict.items()))
+    ]
+
+    while stack:
+        parent, entries = stack[-1]
+        for key, value in entries:
+            if key_pool is not None:
+                new_key = key_pool.join(parent, key, separator)
+            else:
+                new_key = f"{parent}{separator}{key}" if parent else str(key)
+
+            if isinstance(value, dict):
+                stack.append((new_key, iter(value.items())))
+                break
+            if flatten_lists and isinstance(value, list):
+                stack.append((new_key, enumerate(value)))
+                break
+            yield new_key, value
+        else:
+            # この階層の要素を処理し終えたので親の階層に戻る
+            stack.pop()
+
+
+def diff_dicts(
+    old: Mapping[str, JSONValue],
+    new: Mapping[str, JSONValue],
+    *,
+    separator: str = ".",
+    flatten_lists: bool = False,
+) -> DictPatch:
+    """Compute the changes turning ``old`` into ``new``.
+
+    Both documents are walked together and only differing paths are
+    recorded, using the same keys as :func:`flatten_dict`. A subtree that
+    exists on one side only is recorded once at its root rather than leaf
+    by leaf. Values are compared by type as well, also inside lists, so
+    ``1``, ``True`` and ``1.0`` are different values. Subtrees that are
+    the same object on both sides, as is common when a document is updated
+    by copying only the modified path, are skipped without being walked.
+
+    Parameters
+    ----------
+    old : Mapping[str, JSONValue]
+        Original document
+    new : Mapping[str, JSONValue]
+        Updated document
+    separator : str
+        Separator for paths
+    flatten_lists : bool
+        Whether to compare lists of equal length element by element. Lists
+        are otherwise compared as values, as are lists whose length changed
+
+    Returns
+    -------
+    DictPatch
+        Added and changed paths with their new values, and removed paths
+
+    Raises
+    ------
+    ValueError
+        If a key contains the separator, which would make paths ambiguous
+
+    Examples
+    --------
+    >>> diff_dicts({"a": {"b": 1, "c": 2}}, {"a": {"b": 1, "c": 3}, "d": 4})
+    {"added": {"d": 4}, "changed": {"a.c": 3}, "removed": []}
+    """
+    logger.debug(
+        f"Diffing dictionaries with {len(old)} and {len(new)} keys, "
+        f"separator={separator!r}, flatten_lists={flatten_lists}"
+    )
+
+    patch: DictPatch = {"added": {}, "changed": {}, "removed": []}
+    # (パス, 変更前のコンテナ, 変更後のコンテナ)
+    stack: list[tuple[str, Any, Any]] = [("", old, new)]
+
+    while stack:
+        parent, old_node, new_node = stack.pop()
+        if isinstance(old_node, list):
+            pairs: Iterable[tuple[str | int, Any, Any]] = (
+                (index, old_value, new_node[index])
+                for index, old_value in enumerate(old_node)
             )
         else:
-            items.append((new_key, value))
+            for key in new_node:
+                if key not in old_node:
+                    path = _join_path(parent, key, separator)
+                    patch["added"][path] = new_node[key]
+            for key in old_node:
+                if key not in new_node:
+                    patch["removed"].append(_join_path(parent, key, separator))
+            pairs = (
+                (key, old_value, new_node[key])
+                for key, old_value in old_node.items()
+                if key in new_node
+            )
 
-    result = dict(items)
-    logger.debug(f"Flattened dictionary: {len(nested_dict)} keys -> {len(result)} keys")
+        nested: list[tuple[str, Any, Any]] = []
+        for key, old_value, new_value in pairs:
+            # 同一オブジェクトの部分木は走査せずに打ち切る
+            if old_value is new_value:
+                continue
+            path = _join_path(parent, key, separator)
+            if _walkable_pair(old_value, new_value, flatten_lists=flatten_lists):
+                nested.append((path, old_value, new_value))
+            elif not _json_equal(old_value, new_value):
+                patch["changed"][path] = new_value
+        # 文書の順序で処理されるよう、逆順に積む
+        stack.extend(reversed(nested))
+
+    logger.debug(
+        f"Diff: {len(patch['added'])} added, {len(patch['changed'])} changed, "
+        f"{len(patch['removed'])} removed"
+    )
+
+    return patch
+
+
+def apply_patch(
+    document: Mapping[str, JSONValue],
+    patch: DictPatch,
+    *,
+    separator: str = ".",
+) -> dict[str, JSONValue]:
+    """Apply a patch computed by :func:`diff_dicts`.
+
+    The document is not modified. Only the containers along patched paths
+    are copied; all other subtrees are shared with ``document``.
+
+    Parameters
+    ----------
+    document : Mapping[str, JSONValue]
+        Document to patch, normally the ``old`` side of the diff
+    patch : DictPatch
+        Changes to apply
+    separator : str
+        Separator used for the patch's paths
+
+    Returns
+    -------
+    dict[str, JSONValue]
+        Patched document
+
+    Raises
+    ------
+    ValueError
+        If the patch does not apply: a removed or changed path does not
+        exist, or an added path already exists
+
+    Examples
+    --------
+    >>> old = {"a": {"b": 1}, "c": 2}
+    >>> apply_patch(old, diff_dicts(old, {"a": {"b": 3}}))
+    {"a": {"b": 3}}
+    """
+    logger.debug(
+        f"Applying patch: {len(patch['added'])} added, "
+        f"{len(patch['changed'])} changed, {len(patch['removed'])} removed"
+    )
+
+    root: dict[str, Any] = dict(document)
+    # コピー済みのコンテナ(idの再利用を防ぐためオブジェクトも保持する)
+    copied: dict[int, Any] = {id(root): root}
+
+    for path in patch["removed"]:
+        container, segment = _patch_target(root, path, separator, copied)
+        if segment not in _container_keys(container):
+            _reject_patch(f"{path!r} does not exist")
+        del container[segment]
+    for path, value in patch["changed"].items():
+        container, segment = _patch_target(root, path, separator, copied)
+        if segment not in _container_keys(container):
+            _reject_patch(f"{path!r} does not exist")
+        container[segment] = value
+    for path, value in patch["added"].items():
+        container, segment = _patch_target(root, path, separator, copied)
+        if segment in _container_keys(container):
+            _reject_patch(f"{path!r} already exists")
+        container[segment] = value
+
+    logger.debug(f"Patched document has {len(root)} top-level keys")
+
+    return root
+
+
+def _walkable_pair(old_value: Any, new_value: Any, *, flatten_lists: bool) -> bool:
+    """Return whether two values are containers to be diffed child by child."""
+    if isinstance(old_value, dict) and isinstance(new_value, dict):
+        return True
+    return (
+        flatten_lists
+        and isinstance(old_value, list)
+        and isinstance(new_value, list)
+        and len(old_value) == len(new_value)
+    )
+
+
+def _json_equal(old_value: Any, new_value: Any) -> bool:
+    """Compare JSON values, treating values of different types as different.
+
+    ``==`` considers ``1``, ``True`` and ``1.0`` equal, also inside lists
+    and dictionaries, so nested values are compared type by type.
+    """
+    if old_value is new_value:
+        return True
+    if type(old_value) is not type(new_value):
+        return False
+    if isinstance(old_value, dict):
+        return old_value.keys() == new_value.keys() and all(
+            _json_equal(value, new_value[key]) for key, value in old_value.items()
+        )
+    if isinstance(old_value, list):
+        return len(old_value) == len(new_value) and all(
+            map(_json_equal, old_value, new_value)
+        )
+    return bool(old_value == new_value)
+
+
+def _join_path(parent: str, key: str | int, separator: str) -> str:
+    """Join a key onto a path as flatten_dict does, rejecting ambiguous keys."""
+    if isinstance(key, str) and separator in key:
+        logger.error(f"Key {key!r} contains separator {separator!r}")
+        raise ValueError(
+            f"Key {key!r} contains the separator {separator!r}; "
+            "choose a different separator"
+        )
+    return f"{parent}{separator}{key}" if parent else str(key)
+
+
+def _patch_target(
+    root: dict[str, Any],
+    path: str,
+    separator: str,
+    copied: dict[int, Any],
+) -> tuple[Any, str | int]:
+    """Return the copied parent container of ``path`` and the last segment."""
+    *parents, last = path.split(separator)
+    node: Any = root
+    for segment in parents:
+        key = _container_segment(node, segment)
+        if key not in _container_keys(node):
+            _reject_patch(f"parent of {path!r} does not exist")
+        child = node[key]
+        if not isinstance(child, dict | list):
+            _reject_patch(f"parent of {path!r} does not exist")
+        if id(child) not in copied:
+            # 元の文書を変更しないよう、パス上のコンテナだけをコピーする
+            child = dict(child) if isinstance(child, dict) else list(child)
+            node[key] = child
+            copied[id(child)] = child
+        node = child
+    return node, _container_segment(node, last)
+
+
+def _container_segment(container: Any, segment: str) -> str | int:
+    """Convert a path segment to a list index when the container is a list."""
+    if isinstance(container, list) and segment.isascii() and segment.isdigit():
+        return int(segment)
+    return segment
+
+
+def _container_keys(container: Any) -> Any:
+    """Return an object supporting ``in`` for the container's keys."""
+    return range(len(container)) if isinstance(container, list) else container
+
+
+def _reject_patch(reason: str) -> NoReturn:
+    """Raise the error for a patch that does not apply."""
+    logger.error(f"Patch does not apply: {reason}")
+    raise ValueError(f"Patch does not apply: {reason}")
+
+
+def unflatten_dict(
+    flat_dict: Mapping[str, JSONValue],
+    *,
+    separator: str = ".",
+    lists: bool = False,
+    on_conflict: KeyConflictPolicy = "error",
+) -> dict[str, JSONValue]:
+    """Rebuild a nested dictionary from flattened keys.
+
+    This is the inverse of :func:`flatten_dict`. Splitting a key is cached,
+    so batches of records sharing the same keys split each key only once.
+
+    Parameters
+    ----------
+    flat_dict : Mapping[str, JSONValue]
+        Dictionary with flattened keys
+    separator : str
+        Separator used in the keys
+    lists : bool
+        Whether to turn nested dictionaries whose keys are exactly
+        ``"0"`` to ``"n-1"`` back into lists, inverting
+        ``flatten_dict(..., flatten_lists=True)``
+    on_conflict : KeyConflictPolicy
+        What to do when one key is a prefix of another, e.g. ``"a"`` and
+        ``"a.b"``: ``"error"`` raises, ``"overwrite"`` lets the later key
+        win and ``"skip"`` keeps the earlier one
+
+    Returns
+    -------
+    dict[str, JSONValue]
+        Nested dictionary
+
+    Raises
+    ------
+    ValueError
+        If separator is empty, or if keys conflict and ``on_conflict`` is
+        ``"error"``
+
+    Examples
+    --------
+    >>> unflatten_dict({"a.b": 1, "a.c": 2})
+    {"a": {"b": 1, "c": 2}}
+    >>> unflatten_dict({"a.0": 1, "a.1.b": 2}, lists=True)
+    {"a": [1, {"b": 2}]}
+    """
+    logger.debug(
+        f"Unflattening dictionary with {len(flat_dict)} keys, "
+        f"separator={separator!r}, lists={lists}, on_conflict={on_conflict!r}"
+    )
+
+    if not separator:
+        logger.error("Empty separator provided")
+        raise ValueError("separator must not be empty")
+
+    result: dict[str, JSONValue] = {}
+    # 作成した中間辞書と、その親・キー(リストへの変換に使用)
+    containers: list[tuple[dict[str, JSONValue], dict[str, JSONValue], str]] = []
+    # 値として渡された辞書と区別するため、作成した中間辞書のidを記録
+    created: set[int] = set()
+
+    for flat_key, value in flat_dict.items():
+        *parents, leaf = _split_key(flat_key, separator)
+        node = result
+        for segment in parents:
+            child = node.get(segment)
+            if id(child) not in created:
+                if segment in node and not _overwrites(on_conflict, flat_key):
+                    break
+                child = {}
+                node[segment] = child
+                containers.append((child, node, segment))
+                created.add(id(child))
+            node = cast("dict[str, JSONValue]", child)
+        else:
+            if leaf not in node or _overwrites(on_conflict, flat_key):
+                node[leaf] = value
+
+    if lists:
+        # 子は親より後に作成されるため、逆順に処理すると子から先に変換される
+        for container, parent, key in reversed(containers):
+            if parent.get(key) is container and _is_index_keyed(container):
+                parent[key] = [container[str(i)] for i in range(len(container))]
+
+    logger.debug(
+        f"Unflattened dictionary: {len(flat_dict)} keys -> {len(result)} top-level keys"
+    )
 
     return result
+
+
+@lru_cache(maxsize=KEY_SPLIT_CACHE_SIZE)
+def _split_key(key: str, separator: str) -> tuple[str, ...]:
+    """Split a flattened key into its segments."""
+    return tuple(key.split(separator))
+
+
+def _overwrites(on_conflict: KeyConflictPolicy, flat_key: str) -> bool:
+    """Return whether a conflicting key replaces the existing entry."""
+    if on_conflict == "error":
+        logger.error(f"Conflicting flattened key: {flat_key!r}")
+        raise ValueError(f"Key {flat_key!r} conflicts with another key")
+    return on_conflict == "overwrite"
+
+
+def _is_index_keyed(container: Mapping[str, JSONValue]) -> bool:
+    """Return whether the keys are exactly ``"0"`` to ``"n-1"``."""
+    return bool(container) and all(str(i) in container for i in range(len(container)))
@@ -0,0 +1,259 @@
+"""Incremental reading of large JSON documents."""
+
+import json
+import re
+from collections.abc import Iterator
+from pathlib import Path
+from typing import NoReturn, TextIO
+
+from ..types import JSONValue
+from .logging_config import get_logger
+
+# モジュールレベルのロガー
+logger = get_logger(__name__)
+
+# 1回の読み込みで読む文字数
+DEFAULT_BUFFER_SIZE = 64 * 1024
+
+# デコードエラーがこの文字数以内でバッファ末尾に近い場合は、値の途中で切れたとみなす
+# (リテラル"-Infinity"やサロゲートペアのエスケープが収まる長さ)
+_TRUNCATION_MARGIN = 16
+
+# 数値の続きになり得る文字
+_NUMBER_CHARS = frozenset("0123456789.eE+-")
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+def iter_json_array(
+    filepath: str | Path,
+    *,
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+) -> Iterator[JSONValue]:
+    """Lazily yield the elements of a top-level JSON array.
+
+    The file is read in blocks of ``buffer_size`` characters and each element
+    is decoded with :meth:`json.JSONDecoder.raw_decode` as soon as it is
+    complete, so memory use is bounded by the largest single element rather
+    than by the file size.
+
+    Parameters
+    ----------
+    filepath : str | Path
+        Path to a JSON file whose top-level value is an array
+    buffer_size : int
+        Number of characters read at a time
+
+    Yields
+    ------
+    JSONValue
+        Array elements in file order
+
+    Raises
+    ------
+    FileNotFoundError
+        If file doesn't exist
+    ValueError
+        If buffer_size is not positive, or if the file is not a valid JSON
+        array. Elements before the error have already been yielded
+
+    Examples
+    --------
+    >>> for item in iter_json_array("items.json"):
+    ...     process(item)
+    """
+    path = _check_stream_args(filepath, buffer_size)
+    return _iter_array(path, buffer_size)
+
+
+def _iter_array(path: Path, buffer_size: int) -> Iterator[JSONValue]:
+    with _StreamReader(path, buffer_size) as reader:
+        reader.expect("[")
+        count = 0
+        if not reader.consume("]"):
+            while True:
+                yield reader.decode_value()
+                count += 1
+                if reader.consume("]"):
+                    break
+                reader.expect(",")
+        reader.expect_end()
+        logger.debug(f"Streamed {count} array elements from {reader.path}")
+
+
+def iter_json_object(
+    filepath: str | Path,
+    *,
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+) -> Iterator[tuple[str, JSONValue]]:
+    """Lazily yield the members of a top-level JSON object.
+
+    Works like :func:`iter_json_array` for files holding one large object,
+    such as a mapping from IDs to records.
+
+    Parameters
+    ----------
+    filepath : str | Path
+        Path to a JSON file whose top-level value is an object
+    buffer_size : int
+        Number of characters read at a time
+
+    Yields
+    ------
+    tuple[str, JSONValue]
+        Member names and values in file order
+
+    Raises
+    ------
+    FileNotFoundError
+        If file doesn't exist
+    ValueError
+        If buffer_size is not positive, or if the file is not a valid JSON
+        object. Members before the error have already been yielded
+    """
+    path = _check_stream_args(filepath, buffer_size)
+    return _iter_object(path, buffer_size)
+
+
+def _iter_object(path: Path, buffer_size: int) -> Iterator[tuple[str, JSONValue]]:
+    with _StreamReader(path, buffer_size) as reader:
+        reader.expect("{")
+        count = 0
+        if not reader.consume("}"):
+            while True:
+                key = reader.decode_value()
+                if not isinstance(key, str):
+                    reader.fail("expected a string member name")
+                reader.expect(":")
+                yield key, reader.decode_value()
+                count += 1
+                if reader.consume("}"):
+                    break
+                reader.expect(",")
+        reader.expect_end()
+        logger.debug(f"Streamed {count} object members from {reader.path}")
+
+
+class _StreamReader:
+    """Buffered cursor over a text file for incremental JSON decoding."""
+
+    def __init__(self, path: Path, buffer_size: int) -> None:
+        self.path = path
+        self._file: TextIO = path.open("r", encoding="utf-8")
+        self._buffer_size = buffer_size
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+        # バッファ先頭より前に読み捨てた文字数(エラー位置の報告用)
+        self._offset = 0
+
+    def __enter__(self) -> "_StreamReader":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._file.close()
+
+    def decode_value(self) -> JSONValue:
+        """Decode the next complete JSON value."""
+        self._skip_whitespace()
+        while True:
+            try:
+                decoded: tuple[JSONValue, int] = self._decoder.raw_decode(
+                    self._buffer, self._pos
+                )
+            except json.JSONDecodeError as e:
+                if self._eof or not self._is_truncation(e):
+                    self.fail(e.msg, self._offset + e.pos)
+                # 値が途中で切れているので読み足して再試行する
+                self._read_more()
+                continue
+            value, end = decoded
+            if not self._eof and self._may_continue(value, end):
+                self._read_more()
+                continue
+            self._pos = end
+            self._compact()
+            return value
+
+    def consume(self, char: str) -> bool:
+        """Skip whitespace and consume ``char`` if it comes next."""
+        self._skip_whitespace()
+        if self._pos < len(self._buffer) and self._buffer[self._pos] == char:
+            self._pos += 1
+            return True
+        return False
+
+    def expect(self, char: str) -> None:
+        """Consume ``char`` or fail."""
+        if not self.consume(char):
+            self.fail(f"expected {char!r}")
+
+    def expect_end(self) -> None:
+        """Fail unless only whitespace remains."""
+        self._skip_whitespace()
+        if self._pos < len(self._buffer):
+            self.fail("extra data after top-level value")
+
+    def fail(self, reason: str, position: int | None = None) -> NoReturn:
+        """Raise ValueError for malformed input."""
+        if position is None:
+            position = self._offset + self._pos
+        logger.error(f"Failed to parse JSON stream from {self.path}: {reason}")
+        raise ValueError(
+            f"Invalid JSON in {self.path}: {reason} at character {position}"
+        )
+
+    def _may_continue(self, value: JSONValue, end: int) -> bool:
+        """Return whether a decoded number may be the prefix of a longer one."""
+        # 数値は途中で切れていても("12"や"1.5e"の"1.5")デコードに成功してしまう
+        if not isinstance(value, int | float) or isinstance(value, bool):
+            return False
+        return end == len(self._buffer) or self._buffer[end] in _NUMBER_CHARS
+
+    def _is_truncation(self, error: json.JSONDecodeError) -> bool:
+        """Return whether a decode error may only mean the value is incomplete."""
+        return (
+            error.msg.startswith("Unterminated string")
+            or error.pos >= len(self._buffer) - _TRUNCATION_MARGIN
+        )
+
+    def _skip_whitespace(self) -> None:
+        while True:
+            match = _WHITESPACE.match(self._buffer, self._pos)
+            if match:
+                self._pos = match.end()
+            if self._pos < len(self._buffer) or self._eof:
+                return
+            self._read_more()
+
+    def _read_more(self) -> None:
+        # 大きな値では読み込み量を倍々に増やし、再デコードの回数を抑える
+        size = max(self._buffer_size, len(self._buffer) - self._pos)
+        block = self._file.read(size)
+        if not block:
+            self._eof = True
+            return
+        self._buffer += block
+
+    def _compact(self) -> None:
+        # 消費済みの部分を捨ててメモリ使用量を一定に保つ
+        if self._pos >= self._buffer_size:
+            self._offset += self._pos
+            self._buffer = self._buffer[self._pos :]
+            self._pos = 0
+
+
+def _check_stream_args(filepath: str | Path, buffer_size: int) -> Path:
+    """Validate arguments before the generator starts."""
+    path = Path(filepath)
+    logger.debug(f"Streaming JSON from: {path} (buffer_size={buffer_size})")
+
+    if buffer_size <= 0:
+        logger.error(f"Invalid buffer_size: {buffer_size}")
+        raise ValueError(f"buffer_size must be positive, got {buffer_size}")
+    if not path.exists():
+        logger.error(f"File not found: {path}")
+        raise FileNotFoundError(f"File not found: {path}")
+
+    return path
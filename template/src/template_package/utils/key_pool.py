@@ -0,0 +1,102 @@
+"""Interning of flattened dictionary keys."""
+
+from .logging_config import get_logger
+
+# モジュールレベルのロガー
+logger = get_logger(__name__)
+
+
+class KeyInternPool:
+    """Pool sharing one string object per distinct flattened key.
+
+    Flattening a million records with the same shape otherwise builds a
+    million equal copies of every key such as ``"a.b.c"``. Passing one pool
+    to :func:`~template_package.utils.helpers.flatten_dict` or
+    :func:`~template_package.utils.helpers.flatten_records` makes every
+    record reuse the pooled keys. Joined keys are cached per parent key and
+    segment, so a key already in the pool is found without building its
+    string again.
+
+    Unlike :func:`sys.intern`, the pool is owned by the caller; call
+    :meth:`clear` or drop the pool to release keys of high-cardinality
+    data.
+
+    Examples
+    --------
+    >>> pool = KeyInternPool()
+    >>> first = pool.join("a", "b", ".")
+    >>> first is pool.join("a", "b", ".")
+    True
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty pool."""
+        self._strings: dict[str, str] = {}
+        # 区切り文字 -> 親キー -> セグメント -> 結合済みキー
+        self._joined: dict[str, dict[str, dict[str | int, str]]] = {}
+
+    def intern(self, key: str) -> str:
+        """Return the pooled string equal to ``key``, adding it if new.
+
+        Parameters
+        ----------
+        key : str
+            Key to intern
+
+        Returns
+        -------
+        str
+            Shared string object equal to ``key``
+        """
+        return self._strings.setdefault(key, key)
+
+    def join(self, parent: str, segment: str | int, separator: str) -> str:
+        """Return the pooled key for ``segment`` below ``parent``.
+
+        Parameters
+        ----------
+        parent : str
+            Flattened key of the parent, or an empty string at the top level
+        segment : str | int
+            Dictionary key or list index
+        separator : str
+            Separator between key segments
+
+        Returns
+        -------
+        str
+            Shared string ``f"{parent}{separator}{segment}"``, or the
+            segment alone when ``parent`` is empty
+        """
+        table = self._joined.get(separator)
+        if table is None:
+            table = self._joined[separator] = {}
+        children = table.get(parent)
+        if children is None:
+            children = table[parent] = {}
+
+        key = children.get(segment)
+        if key is None:
+            key = self.intern(
+                f"{parent}{separator}{segment}" if parent else str(segment)
+            )
+            children[segment] = key
+        return key
+
+    def clear(self) -> None:
+        """Remove every key from the pool."""
+        logger.debug(f"Clearing key pool with {len(self._strings)} keys")
+        self._strings.clear()
+        self._joined.clear()
+
+    def __len__(self) -> int:
+        """Return the number of distinct pooled keys."""
+        return len(self._strings)
+
+    def __contains__(self, key: object) -> bool:
+        """Return whether ``key`` is pooled."""
+        return key in self._strings
+
+    def __repr__(self) -> str:
+        """Return string representation."""
+        return f"KeyInternPool(keys={len(self)})"
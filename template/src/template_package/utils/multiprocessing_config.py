@@ -0,0 +1,31 @@
+"""Start method policy for worker processes."""
+
+import multiprocessing
+from multiprocessing.context import BaseContext
+
+# ワーカーの起動方式。forkはスレッドを持つ親プロセスから子を作るためデッドロックし得る
+DEFAULT_START_METHOD = (
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+
+def default_mp_context() -> BaseContext:
+    """Return the multiprocessing context for ``DEFAULT_START_METHOD``.
+
+    Every process pool of the package is started with this context rather
+    than the platform default, as forking a parent whose threads may hold
+    locks can deadlock the child. Functions submitted to such pools must
+    therefore be importable from a module.
+
+    Returns
+    -------
+    BaseContext
+        Context using ``"forkserver"`` where available, otherwise ``"spawn"``
+
+    Examples
+    --------
+    >>> with ProcessPoolExecutor(mp_context=default_mp_context()) as executor:
+    ...     executor.submit(len, "abc").result()
+    3
+    """
+    return multiprocessing.get_context(DEFAULT_START_METHOD)
@@ -0,0 +1,408 @@
+"""JSON Lines (NDJSON) reading and appending."""
+
+import json
+import os
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import pairwise
+from pathlib import Path
+from types import TracebackType
+from typing import TextIO
+
+from ..types import JSONValue
+from .logging_config import get_logger
+from .multiprocessing_config import default_mp_context
+
+# モジュールレベルのロガー
+logger = get_logger(__name__)
+
+# 書き込みバッファのサイズ(バイト)
+DEFAULT_WRITE_BUFFER_SIZE = 1024 * 1024
+
+# 並列読み込みで1つのワーカーに渡す範囲の目安(バイト)
+DEFAULT_PARALLEL_CHUNK_SIZE = 8 * 1024 * 1024
+
+# ワーカー1つあたりに先行投入する範囲の数
+PREFETCH_PER_WORKER = 2
+
+
+class NDJSONWriter:
+    """Buffered append-only writer of JSON Lines files.
+
+    Each record is written as one compact JSON document followed by a
+    newline at the end of the file, so appending costs O(1) regardless of
+    how many records the file already holds. Writes are buffered and only
+    reach the file on :meth:`flush`, :meth:`close` or when the buffer is
+    full.
+
+    Examples
+    --------
+    >>> with NDJSONWriter("events.ndjson") as writer:
+    ...     writer.write({"id": 1, "event": "start"})
+    ...     writer.write_many(more_events)
+    """
+
+    def __init__(
+        self,
+        filepath: str | Path,
+        *,
+        buffer_size: int = DEFAULT_WRITE_BUFFER_SIZE,
+        ensure_ascii: bool = False,
+    ) -> None:
+        """Open ``filepath`` for appending, creating it if necessary.
+
+        Parameters
+        ----------
+        filepath : str | Path
+            Path to the JSON Lines file
+        buffer_size : int
+            Size of the write buffer in bytes
+        ensure_ascii : bool
+            Whether to escape non-ASCII characters
+
+        Raises
+        ------
+        ValueError
+            If buffer_size is not positive
+        """
+        if buffer_size <= 0:
+            logger.error(f"Invalid buffer_size: {buffer_size}")
+            raise ValueError(f"buffer_size must be positive, got {buffer_size}")
+
+        self.path = Path(filepath)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._encoder = json.JSONEncoder(
+            ensure_ascii=ensure_ascii, separators=(",", ":")
+        )
+        self._file: TextIO | None = self.path.open(
+            "a", encoding="utf-8", buffering=buffer_size
+        )
+        self.written = 0
+        logger.debug(f"Opened {self.path} for appending (buffer_size={buffer_size})")
+
+    def write(self, record: JSONValue) -> None:
+        """Append one record.
+
+        Parameters
+        ----------
+        record : JSONValue
+            JSON-compatible value to append
+
+        Raises
+        ------
+        ValueError
+            If the writer is closed
+        TypeError
+            If the record is not JSON serializable
+        """
+        file = self._require_open()
+        file.write(self._encoder.encode(record) + "\n")
+        self.written += 1
+
+    def write_many(self, records: Iterable[JSONValue]) -> int:
+        """Append records from an iterable.
+
+        Parameters
+        ----------
+        records : Iterable[JSONValue]
+            JSON-compatible values to append
+
+        Returns
+        -------
+        int
+            Number of records appended
+        """
+        file = self._require_open()
+        encode = self._encoder.encode
+        count = 0
+        for record in records:
+            file.write(encode(record) + "\n")
+            count += 1
+        self.written += count
+        return count
+
+    def flush(self) -> None:
+        """Write buffered records to the file."""
+        self._require_open().flush()
+
+    def close(self) -> None:
+        """Flush and close the file; further writes raise ValueError."""
+        if self._file is None:
+            return
+        self._file.close()
+        self._file = None
+        logger.info(f"Appended {self.written} records to {self.path}")
+
+    def __enter__(self) -> "NDJSONWriter":
+        """Return self."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Close the writer."""
+        self.close()
+
+    def __repr__(self) -> str:
+        """Return string representation."""
+        state = "closed" if self._file is None else "open"
+        return f"NDJSONWriter({str(self.path)!r}, {state}, written={self.written})"
+
+    def _require_open(self) -> TextIO:
+        if self._file is None:
+            raise ValueError(f"NDJSONWriter for {self.path} is closed")
+        return self._file
+
+
+def append_ndjson(
+    records: Iterable[JSONValue],
+    filepath: str | Path,
+    *,
+    ensure_ascii: bool = False,
+) -> int:
+    """Append records to a JSON Lines file.
+
+    Parameters
+    ----------
+    records : Iterable[JSONValue]
+        JSON-compatible values to append
+    filepath : str | Path
+        Path to the JSON Lines file, created if it does not exist
+    ensure_ascii : bool
+        Whether to escape non-ASCII characters
+
+    Returns
+    -------
+    int
+        Number of records appended
+    """
+    with NDJSONWriter(filepath, ensure_ascii=ensure_ascii) as writer:
+        return writer.write_many(records)
+
+
+def iter_ndjson(filepath: str | Path) -> Iterator[JSONValue]:
+    """Lazily yield the records of a JSON Lines file.
+
+    The file is read line by line, so memory use does not depend on the
+    number of records. Blank lines are skipped.
+
+    Parameters
+    ----------
+    filepath : str | Path
+        Path to the JSON Lines file
+
+    Returns
+    -------
+    Iterator[JSONValue]
+        Records in file order
+
+    Raises
+    ------
+    FileNotFoundError
+        If file doesn't exist
+    ValueError
+        If a line is not valid JSON; the message includes the line number.
+        Records before that line have already been yielded
+
+    Examples
+    --------
+    >>> for record in iter_ndjson("events.ndjson"):
+    ...     handle(record)
+    """
+    path = Path(filepath)
+    logger.debug(f"Reading JSON Lines from: {path}")
+
+    if not path.exists():
+        logger.error(f"File not found: {path}")
+        raise FileNotFoundError(f"File not found: {path}")
+
+    return _iter_lines(path)
+
+
+def _iter_lines(path: Path) -> Iterator[JSONValue]:
+    """Decode a JSON Lines file line by line."""
+    decode = json.JSONDecoder().decode
+    count = 0
+    with path.open("r", encoding="utf-8") as f:
+        for line_number, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                record: JSONValue = decode(line)
+            except json.JSONDecodeError as e:
+                logger.error(f"Failed to parse line {line_number} of {path}: {e}")
+                raise ValueError(
+                    f"Invalid JSON in {path} at line {line_number}: {e}"
+                ) from e
+            count += 1
+            yield record
+    logger.debug(f"Read {count} records from {path}")
+
+
+def iter_ndjson_parallel(
+    filepath: str | Path,
+    *,
+    max_workers: int | None = None,
+    chunk_size: int = DEFAULT_PARALLEL_CHUNK_SIZE,
+) -> Iterator[JSONValue]:
+    """Yield the records of a JSON Lines file, parsing it in worker processes.
+
+    The file is split into byte ranges of about ``chunk_size`` bytes whose
+    boundaries are moved to the next line start, and the ranges are parsed
+    in a process pool. Records are yielded in file order; only
+    ``max_workers * PREFETCH_PER_WORKER`` ranges are parsed ahead of the
+    consumer, which bounds memory use. A file that fits in a single range,
+    or ``max_workers=1``, is parsed in the calling process.
+    Workers are started with
+    :func:`~template_package.utils.multiprocessing_config.default_mp_context`,
+    never by forking the possibly multi-threaded caller.
+
+    Parsed records are pickled back to the calling process, which costs
+    about as much as parsing them, so the speed-up needs several idle cores.
+
+    Parameters
+    ----------
+    filepath : str | Path
+        Path to the JSON Lines file
+    max_workers : int | None
+        Number of worker processes, defaults to the number of CPUs
+    chunk_size : int
+        Approximate number of bytes parsed per task
+
+    Returns
+    -------
+    Iterator[JSONValue]
+        Records in file order, the same as :func:`iter_ndjson` yields
+
+    Raises
+    ------
+    FileNotFoundError
+        If file doesn't exist
+    ValueError
+        If max_workers or chunk_size is not positive, or if a line is not
+        valid JSON; the message includes the byte offset of the line
+
+    Examples
+    --------
+    >>> for record in iter_ndjson_parallel("events.ndjson", max_workers=8):
+    ...     handle(record)
+    """
+    path = Path(filepath)
+    logger.debug(
+        f"Reading JSON Lines from: {path} in parallel "
+        f"(max_workers={max_workers}, chunk_size={chunk_size})"
+    )
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    if max_workers <= 0:
+        logger.error(f"Invalid max_workers: {max_workers}")
+        raise ValueError(f"max_workers must be positive, got {max_workers}")
+    if chunk_size <= 0:
+        logger.error(f"Invalid chunk_size: {chunk_size}")
+        raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+    if not path.exists():
+        logger.error(f"File not found: {path}")
+        raise FileNotFoundError(f"File not found: {path}")
+
+    ranges = _split_line_ranges(path, chunk_size)
+    if len(ranges) <= 1 or max_workers == 1:
+        return _iter_ranges_serial(path, ranges)
+    return _iter_ranges_parallel(path, ranges, max_workers)
+
+
+def load_ndjson_parallel(
+    filepath: str | Path,
+    *,
+    max_workers: int | None = None,
+    chunk_size: int = DEFAULT_PARALLEL_CHUNK_SIZE,
+) -> list[JSONValue]:
+    """Load all records of a JSON Lines file, parsing it in worker processes.
+
+    See :func:`iter_ndjson_parallel` for the parameters.
+
+    Returns
+    -------
+    list[JSONValue]
+        Records in file order
+    """
+    records = list(
+        iter_ndjson_parallel(filepath, max_workers=max_workers, chunk_size=chunk_size)
+    )
+    logger.info(f"Loaded {len(records)} records from {filepath}")
+    return records
+
+
+def _split_line_ranges(path: Path, chunk_size: int) -> list[tuple[int, int]]:
+    """Split a file into ``[start, end)`` byte ranges that begin at line starts."""
+    size = path.stat().st_size
+    boundaries = [0]
+    with path.open("rb") as f:
+        for target in range(chunk_size, size, chunk_size):
+            if target <= boundaries[-1]:
+                # 前の範囲の最後の行がこの位置を越えている
+                continue
+            # 目標位置を含む行の次の行頭に揃える
+            f.seek(target - 1)
+            f.readline()
+            boundary = f.tell()
+            if boundary >= size:
+                break
+            boundaries.append(boundary)
+    boundaries.append(size)
+    return [(start, end) for start, end in pairwise(boundaries) if end > start]
+
+
+def _iter_ranges_serial(
+    path: Path, ranges: list[tuple[int, int]]
+) -> Iterator[JSONValue]:
+    for start, end in ranges:
+        yield from _parse_line_range(str(path), start, end)
+
+
+def _iter_ranges_parallel(
+    path: Path, ranges: list[tuple[int, int]], max_workers: int
+) -> Iterator[JSONValue]:
+    logger.debug(f"Parsing {len(ranges)} ranges of {path} with {max_workers} workers")
+    pending = deque(ranges)
+    in_flight: deque[Future[list[JSONValue]]] = deque()
+    executor = ProcessPoolExecutor(
+        max_workers=max_workers, mp_context=default_mp_context()
+    )
+    try:
+        while pending or in_flight:
+            while pending and len(in_flight) < max_workers * PREFETCH_PER_WORKER:
+                start, end = pending.popleft()
+                in_flight.append(
+                    executor.submit(_parse_line_range, str(path), start, end)
+                )
+            # 完了順ではなく投入順に受け取り、ファイル順を保つ
+            yield from in_flight.popleft().result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _parse_line_range(filepath: str, start: int, end: int) -> list[JSONValue]:
+    """Worker entry point: decode the lines in ``[start, end)`` of a file."""
+    with Path(filepath).open("rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+
+    decode = json.JSONDecoder().decode
+    records: list[JSONValue] = []
+    position = start
+    for line in data.split(b"\n"):
+        if line.strip():
+            try:
+                records.append(decode(line.decode("utf-8")))
+            except (UnicodeDecodeError, json.JSONDecodeError) as e:
+                logger.error(f"Failed to parse line at byte {position} of {filepath}")
+                raise ValueError(
+                    f"Invalid JSON in {filepath} at byte {position}: {e}"
+                ) from e
+        position += len(line) + 1
+    return records
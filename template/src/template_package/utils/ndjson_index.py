@@ -0,0 +1,356 @@
+"""Sidecar byte-offset index for random access into JSON Lines files."""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Iterator
+from pathlib import Path
+from types import TracebackType
+from typing import BinaryIO
+
+from ..types import JSONValue
+from .logging_config import get_logger
+
+# モジュールレベルのロガー
+logger = get_logger(__name__)
+
+# オフセットはネイティブのバイト順で保存するため、バイト順をマジックに含める
+_MAGIC = b"NDJIDX2" + (b"L" if sys.byteorder == "little" else b"B")
+
+# マジック、索引済みのバイト数、レコード数、データファイルのデバイス番号と
+# inode番号、索引済み範囲の先頭と末尾のダイジェスト
+_HEADER = struct.Struct("=8sQQQQ8s")
+
+# ダイジェストに含める、索引済み範囲の先頭と末尾のバイト数
+_DIGEST_WINDOW = 256
+
+# 何も索引していない状態のダイジェスト
+_EMPTY_DIGEST = hashlib.blake2b(bytes(8), digest_size=8).digest()
+
+_OFFSET_SIZE = array("Q").itemsize
+
+
+class NDJSONIndex:
+    """Random access to the records of a JSON Lines file.
+
+    The byte offset of every record is kept in a sidecar file next to the
+    data file (``<name>.idx`` by default) and memory-mapped, so opening an
+    index does not load it into memory and looking up record ``n`` is a
+    single seek. The index is built in one pass the first time and
+    :meth:`refresh` only scans records appended since, which suits files
+    written with :class:`~template_package.utils.ndjson.NDJSONWriter`.
+    The sidecar records the device and inode of the data file and a digest
+    of the first and last bytes it covers, so an index of a file that was
+    replaced or rewritten is rebuilt rather than reused.
+
+    Records are numbered like :func:`~template_package.utils.ndjson.iter_ndjson`
+    yields them: blank lines are skipped. A final line without a trailing
+    newline is not indexed until it is terminated, as it may be a write
+    still in progress.
+
+    Examples
+    --------
+    >>> with NDJSONIndex("events.ndjson") as index:
+    ...     record = index[5_000_000]
+    ...     window = list(index.iter_range(100, 200))
+    """
+
+    def __init__(
+        self,
+        filepath: str | Path,
+        *,
+        index_path: str | Path | None = None,
+    ) -> None:
+        """Open the index of ``filepath``, building or updating it as needed.
+
+        Parameters
+        ----------
+        filepath : str | Path
+            Path to the JSON Lines file
+        index_path : str | Path | None
+            Path to the sidecar index, defaults to ``filepath`` with ``.idx``
+            appended
+
+        Raises
+        ------
+        FileNotFoundError
+            If the JSON Lines file doesn't exist
+        """
+        self.path = Path(filepath)
+        if not self.path.exists():
+            logger.error(f"File not found: {self.path}")
+            raise FileNotFoundError(f"File not found: {self.path}")
+
+        self.index_path = (
+            Path(index_path)
+            if index_path is not None
+            else self.path.with_name(self.path.name + ".idx")
+        )
+        self._file: BinaryIO = self.path.open("rb")
+        self._file_id = _file_id(os.fstat(self._file.fileno()))
+        self._decoder = json.JSONDecoder()
+        self._mmap: mmap.mmap | None = None
+        self._offsets: memoryview | None = None
+        self._indexed_size = 0
+        self._count = 0
+        self._digest = _EMPTY_DIGEST
+
+        if not self._load():
+            self._reset()
+        self.refresh()
+
+    def refresh(self) -> int:
+        """Index records appended to the file since the last refresh.
+
+        The index is rebuilt from scratch if the file was replaced by
+        another one, truncated, or its indexed bytes no longer match the
+        digest taken when they were indexed, i.e. it was rewritten.
+
+        Returns
+        -------
+        int
+            Number of newly indexed records
+        """
+        stat = self.path.stat()
+        if _file_id(stat) != self._file_id:
+            logger.warning(f"{self.path} was replaced, rebuilding its index")
+            self._reopen()
+            self._reset()
+        size = stat.st_size
+        if size < self._indexed_size or self._digest != self._digest_of(
+            self._indexed_size
+        ):
+            logger.warning(f"{self.path} was rewritten, rebuilding its index")
+            self._reset()
+        if size == self._indexed_size:
+            return 0
+
+        offsets, end = self._scan(self._indexed_size)
+        self._append(offsets, end)
+        logger.debug(
+            f"Indexed {len(offsets)} new records of {self.path} ({self._count} total)"
+        )
+        return len(offsets)
+
+    def offset(self, n: int) -> int:
+        """Return the byte offset of record ``n``.
+
+        Raises
+        ------
+        IndexError
+            If ``n`` is out of range
+        """
+        if n < 0:
+            n += self._count
+        if not 0 <= n < self._count or self._offsets is None:
+            raise IndexError(f"record index out of range: {n}")
+        offset: int = self._offsets[n]
+        return offset
+
+    def iter_range(self, start: int, stop: int | None = None) -> Iterator[JSONValue]:
+        """Yield records ``start`` up to, not including, ``stop``.
+
+        Parameters
+        ----------
+        start : int
+            Number of the first record
+        stop : int | None
+            Number after the last record, defaults to the end of the index
+
+        Returns
+        -------
+        Iterator[JSONValue]
+            Records in file order
+
+        Raises
+        ------
+        ValueError
+            If the range is negative or reversed
+        """
+        if stop is None:
+            stop = self._count
+        if start < 0 or stop < start:
+            logger.error(f"Invalid record range: {start}..{stop}")
+            raise ValueError(f"Invalid record range: {start}..{stop}")
+
+        stop = min(stop, self._count)
+        if start >= stop:
+            return iter(())
+        return self._iter_records(start, stop)
+
+    def close(self) -> None:
+        """Close the data file and unmap the index."""
+        self._unmap()
+        self._file.close()
+
+    def __getitem__(self, n: int) -> JSONValue:
+        """Return record ``n``; negative numbers count from the end.
+
+        Raises
+        ------
+        IndexError
+            If ``n`` is out of range
+        ValueError
+            If the record is not valid JSON
+        """
+        self._file.seek(self.offset(n))
+        return self._decode(self._file.readline(), n)
+
+    def __len__(self) -> int:
+        """Return the number of indexed records."""
+        return self._count
+
+    def __iter__(self) -> Iterator[JSONValue]:
+        """Iterate over all indexed records."""
+        return self.iter_range(0)
+
+    def __enter__(self) -> "NDJSONIndex":
+        """Return self."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Close the index."""
+        self.close()
+
+    def __repr__(self) -> str:
+        """Return string representation."""
+        return f"NDJSONIndex({str(self.path)!r}, records={self._count})"
+
+    def _iter_records(self, start: int, stop: int) -> Iterator[JSONValue]:
+        # 索引を引くのは先頭だけで、以降は順に読む(空行は読み飛ばす)。
+        # __getitem__と交互に呼ばれても続きから読めるよう、読み込み位置を保持する
+        position = self.offset(start)
+        n = start
+        while n < stop:
+            self._file.seek(position)
+            line = self._file.readline()
+            position = self._file.tell()
+            if not line.strip():
+                continue
+            yield self._decode(line, n)
+            n += 1
+
+    def _decode(self, line: bytes, n: int) -> JSONValue:
+        try:
+            value: JSONValue = self._decoder.decode(line.decode("utf-8"))
+        except (UnicodeDecodeError, json.JSONDecodeError) as e:
+            logger.error(f"Failed to parse record {n} of {self.path}: {e}")
+            raise ValueError(f"Invalid JSON in {self.path} at record {n}: {e}") from e
+        return value
+
+    def _digest_of(self, end: int) -> bytes:
+        """Return a digest of the first and last bytes up to ``end``."""
+        digest = hashlib.blake2b(end.to_bytes(8, "little"), digest_size=8)
+        self._file.seek(0)
+        digest.update(self._file.read(min(end, _DIGEST_WINDOW)))
+        tail_start = max(end - _DIGEST_WINDOW, _DIGEST_WINDOW)
+        if tail_start < end:
+            self._file.seek(tail_start)
+            digest.update(self._file.read(end - tail_start))
+        return digest.digest()
+
+    def _reopen(self) -> None:
+        """Open the file now found at the path in place of the old one."""
+        self._file.close()
+        self._file = self.path.open("rb")
+        self._file_id = _file_id(os.fstat(self._file.fileno()))
+
+    def _scan(self, start: int) -> tuple["array[int]", int]:
+        """Return offsets of complete, non-blank lines from ``start``, and the end."""
+        offsets = array("Q")
+        position = start
+        self._file.seek(start)
+        for line in self._file:
+            if not line.endswith(b"\n"):
+                break
+            if line.strip():
+                offsets.append(position)
+            position += len(line)
+        return offsets, position
+
+    def _load(self) -> bool:
+        """Map an existing sidecar; return False if it is missing or invalid."""
+        try:
+            with self.index_path.open("rb") as f:
+                header = f.read(_HEADER.size)
+        except FileNotFoundError:
+            return False
+        if len(header) < _HEADER.size:
+            return False
+        magic, indexed_size, count, device, inode, digest = _HEADER.unpack(header)
+        if magic != _MAGIC:
+            logger.warning(f"Ignoring incompatible index {self.index_path}")
+            return False
+        if (device, inode) != self._file_id:
+            logger.warning(f"Ignoring index {self.index_path} of another file")
+            return False
+        if self.index_path.stat().st_size < _HEADER.size + count * _OFFSET_SIZE:
+            logger.warning(f"Ignoring truncated index {self.index_path}")
+            return False
+        self._indexed_size = indexed_size
+        self._count = count
+        self._digest = digest
+        self._map()
+        return True
+
+    def _reset(self) -> None:
+        """Replace the sidecar with an empty index."""
+        self._unmap()
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        with self.index_path.open("wb") as f:
+            f.write(self._pack_header(0, 0, _EMPTY_DIGEST))
+        self._indexed_size = 0
+        self._count = 0
+        self._digest = _EMPTY_DIGEST
+        self._map()
+
+    def _append(self, offsets: "array[int]", end: int) -> None:
+        """Add offsets to the sidecar and record how far the file is indexed."""
+        self._unmap()
+        count = self._count + len(offsets)
+        digest = self._digest_of(end)
+        with self.index_path.open("r+b") as f:
+            # オフセットを先に書き、ヘッダーの更新で確定させる
+            f.seek(_HEADER.size + self._count * _OFFSET_SIZE)
+            f.write(offsets.tobytes())
+            f.truncate()
+            f.flush()
+            f.seek(0)
+            f.write(self._pack_header(end, count, digest))
+        self._indexed_size = end
+        self._count = count
+        self._digest = digest
+        self._map()
+
+    def _pack_header(self, indexed_size: int, count: int, digest: bytes) -> bytes:
+        return _HEADER.pack(_MAGIC, indexed_size, count, *self._file_id, digest)
+
+    def _map(self) -> None:
+        with self.index_path.open("rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        end = _HEADER.size + self._count * _OFFSET_SIZE
+        with memoryview(self._mmap) as view:
+            self._offsets = view[_HEADER.size : end].cast("Q")
+
+    def _unmap(self) -> None:
+        # マップを閉じる前にメモリビューを解放する必要がある
+        if self._offsets is not None:
+            self._offsets.release()
+            self._offsets = None
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+
+def _file_id(stat: os.stat_result) -> tuple[int, int]:
+    """Return the device and inode numbers identifying a file."""
+    return stat.st_dev, stat.st_ino
@@ -3,7 +3,7 @@
 import logging
 import os
 import tempfile
-from collections.abc import Iterator
+from collections.abc import Callable, Iterator
 from pathlib import Path
 from typing import Any
 
@@ -38,6 +38,16 @@ def sample_data() -> list[dict[str, Any]]:
     ]
 
 
+@pytest.fixture
+def make_items() -> Callable[[int], list[dict[str, Any]]]:
+    """Create a factory of ``count`` valid items for chunked processing tests."""
+
+    def _make_items(count: int) -> list[dict[str, Any]]:
+        return [{"id": i, "name": f"Item {i}", "value": i} for i in range(count)]
+
+    return _make_items
+
+
 @pytest.fixture
 def temp_dir() -> Iterator[Path]:
     """Create a temporary directory for testing."""
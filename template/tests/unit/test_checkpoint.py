@@ -0,0 +1,172 @@
+"""Unit tests for checkpoint module."""
+
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+from template_package.core.checkpoint import ChunkCheckpoint, compute_fingerprint
+from template_package.core.example import process_data
+
+
+class CountingProcessor:
+    """Processor that records how many items it processed."""
+
+    def __init__(self, *, fail_on_call: int | None = None) -> None:
+        self.calls = 0
+        self.processed_ids: list[int] = []
+        self.fail_on_call = fail_on_call
+
+    def process(self, data: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Double the value of each item, optionally failing on a given call."""
+        self.calls += 1
+        if self.fail_on_call is not None and self.calls == self.fail_on_call:
+            raise RuntimeError("simulated crash")
+        self.processed_ids.extend(item["id"] for item in data)
+        return [{**item, "value": item["value"] * 2} for item in data]
+
+
+class TestComputeFingerprint:
+    """Test compute_fingerprint function."""
+
+    def test_正常系_同じ入力なら同じフィンガープリント(
+        self, make_items: Callable[[int], list[dict[str, Any]]]
+    ) -> None:
+        """同じデータとチャンクサイズで同じ値になることを確認。"""
+        items = make_items(5)
+
+        assert compute_fingerprint(items, 2) == compute_fingerprint(make_items(5), 2)
+
+    def test_正常系_入力やチャンクサイズが変わると異なる(
+        self, make_items: Callable[[int], list[dict[str, Any]]]
+    ) -> None:
+        """データやチャンクサイズが変わると値が変わることを確認。"""
+        items = make_items(5)
+
+        assert compute_fingerprint(items, 2) != compute_fingerprint(items, 3)
+        assert compute_fingerprint(items, 2) != compute_fingerprint(make_items(6), 2)
+
+
+class TestChunkCheckpoint:
+    """Test ChunkCheckpoint class."""
+
+    def test_正常系_保存したチャンクを読み込める(
+        self, temp_dir: Path, make_items: Callable[[int], list[dict[str, Any]]]
+    ) -> None:
+        """保存したチャンクが完了扱いになり読み込めることを確認。"""
+        checkpoint = ChunkCheckpoint(temp_dir, fingerprint="job", total_chunks=2)
+        items = make_items(2)
+
+        checkpoint.save_chunk(0, items)
+
+        assert checkpoint.is_completed(0)
+        assert not checkpoint.is_completed(1)
+        assert checkpoint.load_chunk(0) == items
+        assert not list(temp_dir.glob("*.tmp"))
+
+    def test_正常系_再オープン時に完了済みチャンクを認識する(
+        self, temp_dir: Path, make_items: Callable[[int], list[dict[str, Any]]]
+    ) -> None:
+        """同じディレクトリを開き直すと完了済みチャンクが復元されることを確認。"""
+        ChunkCheckpoint(temp_dir, fingerprint="job", total_chunks=3).save_chunk(
+            1, make_items(1)
+        )
+
+        reopened = ChunkCheckpoint(temp_dir, fingerprint="job", total_chunks=3)
+
+        assert reopened.completed_indices == frozenset({1})
+
+    def test_異常系_異なるジョブのディレクトリでValueError(
+        self,
+        temp_dir: Path,
+    ) -> None:
+        """別ジョブのチェックポイントを開くとValueErrorが発生することを確認。"""
+        ChunkCheckpoint(temp_dir, fingerprint="job-a", total_chunks=1)
+
+        with pytest.raises(ValueError, match="different job"):
+            ChunkCheckpoint(temp_dir, fingerprint="job-b", total_chunks=1)
+
+    def test_異常系_未完了チャンクの読み込みでKeyError(self, temp_dir: Path) -> None:
+        """未完了チャンクを読み込むとKeyErrorが発生することを確認。"""
+        checkpoint = ChunkCheckpoint(temp_dir, fingerprint="job", total_chunks=1)
+
+        with pytest.raises(KeyError, match="has not been checkpointed"):
+            checkpoint.load_chunk(0)
+
+    def test_正常系_clearで全ファイルが削除される(
+        self, temp_dir: Path, make_items: Callable[[int], list[dict[str, Any]]]
+    ) -> None:
+        """clearでチェックポイントファイルが削除されることを確認。"""
+        checkpoint = ChunkCheckpoint(temp_dir, fingerprint="job", total_chunks=1)
+        checkpoint.save_chunk(0, make_items(1))
+
+        checkpoint.clear()
+
+        assert checkpoint.completed_indices == frozenset()
+        assert list(temp_dir.iterdir()) == []
+
+
+class TestProcessDataCheckpoint:
+    """Test process_data with checkpointing."""
+
+    def test_正常系_チャンク単位で処理しても結果は同じ(
+        self, make_items: Callable[[int], list[dict[str, Any]]]
+    ) -> None:
+        """chunk_size指定時も一括処理と同じ結果になることを確認。"""
+        items = make_items(10)
+
+        chunked = process_data(items, CountingProcessor(), chunk_size=3)
+        whole = process_data(items, CountingProcessor())
+
+        assert chunked == whole
+
+    def test_正常系_中断後の再実行で完了済みチャンクをスキップする(
+        self, temp_dir: Path, make_items: Callable[[int], list[dict[str, Any]]]
+    ) -> None:
+        """失敗後の再実行では未完了チャンクのみ処理されることを確認。"""
+        items = make_items(10)
+        crashing = CountingProcessor(fail_on_call=3)
+
+        with pytest.raises(RuntimeError, match="simulated crash"):
+            process_data(items, crashing, chunk_size=3, checkpoint_dir=temp_dir)
+
+        resumed = CountingProcessor()
+        result = process_data(items, resumed, chunk_size=3, checkpoint_dir=temp_dir)
+
+        assert resumed.processed_ids == [6, 7, 8, 9]
+        assert result == process_data(items, CountingProcessor())
+
+    def test_正常系_完了済みジョブの再実行では処理しない(
+        self, temp_dir: Path, make_items: Callable[[int], list[dict[str, Any]]]
+    ) -> None:
+        """全チャンク完了後の再実行ではプロセッサが呼ばれないことを確認。"""
+        items = make_items(4)
+        process_data(items, CountingProcessor(), checkpoint_dir=temp_dir)
+
+        rerun = CountingProcessor()
+        result = process_data(items, rerun, checkpoint_dir=temp_dir)
+
+        assert rerun.calls == 0
+        assert [item["value"] for item in result] == [0, 2, 4, 6]
+
+    def test_異常系_入力が変わるとValueError(
+        self, temp_dir: Path, make_items: Callable[[int], list[dict[str, Any]]]
+    ) -> None:
+        """同じディレクトリで別の入力を処理するとValueErrorになることを確認。"""
+        process_data(make_items(4), CountingProcessor(), checkpoint_dir=temp_dir)
+
+        with pytest.raises(ValueError, match="different job"):
+            process_data(make_items(5), CountingProcessor(), checkpoint_dir=temp_dir)
+
+    def test_正常系_ワーカー数を変えても再開できる(
+        self, temp_dir: Path, make_items: Callable[[int], list[dict[str, Any]]]
+    ) -> None:
+        """max_workersを変えて再実行しても同じジョブとして扱われることを確認。"""
+        items = make_items(40)
+        process_data(items, CountingProcessor(), max_workers=2, checkpoint_dir=temp_dir)
+
+        rerun = CountingProcessor()
+        result = process_data(items, rerun, checkpoint_dir=temp_dir)
+
+        assert rerun.calls == 0
+        assert result == process_data(items, CountingProcessor())
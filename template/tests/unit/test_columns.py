@@ -0,0 +1,40 @@
+"""Unit tests for item columns module."""
+
+from typing import Any
+
+import pytest
+from template_package.core.columns import extract_item_columns
+
+
+class TestExtractItemColumns:
+    """Test extract_item_columns function."""
+
+    def test_正常系_各フィールドの列に分割される(self) -> None:
+        """id、name、valueの列がアイテムの順に返ることを確認。"""
+        items: list[Any] = [
+            {"id": 1, "name": "a", "value": 10},
+            {"id": 2, "name": "b", "value": 20},
+        ]
+
+        assert extract_item_columns(items) == ([1, 2], ["a", "b"], [10, 20])
+
+    def test_エッジケース_空のリストは空の列になる(self) -> None:
+        """アイテムがない場合は空の列が返ることを確認。"""
+        assert extract_item_columns([]) == ([], [], [])
+
+    @pytest.mark.parametrize(
+        "item",
+        [
+            {"id": 1, "name": "a"},
+            {"id": 1, "name": "a", "value": 10, "extra": True},
+            {"id": 1, "name": "a", "other": 10},
+            {"id": 1, "name": 2, "value": 10},
+            {"id": 1.0, "name": "a", "value": 10},
+            {"id": 1, "name": "a", "value": True},
+        ],
+    )
+    def test_異常系_形式が異なるとNone(self, item: dict[str, Any]) -> None:
+        """キーや型がItemDictと一致しない場合にNoneが返ることを確認。"""
+        items: list[Any] = [{"id": 0, "name": "ok", "value": 0}, item]
+
+        assert extract_item_columns(items) is None
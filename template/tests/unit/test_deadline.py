@@ -0,0 +1,126 @@
+"""Unit tests for deadline module."""
+
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+from template_package.core.deadline import Deadline, ProcessingTimeoutError
+from template_package.core.example import process_data
+from template_package.types import ConfigDict
+
+
+class SleepingProcessor:
+    """Picklable processor that sleeps before returning its input."""
+
+    def __init__(self, seconds: float) -> None:
+        self.seconds = seconds
+
+    def process(self, data: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Sleep, then return the data unchanged."""
+        time.sleep(self.seconds)
+        return data
+
+
+class TestDeadline:
+    """Test Deadline class."""
+
+    def test_正常系_タイムアウト未指定なら期限切れにならない(self) -> None:
+        """timeoutがNoneの場合は期限が存在しないことを確認。"""
+        deadline = Deadline(None)
+
+        assert deadline.remaining() is None
+        assert not deadline.expired()
+
+    def test_正常系_期限を過ぎると期限切れになる(self) -> None:
+        """timeout経過後にexpiredがTrueになることを確認。"""
+        deadline = Deadline(0.01)
+        time.sleep(0.02)
+
+        assert deadline.expired()
+        assert deadline.remaining() == 0.0
+
+    def test_異常系_負のタイムアウトでValueError(self) -> None:
+        """負のtimeoutではValueErrorが発生することを確認。"""
+        with pytest.raises(ValueError, match="timeout must be non-negative"):
+            Deadline(-1.0)
+
+
+class TestProcessDataTimeout:
+    """Test process_data with a timeout."""
+
+    def test_正常系_期限内に終われば全件返される(
+        self, make_items: Callable[[int], list[dict[str, Any]]]
+    ) -> None:
+        """期限内に処理が終われば通常どおり結果が返ることを確認。"""
+        config = ConfigDict(name="fast", timeout=5.0)
+        items = make_items(5)
+
+        result = process_data(
+            items, SleepingProcessor(0), chunk_size=2, timeout=config["timeout"]
+        )
+
+        assert result == items
+
+    def test_異常系_期限切れで部分結果と未処理分が返される(
+        self, make_items: Callable[[int], list[dict[str, Any]]]
+    ) -> None:
+        """逐次処理で期限を過ぎると部分結果付きの例外になることを確認。"""
+        items = make_items(10)
+
+        with pytest.raises(ProcessingTimeoutError) as exc_info:
+            process_data(items, SleepingProcessor(0.05), chunk_size=2, timeout=0.07)
+
+        error = exc_info.value
+        completed = error.result["data"]
+        assert error.result["status"] == "pending"
+        assert 1 <= len(completed) < len(items)
+        assert completed + error.pending == items
+        assert error.result["processed_count"] == len(completed)
+        assert error.result["skipped_count"] == len(error.pending)
+        assert error.result["errors"][0]["code"] == "deadline_exceeded"
+        assert isinstance(error, TimeoutError)
+
+    def test_異常系_並列処理で実行中のチャンクも打ち切られる(
+        self, make_items: Callable[[int], list[dict[str, Any]]]
+    ) -> None:
+        """応答しないワーカーがあっても期限で制御が戻ることを確認。"""
+        items = make_items(4)
+        started = time.monotonic()
+
+        with pytest.raises(ProcessingTimeoutError) as exc_info:
+            process_data(
+                items,
+                SleepingProcessor(30),
+                chunk_size=1,
+                max_workers=2,
+                timeout=0.5,
+            )
+
+        assert time.monotonic() - started < 10
+        assert exc_info.value.pending == items
+        assert exc_info.value.result["data"] == []
+
+    def test_正常系_期限切れ後の再実行はチェックポイントから再開できる(
+        self, temp_dir: Path, make_items: Callable[[int], list[dict[str, Any]]]
+    ) -> None:
+        """期限切れまでに完了したチャンクが再実行で再利用されることを確認。"""
+        items = make_items(6)
+
+        with pytest.raises(ProcessingTimeoutError) as exc_info:
+            process_data(
+                items,
+                SleepingProcessor(0.05),
+                chunk_size=2,
+                checkpoint_dir=temp_dir,
+                timeout=0.07,
+            )
+        completed_count = len(exc_info.value.result["data"])
+
+        result = process_data(
+            items, SleepingProcessor(0), chunk_size=2, checkpoint_dir=temp_dir
+        )
+
+        assert completed_count > 0
+        assert result == items
@@ -0,0 +1,71 @@
+"""Unit tests for flattened view module."""
+
+import pytest
+from template_package.utils.flat_view import FlattenedView
+from template_package.utils.helpers import flatten_dict
+
+
+class TestFlattenedView:
+    """Test FlattenedView class."""
+
+    def test_正常系_フラットなキーでネストした値を参照できる(self) -> None:
+        """区切り文字で連結したキーで葉の値を取得できることを確認。"""
+        view = FlattenedView({"a": {"b": {"c": 1}}, "d": None})
+
+        assert view["a.b.c"] == 1
+        assert view["d"] is None
+        assert view.get("a.x", "missing") == "missing"
+
+    def test_正常系_flatten_dictと同じ内容になる(self) -> None:
+        """キーの順序と値がflatten_dictの結果と一致することを確認。"""
+        nested = {"a": {"b": 1, "c": {"d": [1, 2]}}, "e": {}, "f": "x"}
+
+        view = FlattenedView(nested, separator="/")
+
+        assert list(view) == list(flatten_dict(nested, separator="/"))
+        assert view == flatten_dict(nested, separator="/")
+        assert len(view) == 3
+
+    def test_正常系_リストをインデックスで参照できる(self) -> None:
+        """flatten_lists=Trueでリスト要素をインデックスのキーで参照できることを確認。"""
+        nested = {"a": [10, {"b": 20}]}
+
+        view = FlattenedView(nested, flatten_lists=True)
+
+        assert view["a.0"] == 10
+        assert view["a.1.b"] == 20
+        assert dict(view) == flatten_dict(nested, flatten_lists=True)
+        assert "a.01" not in view
+        assert "a.2" not in view
+
+    def test_正常系_区切り文字を含むキーも参照できる(self) -> None:
+        """辞書のキー自体に区切り文字が含まれていても値を取得できることを確認。"""
+        nested = {"a.b": {"c": 1}, "x": {"y.z": 2}}
+
+        view = FlattenedView(nested)
+
+        assert view["a.b.c"] == 1
+        assert view["x.y.z"] == 2
+
+    def test_正常系_元の辞書の変更が反映される(self) -> None:
+        """ビューがコピーではなく元の辞書を参照していることを確認。"""
+        nested: dict[str, dict[str, int]] = {"a": {"b": 1}}
+        view = FlattenedView(nested)
+
+        nested["a"]["b"] = 2
+
+        assert view["a.b"] == 2
+
+    def test_エッジケース_コンテナを指すキーは存在しない扱いになる(self) -> None:
+        """途中の辞書やリストを指すキーではKeyErrorになることを確認。"""
+        view = FlattenedView({"a": {"b": 1}, "c": [1]})
+
+        assert "a" not in view
+        with pytest.raises(KeyError):
+            view["a"]
+        assert view["c"] == [1]
+
+    def test_異常系_空の区切り文字でValueError(self) -> None:
+        """区切り文字が空の場合、ValueErrorが発生することを確認。"""
+        with pytest.raises(ValueError, match="separator must not be empty"):
+            FlattenedView({}, separator="")
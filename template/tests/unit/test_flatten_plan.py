@@ -0,0 +1,71 @@
+"""Unit tests for flatten plan module."""
+
+from typing import Any
+
+from template_package.utils.flatten_plan import FlattenPlan
+from template_package.utils.helpers import flatten_dict
+
+
+def make_record(index: int) -> dict[str, Any]:
+    """Create a record with a fixed nested shape."""
+    return {
+        "id": index,
+        "user": {"name": f"user{index}", "address": {"city": "Tokyo"}},
+        "tags": ["a", "b"],
+    }
+
+
+class TestFlattenPlan:
+    """Test FlattenPlan class."""
+
+    def test_正常系_同じ形のレコードをflatten_dictと同じ結果に変換できる(
+        self,
+    ) -> None:
+        """プラン適用の結果がflatten_dictと一致することを確認。"""
+        plan = FlattenPlan(make_record(0))
+        records = [make_record(i) for i in range(5)]
+
+        flattened = plan.apply_many(records)
+
+        assert flattened == [flatten_dict(record) for record in records]
+        assert plan.fallbacks == 0
+
+    def test_正常系_スキーマからプランを作成できる(self) -> None:
+        """型をプレースホルダーにしたスキーマからプランを作成できることを確認。"""
+        plan = FlattenPlan({"id": int, "user": {"name": str}}, separator="/")
+
+        assert plan.keys == ("id", "user/name")
+        assert plan.apply({"id": 1, "user": {"name": "x"}}) == {
+            "id": 1,
+            "user/name": "x",
+        }
+
+    def test_正常系_リストのフラット化に対応する(self) -> None:
+        """flatten_lists=Trueでリスト要素もプランで展開されることを確認。"""
+        plan = FlattenPlan(make_record(0), flatten_lists=True)
+        record = make_record(1)
+
+        assert plan.apply(record) == flatten_dict(record, flatten_lists=True)
+        assert plan.fallbacks == 0
+
+    def test_正常系_形が異なるレコードは汎用処理にフォールバックする(self) -> None:
+        """キーの過不足や型の違いがあっても正しい結果になることを確認。"""
+        plan = FlattenPlan(make_record(0))
+        records: list[dict[str, Any]] = [
+            {"id": 1, "user": {"name": "x"}, "tags": []},  # キー不足
+            {**make_record(2), "extra": 1},  # 余分なキー
+            {"id": 3, "user": "flat", "tags": []},  # 辞書の代わりに値
+            {"id": {"nested": 4}, "user": make_record(4)["user"], "tags": []},
+        ]
+
+        flattened = plan.apply_many(records)
+
+        assert flattened == [flatten_dict(record) for record in records]
+        assert plan.fallbacks == len(records)
+
+    def test_エッジケース_リストの長さが異なる場合はフォールバックする(self) -> None:
+        """flatten_lists=Trueでリスト長が異なるレコードも正しく処理されることを確認。"""
+        plan = FlattenPlan({"tags": ["a"]}, flatten_lists=True)
+
+        assert plan.apply({"tags": ["a", "b"]}) == {"tags.0": "a", "tags.1": "b"}
+        assert plan.fallbacks == 1
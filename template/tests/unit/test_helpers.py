@@ -1,15 +1,36 @@
 """Unit tests for utility helper functions."""
 
+import array
+import bz2
+import gzip
+import itertools
 import json
+import lzma
+import sys
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
+import numpy as np
+import pandas as pd
 import pytest
+from template_package.types import DictPatch
 from template_package.utils.helpers import (
+    JSON_ARRAY_WRITE_BATCH,
+    apply_patch,
     chunk_list,
+    diff_dicts,
     flatten_dict,
+    flatten_records,
+    iter_buffer_chunks,
+    iter_chunks,
     load_json_file,
+    load_json_files,
+    partition_by_weight,
+    read_json_text,
+    save_json_array,
     save_json_file,
+    unflatten_dict,
 )
 
 
@@ -107,6 +128,114 @@ class TestLoadJsonFile:
 
         assert result == test_data
 
+    def test_正常系_frozenで読み取り専用の結果を返す(self, temp_dir: Path) -> None:
+        """frozen=Trueで辞書が読み取り専用、リストがタプルになることを確認。"""
+        json_file = temp_dir / "test.json"
+        json_file.write_text('{"items": [1, {"a": [2]}]}', encoding="utf-8")
+
+        result = load_json_file(json_file, frozen=True)
+
+        assert result == {"items": (1, {"a": (2,)})}
+        with pytest.raises(TypeError):
+            result["items"] = ()  # type: ignore[index]
+
+
+class TestReadJsonText:
+    """Test read_json_text function."""
+
+    def test_正常系_解析せずにテキストを返す(self, temp_dir: Path) -> None:
+        """トップレベルが配列でもそのままテキストが返ることを確認。"""
+        json_file = temp_dir / "items.json"
+        json_file.write_text("[1, 2]", encoding="utf-8")
+
+        assert read_json_text(json_file) == "[1, 2]"
+
+    def test_正常系_圧縮ファイルを展開して返す(self, temp_dir: Path) -> None:
+        """拡張子から圧縮形式を判定して展開することを確認。"""
+        json_file = temp_dir / "items.json.gz"
+        with gzip.open(json_file, "wt", encoding="utf-8") as f:
+            f.write('{"a": 1}')
+
+        assert read_json_text(str(json_file)) == '{"a": 1}'
+
+    def test_異常系_存在しないファイルでFileNotFoundError(self, temp_dir: Path) -> None:
+        """存在しないファイルではFileNotFoundErrorになることを確認。"""
+        with pytest.raises(FileNotFoundError, match="File not found"):
+            read_json_text(temp_dir / "missing.json")
+
+
+class TestLoadJsonFiles:
+    """Test load_json_files function."""
+
+    def test_正常系_globパターンに一致するファイルを読み込める(
+        self,
+        temp_dir: Path,
+    ) -> None:
+        """サブディレクトリも含めて一致したファイルがパスをキーに返ることを確認。"""
+        for name in ["a.json", "sub/b.json", "sub/deeper/c.json.gz"]:
+            save_json_file({"name": name}, temp_dir / name)
+        (temp_dir / "ignored.txt").write_text("{}", encoding="utf-8")
+
+        result = load_json_files(str(temp_dir / "**" / "*.json*"))
+
+        assert result["data"] == {
+            str(temp_dir / name): {"name": name}
+            for name in ["a.json", "sub/b.json", "sub/deeper/c.json.gz"]
+        }
+        assert result["errors"] == {}
+
+    def test_正常系_失敗したファイルのエラーを集めて他を読み込む(
+        self,
+        temp_dir: Path,
+    ) -> None:
+        """一部のファイルが壊れていても残りが読み込まれることを確認。"""
+        valid = temp_dir / "valid.json"
+        save_json_file({"ok": True}, valid)
+        invalid = temp_dir / "invalid.json"
+        invalid.write_text("{invalid", encoding="utf-8")
+        missing = temp_dir / "missing.json"
+
+        result = load_json_files([missing, valid, str(invalid), valid])
+
+        assert list(result["data"]) == [str(valid)]
+        assert result["data"][str(valid)] == {"ok": True}
+        assert list(result["errors"]) == [str(missing), str(invalid)]
+        assert result["errors"][str(missing)]["code"] == "file_not_found"
+        assert result["errors"][str(invalid)]["code"] == "invalid_json"
+        assert result["errors"][str(invalid)]["details"]["path"] == str(invalid)
+
+    def test_正常系_大きなファイルはプロセスプールで読み込む(
+        self,
+        temp_dir: Path,
+    ) -> None:
+        """process_thresholdを超えるファイルもエラーも正しく返ることを確認。"""
+        paths = []
+        for i in range(3):
+            path = temp_dir / f"data{i}.json"
+            save_json_file({"index": i, "items": list(range(100))}, path)
+            paths.append(path)
+        broken = temp_dir / "broken.json"
+        broken.write_text("[" * 100, encoding="utf-8")
+
+        result = load_json_files([*paths, broken], max_workers=2, process_threshold=1)
+
+        assert [data["index"] for data in result["data"].values()] == [0, 1, 2]
+        assert result["errors"][str(broken)]["code"] == "invalid_json"
+
+    def test_エッジケース_一致するファイルがなければ空の結果(
+        self,
+        temp_dir: Path,
+    ) -> None:
+        """パターンに一致するファイルがない場合に空の結果になることを確認。"""
+        assert load_json_files(str(temp_dir / "*.json")) == {"data": {}, "errors": {}}
+
+    def test_異常系_不正な引数でValueError(self, temp_dir: Path) -> None:
+        """max_workersやprocess_thresholdが0以下の場合にエラーになることを確認。"""
+        with pytest.raises(ValueError, match="max_workers must be positive"):
+            load_json_files([], max_workers=0)
+        with pytest.raises(ValueError, match="process_threshold must be positive"):
+            load_json_files([], process_threshold=0)
+
 
 class TestSaveJsonFile:
     """Test save_json_file function."""
@@ -179,6 +308,112 @@ class TestSaveJsonFile:
         loaded_data = json.loads(json_file.read_text(encoding="utf-8"))
         assert loaded_data == new_data
 
+    def test_正常系_デフォルトでは区切りの空白なしで保存される(
+        self,
+        temp_dir: Path,
+    ) -> None:
+        """indentを指定しない場合にコンパクトな出力になることを確認。"""
+        json_file = temp_dir / "compact.json"
+
+        save_json_file({"a": [1, 2], "b": {"c": "日本語"}}, json_file)
+
+        assert json_file.read_text(encoding="utf-8") == '{"a":[1,2],"b":{"c":"日本語"}}'
+
+    @pytest.mark.parametrize(
+        ("suffix", "opener"),
+        [(".json.gz", gzip.open), (".json.bz2", bz2.open), (".json.xz", lzma.open)],
+    )
+    def test_正常系_拡張子から圧縮形式を選んで保存と読み込みができる(
+        self,
+        temp_dir: Path,
+        suffix: str,
+        opener: Any,
+    ) -> None:
+        """拡張子に応じて圧縮され、load_json_fileで展開されることを確認。"""
+        test_data = {"items": [{"id": i, "name": "テスト"} for i in range(100)]}
+        json_file = temp_dir / f"data{suffix}"
+
+        save_json_file(test_data, json_file, compression_level=1)
+
+        with opener(json_file, "rt", encoding="utf-8") as f:
+            assert json.load(f) == test_data
+        assert load_json_file(json_file) == test_data
+
+    def test_正常系_引数で圧縮形式を指定できる(self, temp_dir: Path) -> None:
+        """拡張子と関係なく指定した形式で圧縮・非圧縮を選べることを確認。"""
+        test_data = {"key": "value"}
+        compressed = temp_dir / "data.bin"
+        plain = temp_dir / "plain.json.gz"
+
+        save_json_file(test_data, compressed, compression="gzip")
+        save_json_file(test_data, plain, compression=None)
+
+        assert gzip.decompress(compressed.read_bytes()) == b'{"key":"value"}'
+        assert json.loads(plain.read_text(encoding="utf-8")) == test_data
+        assert load_json_file(compressed, compression="gzip") == test_data
+        assert load_json_file(plain, compression=None) == test_data
+
+    def test_異常系_不正な圧縮レベルでValueError(self, temp_dir: Path) -> None:
+        """範囲外の圧縮レベルや非圧縮ファイルへの指定がエラーになることを確認。"""
+        with pytest.raises(ValueError, match="between 1 and 9"):
+            save_json_file({}, temp_dir / "data.json.bz2", compression_level=0)
+        with pytest.raises(ValueError, match="requires a compressed file"):
+            save_json_file({}, temp_dir / "data.json", compression_level=5)
+        with pytest.raises(ValueError, match="compression must be one of"):
+            save_json_file({}, temp_dir / "data.json", compression="zip")  # type: ignore[arg-type]
+
+    @pytest.mark.parametrize("suffix", [".gz", ".bz2", ".xz"])
+    def test_異常系_壊れた圧縮データの読み込みでValueError(
+        self,
+        temp_dir: Path,
+        suffix: str,
+    ) -> None:
+        """圧縮データが壊れている場合にValueErrorになることを確認。"""
+        json_file = temp_dir / f"broken.json{suffix}"
+        json_file.write_bytes(b"not compressed data")
+
+        with pytest.raises(ValueError, match=r"Invalid (gzip|bz2|lzma) data"):
+            load_json_file(json_file)
+
+
+class TestSaveJsonArray:
+    """Test save_json_array function."""
+
+    def test_正常系_ジェネレーターをJSON配列として書き込める(
+        self,
+        temp_dir: Path,
+    ) -> None:
+        """バッチをまたぐ件数の要素が1つの配列として保存されることを確認。"""
+        json_file = temp_dir / "out" / "items.json"
+        count = JSON_ARRAY_WRITE_BATCH * 2 + 1
+
+        written = save_json_array(
+            ({"id": i, "名前": "x"} for i in range(count)), json_file
+        )
+
+        assert written == count
+        assert json.loads(json_file.read_text(encoding="utf-8")) == [
+            {"id": i, "名前": "x"} for i in range(count)
+        ]
+
+    def test_正常系_圧縮して書き込める(self, temp_dir: Path) -> None:
+        """拡張子から圧縮形式が選ばれることを確認。"""
+        json_file = temp_dir / "items.json.gz"
+
+        save_json_array([1, "two", None], json_file)
+
+        assert gzip.decompress(json_file.read_bytes()) == b'[1,"two",null]'
+
+    def test_エッジケース_空のイテラブルで空の配列を書き込む(
+        self,
+        temp_dir: Path,
+    ) -> None:
+        """要素がない場合に空の配列になることを確認。"""
+        json_file = temp_dir / "empty.json"
+
+        assert save_json_array(iter([]), json_file) == 0
+        assert json_file.read_text(encoding="utf-8") == "[]"
+
 
 class TestChunkList:
     """Test chunk_list function."""
@@ -257,6 +492,169 @@ class TestChunkList:
         assert len(chunks) == expected_chunks
 
 
+class TestIterChunks:
+    """Test iter_chunks function."""
+
+    def test_正常系_リストをchunk_listと同じように分割できる(self) -> None:
+        """リストの分割結果がchunk_listと一致することを確認。"""
+        items = list(range(10))
+
+        assert list(iter_chunks(items, 3)) == chunk_list(items, 3)
+
+    def test_正常系_ジェネレータを遅延評価で分割できる(self) -> None:
+        """ジェネレータから必要な分だけ要素が取り出されることを確認。"""
+        consumed: list[int] = []
+
+        def generate() -> Iterator[int]:
+            for i in range(10):
+                consumed.append(i)
+                yield i
+
+        chunks = iter_chunks(generate(), 4)
+
+        assert next(chunks) == [0, 1, 2, 3]
+        assert consumed == [0, 1, 2, 3]
+        assert list(chunks) == [[4, 5, 6, 7], [8, 9]]
+
+    def test_正常系_無限イテレータから先頭のチャンクを取得できる(self) -> None:
+        """終わりのないイテレータでもチャンクを取り出せることを確認。"""
+        chunks = iter_chunks(itertools.count(), 3)
+
+        assert list(itertools.islice(chunks, 2)) == [[0, 1, 2], [3, 4, 5]]
+
+    def test_正常系_シーケンスはリストのチャンクとして返される(self) -> None:
+        """タプルや文字列もリストのチャンクに分割されることを確認。"""
+        assert list(iter_chunks((1, 2, 3), 2)) == [[1, 2], [3]]
+        assert list(iter_chunks("abcde", 2)) == [["a", "b"], ["c", "d"], ["e"]]
+
+    def test_エッジケース_空のイテラブルではチャンクが生成されない(self) -> None:
+        """空の入力では何も生成されないことを確認。"""
+        assert list(iter_chunks([], 3)) == []
+        assert list(iter_chunks(iter([]), 3)) == []
+
+    def test_異常系_チャンクサイズが0以下なら呼び出し時にValueError(self) -> None:
+        """イテレーション開始前にValueErrorが発生することを確認。"""
+        with pytest.raises(ValueError, match="chunk_size must be positive"):
+            iter_chunks(itertools.count(), 0)
+
+
+class TestPartitionByWeight:
+    """Test partition_by_weight function."""
+
+    def test_正常系_重みの合計がほぼ等しいチャンクに分割できる(self) -> None:
+        """各チャンクの重みの合計が均等になることを確認。"""
+        items = ["a", "b", "c", "d"]
+
+        chunks = partition_by_weight(items, 2, weights=[5, 1, 4, 2])
+
+        assert chunks == [["a", "b"], ["c", "d"]]
+
+    def test_正常系_重み関数を指定できる(self) -> None:
+        """重み関数で計算した重みで分割されることを確認。"""
+        items = ["xxxxxx", "x", "xx", "xxx"]
+
+        chunks = partition_by_weight(items, 2, weights=len)
+
+        assert sorted(sum(map(len, chunk)) for chunk in chunks) == [6, 6]
+
+    def test_正常系_偏った重みでも件数分割より均等になる(self) -> None:
+        """重い要素が先頭に偏っていても最大の合計重みが抑えられることを確認。"""
+        weights = [100] * 10 + [1] * 90
+        items = list(range(100))
+
+        chunks = partition_by_weight(items, 4, weights=weights)
+
+        totals = [sum(weights[i] for i in chunk) for chunk in chunks]
+        assert max(totals) - min(totals) <= 100
+        assert sorted(i for chunk in chunks for i in chunk) == items
+
+    def test_正常系_チャンク内では元の順序が保たれる(self) -> None:
+        """各チャンクの要素が入力と同じ順序で並ぶことを確認。"""
+        chunks = partition_by_weight(list(range(20)), 3, weights=[1] * 20)
+
+        assert all(chunk == sorted(chunk) for chunk in chunks)
+
+    def test_エッジケース_要素数がチャンク数より少ない場合は空のチャンクを含む(
+        self,
+    ) -> None:
+        """要素が足りない場合も指定数のチャンクが返されることを確認。"""
+        chunks = partition_by_weight(["a"], 3, weights=[1])
+
+        assert chunks == [["a"], [], []]
+
+    def test_異常系_チャンク数が0以下でValueError(self) -> None:
+        """チャンク数が0以下の場合、ValueErrorが発生することを確認。"""
+        with pytest.raises(ValueError, match="num_chunks must be positive"):
+            partition_by_weight([1], 0, weights=[1])
+
+    def test_異常系_重みの数が一致しない場合ValueError(self) -> None:
+        """重みと要素の数が異なる場合、ValueErrorが発生することを確認。"""
+        with pytest.raises(ValueError, match="Expected 2 weights, got 1"):
+            partition_by_weight([1, 2], 2, weights=[1])
+
+    def test_異常系_負の重みでValueError(self) -> None:
+        """負の重みが含まれる場合、ValueErrorが発生することを確認。"""
+        with pytest.raises(ValueError, match="must be non-negative"):
+            partition_by_weight([1, 2], 2, weights=[1, -1])
+
+
+class TestIterBufferChunks:
+    """Test iter_buffer_chunks function."""
+
+    def test_正常系_bytesをコピーせずに分割できる(self) -> None:
+        """bytesが元のオブジェクトを参照するmemoryviewに分割されることを確認。"""
+        data = b"abcdefg"
+
+        chunks = list(iter_buffer_chunks(data, 3))
+
+        assert [bytes(chunk) for chunk in chunks] == [b"abc", b"def", b"g"]
+        assert all(chunk.obj is data for chunk in chunks)
+
+    def test_正常系_bytearrayへの書き込みがチャンクに反映される(self) -> None:
+        """チャンクが元のバッファと同じメモリを共有することを確認。"""
+        data = bytearray(b"abcd")
+
+        first, second = iter_buffer_chunks(data, 2)
+        data[2] = ord("X")
+
+        assert bytes(second) == b"Xd"
+        first.release()
+        second.release()
+
+    def test_正常系_arrayは要素単位で分割される(self) -> None:
+        """chunk_sizeがバイト数ではなく要素数として扱われることを確認。"""
+        data = array.array("q", range(5))
+
+        chunks = list(iter_buffer_chunks(data, 2))
+
+        assert [chunk.tolist() for chunk in chunks] == [[0, 1], [2, 3], [4]]
+
+    def test_正常系_NumPy配列はビューとして分割される(self) -> None:
+        """NumPy配列が先頭の軸に沿ったビューに分割されることを確認。"""
+        data = np.arange(12).reshape(6, 2)
+
+        chunks = list(iter_buffer_chunks(data, 4))
+
+        assert [chunk.shape for chunk in chunks] == [(4, 2), (2, 2)]
+        assert all(np.shares_memory(chunk, data) for chunk in chunks)
+
+    def test_エッジケース_空のバッファではチャンクが生成されない(self) -> None:
+        """空のバッファでは何も生成されないことを確認。"""
+        assert list(iter_buffer_chunks(b"", 3)) == []
+
+    def test_異常系_多次元のmemoryviewでValueError(self) -> None:
+        """NumPy以外の多次元バッファではValueErrorが発生することを確認。"""
+        view = memoryview(bytes(6)).cast("B", (2, 3))
+
+        with pytest.raises(ValueError, match="must be one-dimensional"):
+            iter_buffer_chunks(view, 2)
+
+    def test_異常系_チャンクサイズが0以下でValueError(self) -> None:
+        """チャンクサイズが0以下の場合、ValueErrorが発生することを確認。"""
+        with pytest.raises(ValueError, match="chunk_size must be positive"):
+            iter_buffer_chunks(b"abc", 0)
+
+
 class TestFlattenDict:
     """Test flatten_dict function."""
 
@@ -391,3 +789,256 @@ class TestFlattenDict:
             "group.data": 2,
             "group.subgroup.data": 3,
         }
+
+    def test_正常系_キーの順序が深さ優先の出現順になる(self) -> None:
+        """フラット化後のキーが元の辞書の深さ優先順に並ぶことを確認。"""
+        nested = {"a": {"b": 1, "c": {"d": 2}}, "e": 3, "f": {"g": 4}}
+
+        flattened = flatten_dict(nested)
+
+        assert list(flattened) == ["a.b", "a.c.d", "e", "f.g"]
+
+    def test_正常系_再帰上限を超える深さでもフラット化できる(self) -> None:
+        """sys.getrecursionlimit()を超える深さでも例外にならないことを確認。"""
+        depth = sys.getrecursionlimit() + 100
+        nested: dict[str, Any] = {"leaf": 1}
+        for _ in range(depth):
+            nested = {"k": nested}
+
+        flattened = flatten_dict(nested)
+
+        assert flattened == {".".join(["k"] * depth + ["leaf"]): 1}
+
+    def test_正常系_リストはデフォルトで値として保持される(self) -> None:
+        """flatten_lists未指定ではリストがそのまま値になることを確認。"""
+        nested = {"a": {"b": [1, {"c": 2}]}}
+
+        assert flatten_dict(nested) == {"a.b": [1, {"c": 2}]}
+
+    def test_正常系_リストをインデックス付きでフラット化できる(self) -> None:
+        """flatten_lists=Trueでリスト要素がインデックスのキーになることを確認。"""
+        nested = {"a": [1, {"b": 2}, [3, 4]], "c": []}
+
+        flattened = flatten_dict(nested, flatten_lists=True)
+
+        assert flattened == {"a.0": 1, "a.1.b": 2, "a.2.0": 3, "a.2.1": 4}
+
+    def test_エッジケース_空のネスト辞書はキーを生成しない(self) -> None:
+        """空の辞書の値はフラット化後に含まれないことを確認。"""
+        assert flatten_dict({"a": {}, "b": 1}) == {"b": 1}
+
+
+class TestFlattenRecords:
+    """Test flatten_records function."""
+
+    def test_正常系_レコードを列形式にフラット化できる(self) -> None:
+        """各レコードのフラット化結果が列ごとのリストになることを確認。"""
+        records = [{"a": {"b": 1}, "c": "x"}, {"a": {"b": 2}, "c": "y"}]
+
+        columns = flatten_records(records)
+
+        assert columns == {"a.b": [1, 2], "c": ["x", "y"]}
+
+    def test_正常系_欠けているキーはNoneで埋められる(self) -> None:
+        """キーを持たないレコードの位置がNoneになることを確認。"""
+        records = [{"a": 1}, {"b": 2}, {"a": 3}]
+
+        columns = flatten_records(records)
+
+        assert columns == {"a": [1, None, 3], "b": [None, 2, None]}
+
+    def test_正常系_flatten_dictの結果と一致する(self) -> None:
+        """各列の値がレコードごとのflatten_dictの結果と一致することを確認。"""
+        records = [
+            {"a": {"b": [1, 2]}, "c": {"d": None}},
+            {"a": {"b": [3, 4]}, "c": {"d": True}},
+        ]
+        flattened = [
+            flatten_dict(record, separator="/", flatten_lists=True)
+            for record in records
+        ]
+
+        columns = flatten_records(records, separator="/", flatten_lists=True)
+
+        assert columns == {key: [row[key] for row in flattened] for key in flattened[0]}
+
+    def test_正常系_ジェネレータを受け付ける(self) -> None:
+        """一度しか走査できない入力も処理できることを確認。"""
+        columns = flatten_records({"id": i} for i in range(3))
+
+        assert columns == {"id": [0, 1, 2]}
+
+    def test_正常系_DataFrameとして取得できる(self) -> None:
+        """as_dataframe=TrueでpandasのDataFrameが返されることを確認。"""
+        records = [{"a": {"b": 1}}, {"a": {"b": 2}, "c": 3}]
+
+        frame = flatten_records(records, as_dataframe=True)
+
+        assert isinstance(frame, pd.DataFrame)
+        assert list(frame.columns) == ["a.b", "c"]
+        assert frame["a.b"].tolist() == [1, 2]
+
+    def test_エッジケース_空の入力では空の辞書を返す(self) -> None:
+        """レコードが0件の場合に空の辞書が返されることを確認。"""
+        assert flatten_records([]) == {}
+
+
+class TestUnflattenDict:
+    """Test unflatten_dict function."""
+
+    def test_正常系_フラットなキーからネストした辞書を復元できる(self) -> None:
+        """区切り文字で分割したキーからネスト構造が復元されることを確認。"""
+        flat = {"a.b": 1, "a.c.d": 2, "e": 3}
+
+        assert unflatten_dict(flat) == {"a": {"b": 1, "c": {"d": 2}}, "e": 3}
+
+    def test_正常系_flatten_dictとの往復で元に戻る(self) -> None:
+        """flatten_dictの結果を復元すると元の辞書に一致することを確認。"""
+        nested = {"a": {"b": [1, {"c": 2}], "d": "x"}, "e": None}
+
+        flattened = flatten_dict(nested, separator="/", flatten_lists=True)
+
+        assert unflatten_dict(flattened, separator="/", lists=True) == nested
+
+    def test_正常系_listsを指定しない場合は数字キーの辞書のまま(self) -> None:
+        """lists=Falseではインデックスのキーが辞書として残ることを確認。"""
+        assert unflatten_dict({"a.0": 1, "a.1": 2}) == {"a": {"0": 1, "1": 2}}
+
+    def test_正常系_連番でない数字キーはリストにならない(self) -> None:
+        """キーが0からの連番でない場合は辞書のまま残ることを確認。"""
+        flat = {"a.0": 1, "a.2": 2}
+
+        assert unflatten_dict(flat, lists=True) == {"a": {"0": 1, "2": 2}}
+
+    def test_正常系_overwriteでは後のキーが優先される(self) -> None:
+        """on_conflict="overwrite"で後から現れたキーが残ることを確認。"""
+        assert unflatten_dict({"a": 1, "a.b": 2}, on_conflict="overwrite") == {
+            "a": {"b": 2}
+        }
+        assert unflatten_dict({"a.b": 2, "a": 1}, on_conflict="overwrite") == {"a": 1}
+
+    def test_正常系_skipでは先のキーが優先される(self) -> None:
+        """on_conflict="skip"で先に現れたキーが残ることを確認。"""
+        assert unflatten_dict({"a": 1, "a.b": 2}, on_conflict="skip") == {"a": 1}
+        assert unflatten_dict({"a.b": 2, "a": 1}, on_conflict="skip") == {"a": {"b": 2}}
+
+    def test_正常系_値として渡された辞書は変更されない(self) -> None:
+        """値の辞書に子キーが書き込まれないことを確認。"""
+        value = {"x": 1}
+
+        result = unflatten_dict({"a": value, "a.b": 2}, on_conflict="overwrite")
+
+        assert result == {"a": {"b": 2}}
+        assert value == {"x": 1}
+
+    def test_異常系_キーが衝突するとValueError(self) -> None:
+        """デフォルトではキーの衝突でValueErrorが発生することを確認。"""
+        with pytest.raises(ValueError, match="conflicts with another key"):
+            unflatten_dict({"a": 1, "a.b": 2})
+
+    def test_異常系_空の区切り文字でValueError(self) -> None:
+        """区切り文字が空の場合、ValueErrorが発生することを確認。"""
+        with pytest.raises(ValueError, match="separator must not be empty"):
+            unflatten_dict({"a": 1}, separator="")
+
+
+class TestDiffDicts:
+    """Test diff_dicts function."""
+
+    def test_正常系_追加変更削除をフラットなパスで取得できる(self) -> None:
+        """差分が追加・変更・削除ごとにフラットなパスで記録されることを確認。"""
+        old = {"a": {"b": 1, "c": 2}, "d": 3}
+        new = {"a": {"b": 1, "c": 4, "e": 5}, "f": 6}
+
+        patch = diff_dicts(old, new)
+
+        assert patch == {
+            "added": {"f": 6, "a.e": 5},
+            "changed": {"a.c": 4},
+            "removed": ["d"],
+        }
+
+    def test_正常系_片側にしかない部分木は根の1件として記録される(self) -> None:
+        """追加・削除された部分木が葉ごとに分解されないことを確認。"""
+        patch = diff_dicts({"old": {"x": {"y": 1}}}, {"new": {"p": {"q": 2}}})
+
+        assert patch["added"] == {"new": {"p": {"q": 2}}}
+        assert patch["removed"] == ["old"]
+
+    def test_正常系_同一の文書では差分が空になる(self) -> None:
+        """等しい文書の差分が空であることを確認。"""
+        document = {"a": {"b": [1, 2]}, "c": None}
+
+        patch = diff_dicts(document, {"a": {"b": [1, 2]}, "c": None})
+
+        assert patch == {"added": {}, "changed": {}, "removed": []}
+
+    def test_正常系_型の異なる等価な値は変更として扱う(self) -> None:
+        """1とTrue、1と1.0の違いが変更として検出されることを確認。"""
+        patch = diff_dicts({"a": 1, "b": 1}, {"a": True, "b": 1.0})
+
+        assert patch["changed"] == {"a": True, "b": 1.0}
+
+    def test_正常系_リスト内の型の異なる等価な値も変更として扱う(self) -> None:
+        """リストやその中の辞書の値の型の違いも検出され、差分から復元できることを確認。"""
+        cases = [
+            ({"a": [1, 2]}, {"a": [True, 2.0]}),
+            ({"a": [{"b": 1}]}, {"a": [{"b": True}]}),
+        ]
+
+        for old, new in cases:
+            patch = diff_dicts(old, new)
+
+            assert patch["changed"] == new
+            assert repr(apply_patch(old, patch)) == repr(new)
+
+    def test_正常系_リストを要素ごとに比較できる(self) -> None:
+        """flatten_lists=Trueで同じ長さのリストが要素単位で比較されることを確認。"""
+        old = {"a": [1, {"b": 2}], "c": [1]}
+        new = {"a": [1, {"b": 3}], "c": [1, 2]}
+
+        patch = diff_dicts(old, new, flatten_lists=True)
+
+        assert patch["changed"] == {"a.1.b": 3, "c": [1, 2]}
+
+    def test_異常系_キーに区切り文字が含まれるとValueError(self) -> None:
+        """パスが曖昧になるキーではValueErrorが発生することを確認。"""
+        with pytest.raises(ValueError, match="contains the separator"):
+            diff_dicts({"a.b": 1}, {"a.b": 2})
+
+
+class TestApplyPatch:
+    """Test apply_patch function."""
+
+    def test_正常系_差分を適用すると変更後の文書になる(self) -> None:
+        """diff_dictsの結果を適用すると新しい文書に一致することを確認。"""
+        old = {"a": {"b": 1, "c": [1, {"d": 2}]}, "e": {"f": 3}, "g": 4}
+        new = {"a": {"b": 2, "c": [1, {"d": 5}]}, "e": {"f": 3, "h": {}}, "i": 6}
+
+        patch = diff_dicts(old, new, separator="/", flatten_lists=True)
+
+        assert apply_patch(old, patch, separator="/") == new
+
+    def test_正常系_元の文書は変更されず未変更の部分木は共有される(self) -> None:
+        """パス上のコンテナのみコピーされることを確認。"""
+        old = {"a": {"b": 1}, "untouched": {"x": [1, 2]}}
+
+        patched = apply_patch(old, {"added": {}, "changed": {"a.b": 2}, "removed": []})
+
+        assert old == {"a": {"b": 1}, "untouched": {"x": [1, 2]}}
+        assert patched["a"] == {"b": 2}
+        assert patched["untouched"] is old["untouched"]
+
+    def test_異常系_存在しないパスの変更でValueError(self) -> None:
+        """変更対象のパスが存在しない場合、ValueErrorが発生することを確認。"""
+        patch = DictPatch(added={}, changed={"a.x": 1}, removed=[])
+
+        with pytest.raises(ValueError, match="does not exist"):
+            apply_patch({"a": {"b": 1}}, patch)
+
+    def test_異常系_既存のパスへの追加でValueError(self) -> None:
+        """追加対象のパスが既に存在する場合、ValueErrorが発生することを確認。"""
+        patch = DictPatch(added={"a": 1}, changed={}, removed=[])
+
+        with pytest.raises(ValueError, match="already exists"):
+            apply_patch({"a": 0}, patch)
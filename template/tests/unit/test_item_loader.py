@@ -0,0 +1,146 @@
+"""Unit tests for item loader module."""
+
+import gzip
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+from template_package.core.example import ExampleClass, ExampleConfig
+from template_package.core.item_loader import load_items_json, validate_items
+
+ITEMS: list[dict[str, Any]] = [
+    {"id": 1, "name": "Item 1", "value": 100},
+    {"id": 2, "name": "Item 2", "value": 200, "extra": {"nested": None}},
+]
+
+
+class TestValidateItems:
+    """Test validate_items function."""
+
+    def test_正常系_有効なレコードはコピーせずに返される(self) -> None:
+        """リストがそのまま返り、追加フィールドも保持されることを確認。"""
+        records = list(ITEMS)
+
+        assert validate_items(records) is records
+
+    def test_正常系_タプルはリストに変換される(self) -> None:
+        """リスト以外のシーケンスも受け付けることを確認。"""
+        assert validate_items(tuple(ITEMS)) == ITEMS
+
+    @pytest.mark.parametrize(
+        ("record", "match"),
+        [
+            ({"id": 1, "value": 10}, "Missing required fields"),
+            ({"id": 1, "name": None, "value": 10}, "Required fields cannot be None"),
+            ({"id": "1", "name": "a", "value": 10}, "'id' must be int, got str"),
+            ({"id": 1, "name": "a", "value": True}, "'value' must be int, got bool"),
+            ({"id": 1, "name": "a", "value": 1.5}, "'value' must be int, got float"),
+            (["id", "name", "value"], "expected object, got list"),
+        ],
+    )
+    def test_異常系_不正なレコードの位置と理由が報告される(
+        self, record: Any, match: str
+    ) -> None:
+        """最初の不正なレコードのインデックスと原因がメッセージに含まれることを確認。"""
+        with pytest.raises(ValueError, match="Invalid item at index 1") as exc_info:
+            validate_items([ITEMS[0], record, record])
+
+        assert match in str(exc_info.value)
+
+
+class TestLoadItemsJson:
+    """Test load_items_json function."""
+
+    def test_正常系_配列のファイルを読み込める(self, temp_dir: Path) -> None:
+        """トップレベルの配列がそのまま読み込まれることを確認。"""
+        path = temp_dir / "items.json"
+        path.write_text(json.dumps(ITEMS), encoding="utf-8")
+
+        assert load_items_json(path) == ITEMS
+
+    def test_正常系_keyでオブジェクト内の配列を読み込める(self, temp_dir: Path) -> None:
+        """save_json_file形式の{"items": [...]}を読み込めることを確認。"""
+        path = temp_dir / "items.json.gz"
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            json.dump({"items": ITEMS}, f)
+
+        assert load_items_json(path, key="items") == ITEMS
+
+    def test_正常系_空の配列を読み込める(self, temp_dir: Path) -> None:
+        """空の配列では空のリストが返ることを確認。"""
+        path = temp_dir / "items.json"
+        path.write_text("[]", encoding="utf-8")
+
+        assert load_items_json(path) == []
+
+    def test_異常系_存在しないファイルでFileNotFoundError(self, temp_dir: Path) -> None:
+        """存在しないファイルではFileNotFoundErrorになることを確認。"""
+        with pytest.raises(FileNotFoundError, match="File not found"):
+            load_items_json(temp_dir / "missing.json")
+
+    @pytest.mark.parametrize(
+        ("content", "key", "match"),
+        [
+            ("[{", None, "Invalid JSON"),
+            ('{"items": []}', None, "Expected JSON array of items"),
+            ("[]", "items", "Expected JSON object"),
+            ('{"other": []}', "items", "Missing key 'items'"),
+            ('[{"id": 1, "name": "a"}]', None, "Invalid item at index 0 in"),
+        ],
+    )
+    def test_異常系_不正な内容でValueError(
+        self, temp_dir: Path, content: str, key: str | None, match: str
+    ) -> None:
+        """JSONや構造、アイテムが不正な場合にValueErrorになることを確認。"""
+        path = temp_dir / "items.json"
+        path.write_text(content, encoding="utf-8")
+
+        with pytest.raises(ValueError, match=match):
+            load_items_json(path, key=key)
+
+
+class TestAddItems:
+    """Test ExampleClass.add_items method."""
+
+    def test_正常系_検証済みのアイテムを一括追加できる(self, temp_dir: Path) -> None:
+        """load_items_jsonの結果を検証なしで追加できることを確認。"""
+        path = temp_dir / "items.json"
+        path.write_text(json.dumps(ITEMS), encoding="utf-8")
+        instance = ExampleClass(ExampleConfig(name="test"))
+
+        instance.add_items(load_items_json(path), validated=True)
+
+        assert instance.get_items() == ITEMS
+
+    def test_正常系_未検証のアイテムもアイテムごとにログを出さない(
+        self, capture_logs: pytest.LogCaptureFixture
+    ) -> None:
+        """validated=Falseでもログの件数がアイテム数に比例しないことを確認。"""
+        instance = ExampleClass(ExampleConfig(name="test", max_items=1000))
+        items = [{"id": i, "name": f"Item {i}", "value": i} for i in range(500)]
+        capture_logs.clear()
+
+        instance.add_items(items)  # type: ignore[arg-type]
+
+        assert len(instance) == 500
+        assert len(capture_logs.records) < 10
+
+    def test_異常系_未検証のアイテムは検証される(self) -> None:
+        """validated=Falseでは不正なアイテムがあると何も追加されないことを確認。"""
+        instance = ExampleClass(ExampleConfig(name="test"))
+
+        with pytest.raises(ValueError, match="Missing required fields"):
+            instance.add_items([ITEMS[0], {"id": 2}])  # type: ignore[list-item]
+
+        assert len(instance) == 0
+
+    def test_異常系_最大数を超える一括追加は全体が拒否される(self) -> None:
+        """max_itemsを超える場合は1件も追加されないことを確認。"""
+        instance = ExampleClass(ExampleConfig(name="test", max_items=2))
+        instance.add_item({"id": 0, "name": "first", "value": 0})
+
+        with pytest.raises(ValueError, match="max_items limit"):
+            instance.add_items(ITEMS, validated=True)  # type: ignore[arg-type]
+
+        assert len(instance) == 1
@@ -0,0 +1,207 @@
+"""Unit tests for JSON file cache module."""
+
+import os
+from pathlib import Path
+
+import pytest
+from template_package.utils.helpers import load_json_file, save_json_file
+from template_package.utils.json_cache import FROZEN_SIZE_FACTOR, JSONFileCache
+
+
+def touch_later(path: Path) -> None:
+    """Move the file's modification time forward by one second."""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class TestJSONFileCache:
+    """Test JSONFileCache class."""
+
+    def test_正常系_変更されていないファイルはキャッシュから返す(
+        self, temp_dir: Path
+    ) -> None:
+        """2回目以降の読み込みがキャッシュヒットになることを確認。"""
+        json_file = temp_dir / "config.json"
+        save_json_file({"name": "test", "items": [1, 2]}, json_file)
+        cache = JSONFileCache()
+
+        first = load_json_file(json_file, cache=cache)
+        second = load_json_file(str(json_file), cache=cache)
+
+        assert first == second == {"name": "test", "items": [1, 2]}
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert len(cache) == 1
+        assert cache.total_bytes == json_file.stat().st_size
+
+    def test_正常系_結果を変更してもキャッシュに影響しない(
+        self, temp_dir: Path
+    ) -> None:
+        """返された辞書やネストしたリストを変更しても次の結果が変わらないことを確認。"""
+        json_file = temp_dir / "config.json"
+        save_json_file({"nested": {"items": [1, 2]}}, json_file)
+        cache = JSONFileCache()
+
+        first = load_json_file(json_file, cache=cache)
+        first["nested"]["items"].append(3)
+        second = load_json_file(json_file, cache=cache)
+        second["added"] = True
+
+        assert load_json_file(json_file, cache=cache) == {"nested": {"items": [1, 2]}}
+
+    def test_正常系_更新されたファイルは読み直す(self, temp_dir: Path) -> None:
+        """更新時刻が変わったファイルが再読み込みされることを確認。"""
+        json_file = temp_dir / "config.json"
+        save_json_file({"version": 1}, json_file)
+        cache = JSONFileCache()
+        load_json_file(json_file, cache=cache)
+
+        save_json_file({"version": 2}, json_file)
+        touch_later(json_file)
+
+        assert load_json_file(json_file, cache=cache) == {"version": 2}
+        assert cache.misses == 2
+
+    def test_正常系_frozenでは読み取り専用の結果を共有する(
+        self, temp_dir: Path
+    ) -> None:
+        """frozen=Trueの結果が変更できず、キャッシュヒット時は同じオブジェクトになることを確認。"""
+        json_file = temp_dir / "config.json"
+        save_json_file({"nested": {"items": [1, {"a": 2}]}}, json_file)
+        cache = JSONFileCache()
+
+        first = load_json_file(json_file, cache=cache, frozen=True)
+        second = load_json_file(json_file, cache=cache, frozen=True)
+
+        assert first is second
+        assert first["nested"] == {"items": (1, {"a": 2})}
+        with pytest.raises(TypeError):
+            first["added"] = 1  # type: ignore[index]
+        with pytest.raises(TypeError):
+            first["nested"]["items"][1]["a"] = 3  # type: ignore[index]
+        # 通常の読み込みは同じエントリから別のコピーを返す
+        assert load_json_file(json_file, cache=cache) == {
+            "nested": {"items": [1, {"a": 2}]}
+        }
+        assert (cache.hits, cache.misses) == (2, 1)
+
+    def test_正常系_frozenでも更新されたファイルは読み直す(
+        self, temp_dir: Path
+    ) -> None:
+        """更新後はfrozenの結果も作り直されることを確認。"""
+        json_file = temp_dir / "config.json"
+        save_json_file({"version": 1}, json_file)
+        cache = JSONFileCache()
+        first = load_json_file(json_file, cache=cache, frozen=True)
+
+        save_json_file({"version": 2}, json_file)
+        touch_later(json_file)
+
+        assert first["version"] == 1
+        assert load_json_file(json_file, cache=cache, frozen=True)["version"] == 2
+
+    def test_正常系_容量を超えると最も古く使われたものから削除する(
+        self, temp_dir: Path
+    ) -> None:
+        """合計サイズの上限を超えた場合にLRUで追い出されることを確認。"""
+        files = []
+        for name in ["a", "b", "c"]:
+            path = temp_dir / f"{name}.json"
+            save_json_file({"name": name * 10}, path)
+            files.append(path)
+        size = files[0].stat().st_size
+        cache = JSONFileCache(max_bytes=size * 2)
+
+        load_json_file(files[0], cache=cache)
+        load_json_file(files[1], cache=cache)
+        load_json_file(files[0], cache=cache)  # aを最近使ったものにする
+        load_json_file(files[2], cache=cache)  # bが追い出される
+
+        assert len(cache) == 2
+        load_json_file(files[0], cache=cache)
+        assert cache.hits == 2
+        load_json_file(files[1], cache=cache)
+        assert cache.misses == 4
+
+    def test_正常系_invalidateでエントリを削除できる(self, temp_dir: Path) -> None:
+        """ファイル単位と全体の無効化ができることを確認。"""
+        a = temp_dir / "a.json"
+        b = temp_dir / "b.json"
+        save_json_file({"a": 1}, a)
+        save_json_file({"b": 1}, b)
+        cache = JSONFileCache()
+        load_json_file(a, cache=cache)
+        load_json_file(b, cache=cache)
+
+        cache.invalidate(a)
+        assert len(cache) == 1
+        assert cache.total_bytes == b.stat().st_size
+
+        cache.invalidate()
+        assert len(cache) == 0
+        assert cache.total_bytes == 0
+
+    def test_正常系_非ASCIIのテキストはUTF8のバイト数で計上される(
+        self, temp_dir: Path
+    ) -> None:
+        """文字数ではなくエンコード後のバイト数で容量を数えることを確認。"""
+        json_file = temp_dir / "config.json"
+        save_json_file({"name": "日本語の設定"}, json_file)
+        cache = JSONFileCache()
+
+        load_json_file(json_file, cache=cache)
+
+        assert cache.total_bytes == json_file.stat().st_size
+        assert cache.total_bytes > len(json_file.read_text(encoding="utf-8"))
+
+    def test_正常系_frozenの結果も容量に計上される(self, temp_dir: Path) -> None:
+        """frozenの解析結果が見積もりサイズで計上され、追い出し対象になることを確認。"""
+        a = temp_dir / "a.json"
+        b = temp_dir / "b.json"
+        save_json_file({"name": "a" * 10}, a)
+        save_json_file({"name": "b" * 10}, b)
+        size = a.stat().st_size
+        cache = JSONFileCache(max_bytes=size * (FROZEN_SIZE_FACTOR + 2))
+
+        load_json_file(a, cache=cache, frozen=True)
+        assert cache.total_bytes == size * (FROZEN_SIZE_FACTOR + 1)
+
+        load_json_file(b, cache=cache, frozen=True)  # 合わせると上限を超える
+        assert len(cache) == 1
+        assert cache.total_bytes == size * (FROZEN_SIZE_FACTOR + 1)
+        load_json_file(b, cache=cache, frozen=True)
+        assert cache.hits == 1
+
+    def test_エッジケース_frozenで上限を超える場合は共有しない(
+        self, temp_dir: Path
+    ) -> None:
+        """テキストは収まってもfrozenの見積もりが上限を超えれば破棄されることを確認。"""
+        json_file = temp_dir / "config.json"
+        save_json_file({"name": "test"}, json_file)
+        cache = JSONFileCache(max_bytes=json_file.stat().st_size * 2)
+
+        first = load_json_file(json_file, cache=cache, frozen=True)
+
+        assert first == {"name": "test"}
+        assert len(cache) == 0
+        assert cache.total_bytes == 0
+
+    def test_エッジケース_上限より大きいファイルはキャッシュしない(
+        self, temp_dir: Path
+    ) -> None:
+        """予算を超えるファイルは読み込めるがキャッシュされないことを確認。"""
+        json_file = temp_dir / "large.json"
+        save_json_file({"data": "x" * 100}, json_file)
+        cache = JSONFileCache(max_bytes=10)
+
+        assert load_json_file(json_file, cache=cache) == {"data": "x" * 100}
+        assert len(cache) == 0
+
+    def test_異常系_不正なmax_bytesでValueError(self) -> None:
+        """max_bytesが0以下の場合にエラーになることを確認。"""
+        with pytest.raises(ValueError, match="max_bytes must be positive"):
+            JSONFileCache(max_bytes=0)
+
+    def test_異常系_存在しないファイルでFileNotFoundError(self, temp_dir: Path) -> None:
+        """キャッシュ使用時も存在しないファイルはエラーになることを確認。"""
+        with pytest.raises(FileNotFoundError, match="File not found"):
+            load_json_file(temp_dir / "missing.json", cache=JSONFileCache())
@@ -0,0 +1,132 @@
+"""Unit tests for JSON streaming module."""
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+from template_package.utils.json_stream import iter_json_array, iter_json_object
+
+# 値の境界と読み込み単位の境界が様々に重なるよう、複数のバッファサイズで検証する
+BUFFER_SIZES = [1, 2, 7, 64, 65536]
+
+ELEMENTS: list[Any] = [
+    1,
+    -12345.678e-3,
+    '日本語 \\u00e9 "quoted" \\\\',
+    True,
+    False,
+    None,
+    {"nested": {"list": [1, 2, {"x": "y"}]}, "empty": {}},
+    [],
+    "\U0001f600",
+    123456789012345678901234567890,
+]
+
+
+def write_json(path: Path, data: Any, *, indent: int | None = None) -> Path:
+    """Write ``data`` as JSON and return the path."""
+    path.write_text(json.dumps(data, indent=indent, ensure_ascii=False), "utf-8")
+    return path
+
+
+class TestIterJsonArray:
+    """Test iter_json_array function."""
+
+    @pytest.mark.parametrize("buffer_size", BUFFER_SIZES)
+    @pytest.mark.parametrize("indent", [None, 2])
+    def test_正常系_配列の要素を順に読み込める(
+        self,
+        temp_dir: Path,
+        buffer_size: int,
+        indent: int | None,
+    ) -> None:
+        """バッファサイズや整形に関わらずjson.loadと同じ要素が得られることを確認。"""
+        path = write_json(temp_dir / "array.json", ELEMENTS, indent=indent)
+
+        result = list(iter_json_array(path, buffer_size=buffer_size))
+
+        assert result == json.loads(path.read_text("utf-8"))
+
+    def test_正常系_要素は遅延して読み込まれる(self, temp_dir: Path) -> None:
+        """後ろが壊れたファイルでも先頭の要素は取得できることを確認。"""
+        path = temp_dir / "broken.json"
+        path.write_text('[{"id": 1}, {"id": 2}, {"id": ', encoding="utf-8")
+
+        elements = iter_json_array(path, buffer_size=4)
+
+        assert next(elements) == {"id": 1}
+        assert next(elements) == {"id": 2}
+        with pytest.raises(ValueError, match="Invalid JSON"):
+            next(elements)
+
+    @pytest.mark.parametrize("content", ["[]", "  [ \n ]  \n"])
+    def test_エッジケース_空の配列では何も返さない(
+        self,
+        temp_dir: Path,
+        content: str,
+    ) -> None:
+        """空の配列では要素が0件になることを確認。"""
+        path = temp_dir / "empty.json"
+        path.write_text(content, encoding="utf-8")
+
+        assert list(iter_json_array(path)) == []
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            '{"a": 1}',  # 配列ではない
+            "[1, 2",  # 閉じ括弧がない
+            "[1 2]",  # 区切りがない
+            "[1, nope]",  # 不正なリテラル
+            "[1] [2]",  # 余分なデータ
+            "",  # 空ファイル
+        ],
+    )
+    def test_異常系_不正なJSONでValueError(self, temp_dir: Path, content: str) -> None:
+        """配列として不正な内容ではValueErrorが発生することを確認。"""
+        path = temp_dir / "invalid.json"
+        path.write_text(content, encoding="utf-8")
+
+        with pytest.raises(ValueError, match="Invalid JSON"):
+            list(iter_json_array(path, buffer_size=3))
+
+    def test_異常系_ファイルが存在しない場合は呼び出し時にFileNotFoundError(
+        self,
+        temp_dir: Path,
+    ) -> None:
+        """イテレーション開始前にFileNotFoundErrorが発生することを確認。"""
+        with pytest.raises(FileNotFoundError, match="File not found"):
+            iter_json_array(temp_dir / "missing.json")
+
+    def test_異常系_バッファサイズが0以下でValueError(self, temp_dir: Path) -> None:
+        """buffer_sizeが0以下の場合、ValueErrorが発生することを確認。"""
+        path = write_json(temp_dir / "array.json", [])
+
+        with pytest.raises(ValueError, match="buffer_size must be positive"):
+            iter_json_array(path, buffer_size=0)
+
+
+class TestIterJsonObject:
+    """Test iter_json_object function."""
+
+    @pytest.mark.parametrize("buffer_size", BUFFER_SIZES)
+    def test_正常系_オブジェクトのメンバーを順に読み込める(
+        self,
+        temp_dir: Path,
+        buffer_size: int,
+    ) -> None:
+        """メンバーが名前と値の組としてファイル順に得られることを確認。"""
+        data = {f"key{i}": value for i, value in enumerate(ELEMENTS)}
+        path = write_json(temp_dir / "object.json", data, indent=2)
+
+        result = list(iter_json_object(path, buffer_size=buffer_size))
+
+        assert result == list(data.items())
+
+    def test_異常系_配列のファイルでValueError(self, temp_dir: Path) -> None:
+        """トップレベルがオブジェクトでない場合、ValueErrorが発生することを確認。"""
+        path = write_json(temp_dir / "array.json", [1])
+
+        with pytest.raises(ValueError, match="expected '\\{'"):
+            list(iter_json_object(path))
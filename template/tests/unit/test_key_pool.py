@@ -0,0 +1,62 @@
+"""Unit tests for key interning pool module."""
+
+from template_package.utils.helpers import flatten_dict, flatten_records
+from template_package.utils.key_pool import KeyInternPool
+
+
+class TestKeyInternPool:
+    """Test KeyInternPool class."""
+
+    def test_正常系_等しいキーは同じオブジェクトになる(self) -> None:
+        """別々に作られた等しい文字列が同一オブジェクトに揃うことを確認。"""
+        pool = KeyInternPool()
+        first = "".join(["a", ".b"])
+        second = "".join(["a.", "b"])
+
+        assert pool.intern(first) is pool.intern(second)
+        assert len(pool) == 1
+
+    def test_正常系_結合したキーが再利用される(self) -> None:
+        """同じ親キーとセグメントの結合結果が同一オブジェクトになることを確認。"""
+        pool = KeyInternPool()
+
+        joined = pool.join("a", "b", ".")
+
+        assert joined == "a.b"
+        assert pool.join("a", "b", ".") is joined
+        assert pool.join("a", "b", "/") == "a/b"
+        assert pool.join("", 0, ".") == "0"
+
+    def test_正常系_clearで全てのキーが削除される(self) -> None:
+        """clear後はプールが空になることを確認。"""
+        pool = KeyInternPool()
+        pool.join("a", "b", ".")
+
+        pool.clear()
+
+        assert len(pool) == 0
+        assert "a.b" not in pool
+
+    def test_正常系_flatten_dictの結果でキーが共有される(self) -> None:
+        """同じプールを渡した複数の結果でキーオブジェクトが共有されることを確認。"""
+        pool = KeyInternPool()
+        records = [{"a": {"b": i}, "c": [i]} for i in range(3)]
+
+        flattened = [
+            flatten_dict(record, key_pool=pool, flatten_lists=True)
+            for record in records
+        ]
+
+        assert flattened[0] == flatten_dict(records[0], flatten_lists=True)
+        keys = [list(result) for result in flattened]
+        assert all(key is other for key, other in zip(keys[0], keys[2], strict=True))
+        assert len(pool) == 4
+        assert all(key in pool for key in ("a", "a.b", "c", "c.0"))
+
+    def test_正常系_flatten_recordsでも同じ結果になる(self) -> None:
+        """プールの有無でflatten_recordsの結果が変わらないことを確認。"""
+        records = [{"a": {"b": i}} for i in range(3)]
+
+        assert flatten_records(records, key_pool=KeyInternPool()) == (
+            flatten_records(records)
+        )
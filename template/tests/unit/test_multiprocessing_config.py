@@ -0,0 +1,26 @@
+"""Unit tests for multiprocessing_config module."""
+
+from concurrent.futures import ProcessPoolExecutor
+
+from template_package.utils.multiprocessing_config import (
+    DEFAULT_START_METHOD,
+    default_mp_context,
+)
+
+
+class TestDefaultMpContext:
+    """Test default_mp_context function."""
+
+    def test_正常系_forkを使わない起動方式を返す(self) -> None:
+        """既定の起動方式がforkではないことを確認。"""
+        context = default_mp_context()
+
+        assert context.get_start_method() == DEFAULT_START_METHOD
+        assert DEFAULT_START_METHOD in {"forkserver", "spawn"}
+
+    def test_正常系_プロセスプールを起動できる(self) -> None:
+        """返されたコンテキストでワーカーが動作することを確認。"""
+        with ProcessPoolExecutor(
+            max_workers=1, mp_context=default_mp_context()
+        ) as executor:
+            assert executor.submit(len, "abc").result() == 3
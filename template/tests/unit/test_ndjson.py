@@ -0,0 +1,153 @@
+"""Unit tests for NDJSON module."""
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+from template_package.utils.ndjson import (
+    NDJSONWriter,
+    append_ndjson,
+    iter_ndjson,
+    iter_ndjson_parallel,
+    load_ndjson_parallel,
+)
+
+RECORDS: list[Any] = [
+    {"id": 1, "text": "改行を含む\n文字列"},
+    [1, 2, {"nested": None}],
+    "plain",
+    3.5,
+    True,
+]
+
+
+class TestNDJSONWriter:
+    """Test NDJSONWriter class."""
+
+    def test_正常系_レコードを1行ずつ追記できる(self, temp_dir: Path) -> None:
+        """各レコードが1行のJSONとして書き込まれることを確認。"""
+        path = temp_dir / "out" / "records.ndjson"
+
+        with NDJSONWriter(path) as writer:
+            writer.write(RECORDS[0])
+            assert writer.write_many(RECORDS[1:]) == len(RECORDS) - 1
+
+        lines = path.read_text(encoding="utf-8").splitlines()
+        assert len(lines) == len(RECORDS)
+        assert lines[0] == '{"id":1,"text":"改行を含む\\n文字列"}'
+        assert writer.written == len(RECORDS)
+
+    def test_正常系_既存ファイルの末尾に追記する(self, temp_dir: Path) -> None:
+        """再度開いた場合に既存の内容を残して追記されることを確認。"""
+        path = temp_dir / "records.ndjson"
+
+        append_ndjson(RECORDS[:2], path)
+        append_ndjson(RECORDS[2:], path)
+
+        assert list(iter_ndjson(path)) == RECORDS
+
+    def test_正常系_flushでバッファの内容がファイルに書き込まれる(
+        self, temp_dir: Path
+    ) -> None:
+        """close前でもflush後は読み込めることを確認。"""
+        path = temp_dir / "records.ndjson"
+
+        with NDJSONWriter(path) as writer:
+            writer.write({"id": 1})
+            writer.flush()
+            assert list(iter_ndjson(path)) == [{"id": 1}]
+
+    def test_異常系_close後の書き込みでValueError(self, temp_dir: Path) -> None:
+        """閉じたライターへの書き込みがエラーになることを確認。"""
+        writer = NDJSONWriter(temp_dir / "records.ndjson")
+        writer.close()
+        writer.close()  # 2回目のcloseは何もしない
+
+        with pytest.raises(ValueError, match="closed"):
+            writer.write({"id": 1})
+
+    def test_異常系_不正なbuffer_sizeでValueError(self, temp_dir: Path) -> None:
+        """buffer_sizeが0以下の場合にエラーになることを確認。"""
+        with pytest.raises(ValueError, match="buffer_size must be positive"):
+            NDJSONWriter(temp_dir / "records.ndjson", buffer_size=0)
+
+
+class TestIterNdjson:
+    """Test iter_ndjson function."""
+
+    def test_正常系_空行を読み飛ばして遅延読み込みできる(self, temp_dir: Path) -> None:
+        """空行を除いたレコードが順に返されることを確認。"""
+        path = temp_dir / "records.ndjson"
+        path.write_text('{"a": 1}\n\n  \n[2]\n"x"', encoding="utf-8")
+
+        assert list(iter_ndjson(path)) == [{"a": 1}, [2], "x"]
+
+    def test_異常系_不正な行で行番号付きのValueError(self, temp_dir: Path) -> None:
+        """不正な行までのレコードを返した後、行番号付きでエラーになることを確認。"""
+        path = temp_dir / "records.ndjson"
+        path.write_text('{"a": 1}\n{"b": \n', encoding="utf-8")
+
+        records = iter_ndjson(path)
+        assert next(records) == {"a": 1}
+        with pytest.raises(ValueError, match="at line 2"):
+            next(records)
+
+    def test_異常系_存在しないファイルで即座にFileNotFoundError(
+        self, temp_dir: Path
+    ) -> None:
+        """イテレーション開始前にエラーになることを確認。"""
+        with pytest.raises(FileNotFoundError, match="File not found"):
+            iter_ndjson(temp_dir / "missing.ndjson")
+
+
+class TestIterNdjsonParallel:
+    """Test iter_ndjson_parallel and load_ndjson_parallel functions."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 10, 64, 1 << 20])
+    def test_正常系_範囲に分割してもファイル順に読み込める(
+        self, temp_dir: Path, chunk_size: int
+    ) -> None:
+        """範囲の大きさに関わらずiter_ndjsonと同じ結果になることを確認。"""
+        path = temp_dir / "records.ndjson"
+        append_ndjson(({"id": i, "name": "x" * (i % 7)} for i in range(50)), path)
+        with path.open("a", encoding="utf-8") as f:
+            f.write('\n\n{"id": "last"}')  # 空行と改行で終わらない最終行
+
+        records = load_ndjson_parallel(path, max_workers=2, chunk_size=chunk_size)
+
+        assert records == list(iter_ndjson(path))
+        assert len(records) == 51
+
+    def test_正常系_途中で読み込みをやめられる(self, temp_dir: Path) -> None:
+        """イテレーターを途中で閉じてもワーカーが後始末されることを確認。"""
+        path = temp_dir / "records.ndjson"
+        append_ndjson(({"id": i} for i in range(100)), path)
+
+        records = iter_ndjson_parallel(path, max_workers=2, chunk_size=16)
+        assert next(records) == {"id": 0}
+        records.close()  # type: ignore[attr-defined]
+
+    def test_エッジケース_空のファイルでは何も返さない(self, temp_dir: Path) -> None:
+        """空のファイルで空のリストになることを確認。"""
+        path = temp_dir / "empty.ndjson"
+        path.touch()
+
+        assert load_ndjson_parallel(path, max_workers=2) == []
+
+    def test_異常系_不正な行でバイト位置付きのValueError(self, temp_dir: Path) -> None:
+        """ワーカーで発生した解析エラーが呼び出し元に伝わることを確認。"""
+        path = temp_dir / "records.ndjson"
+        path.write_bytes(b'{"a": 1}\n{"a": 2}\n{"b": \n{"a": 4}\n')
+
+        with pytest.raises(ValueError, match="at byte 18"):
+            load_ndjson_parallel(path, max_workers=2, chunk_size=8)
+
+    def test_異常系_不正な引数で即座にValueError(self, temp_dir: Path) -> None:
+        """max_workersやchunk_sizeが0以下の場合にエラーになることを確認。"""
+        path = temp_dir / "records.ndjson"
+        path.touch()
+
+        with pytest.raises(ValueError, match="max_workers must be positive"):
+            iter_ndjson_parallel(path, max_workers=0)
+        with pytest.raises(ValueError, match="chunk_size must be positive"):
+            iter_ndjson_parallel(path, chunk_size=0)
@@ -0,0 +1,133 @@
+"""Unit tests for NDJSON index module."""
+
+from pathlib import Path
+
+import pytest
+from template_package.utils.ndjson import append_ndjson
+from template_package.utils.ndjson_index import NDJSONIndex
+
+
+@pytest.fixture
+def ndjson_file(temp_dir: Path) -> Path:
+    """100件のレコードを持つJSON Linesファイルを作成する。"""
+    path = temp_dir / "records.ndjson"
+    append_ndjson(({"id": i, "name": f"item{i}"} for i in range(100)), path)
+    return path
+
+
+class TestNDJSONIndex:
+    """Test NDJSONIndex class."""
+
+    def test_正常系_N番目のレコードを直接読み込める(self, ndjson_file: Path) -> None:
+        """インデックスで任意の位置のレコードを取得できることを確認。"""
+        with NDJSONIndex(ndjson_file) as index:
+            assert len(index) == 100
+            assert index[0] == {"id": 0, "name": "item0"}
+            assert index[57] == {"id": 57, "name": "item57"}
+            assert index[-1] == {"id": 99, "name": "item99"}
+
+        assert ndjson_file.with_name("records.ndjson.idx").exists()
+
+    def test_正常系_範囲を指定して読み込める(self, ndjson_file: Path) -> None:
+        """iter_rangeで指定範囲のレコードが順に返されることを確認。"""
+        with NDJSONIndex(ndjson_file) as index:
+            ids = [record["id"] for record in index.iter_range(10, 15)]
+            assert ids == [10, 11, 12, 13, 14]
+            assert len(list(index.iter_range(95, 1000))) == 5
+            assert list(index.iter_range(100)) == []
+
+    def test_正常系_追記分だけを増分でインデックスに追加する(
+        self, ndjson_file: Path
+    ) -> None:
+        """refreshで追記されたレコードのみが追加されることを確認。"""
+        with NDJSONIndex(ndjson_file) as index:
+            append_ndjson([{"id": 100}, {"id": 101}], ndjson_file)
+
+            assert index.refresh() == 2
+            assert index.refresh() == 0
+            assert len(index) == 102
+            assert index[101] == {"id": 101}
+
+        # 保存済みのインデックスを再利用する
+        with NDJSONIndex(ndjson_file) as index:
+            assert len(index) == 102
+            assert index.offset(1) > 0
+
+    def test_正常系_空行を除いてiter_ndjsonと同じ番号を振る(
+        self, temp_dir: Path
+    ) -> None:
+        """空行がレコードとして数えられないことを確認。"""
+        path = temp_dir / "records.ndjson"
+        path.write_bytes(b'{"a": 1}\n\n[2]\n\n"x"\n')
+
+        with NDJSONIndex(path) as index:
+            assert list(index) == [{"a": 1}, [2], "x"]
+            assert index[2] == "x"
+
+    def test_エッジケース_改行で終わらない最終行は索引しない(
+        self, temp_dir: Path
+    ) -> None:
+        """書き込み途中の行は改行で終わった後に索引されることを確認。"""
+        path = temp_dir / "records.ndjson"
+        path.write_bytes(b'{"a": 1}\n{"b": ')
+
+        with NDJSONIndex(path) as index:
+            assert len(index) == 1
+            with path.open("ab") as f:
+                f.write(b"2}\n")
+            assert index.refresh() == 1
+            assert index[1] == {"b": 2}
+
+    def test_エッジケース_書き換えられたファイルはインデックスを再構築する(
+        self, ndjson_file: Path
+    ) -> None:
+        """ファイルが短くなった場合に索引が作り直されることを確認。"""
+        NDJSONIndex(ndjson_file).close()
+        ndjson_file.write_bytes(b'{"id": "new"}\n')
+
+        with NDJSONIndex(ndjson_file) as index:
+            assert len(index) == 1
+            assert index[0] == {"id": "new"}
+
+    def test_エッジケース_長く書き換えられたファイルはインデックスを再構築する(
+        self, temp_dir: Path
+    ) -> None:
+        """索引済みの範囲より長い内容に書き換えても索引が作り直されることを確認。"""
+        path = temp_dir / "records.ndjson"
+        path.write_bytes(b'{"a":11}\n' * 10)
+        NDJSONIndex(path).close()
+        path.write_bytes(b"10\n" * 40)
+
+        with NDJSONIndex(path) as index:
+            assert len(index) == 40
+            assert index[39] == 10
+
+    def test_エッジケース_開いている間に書き換えられても再構築する(
+        self, ndjson_file: Path
+    ) -> None:
+        """refreshで書き換えと置き換えの両方を検出することを確認。"""
+        with NDJSONIndex(ndjson_file) as index:
+            ndjson_file.write_bytes(b"[0]\n" * 200)
+            assert index.refresh() == 200
+            assert index[199] == [0]
+
+            replacement = ndjson_file.with_name("replacement.ndjson")
+            replacement.write_bytes(b'"x"\n')
+            replacement.replace(ndjson_file)
+            assert index.refresh() == 1
+            assert index[0] == "x"
+
+    def test_異常系_範囲外の番号でIndexError(self, ndjson_file: Path) -> None:
+        """存在しないレコード番号でエラーになることを確認。"""
+        with NDJSONIndex(ndjson_file) as index, pytest.raises(IndexError):
+            index[100]
+
+    def test_異常系_逆順の範囲でValueError(self, ndjson_file: Path) -> None:
+        """終了位置が開始位置より前の場合にエラーになることを確認。"""
+        with NDJSONIndex(ndjson_file) as index, pytest.raises(ValueError):
+            index.iter_range(5, 2)
+
+    def test_異常系_存在しないファイルでFileNotFoundError(self, temp_dir: Path) -> None:
+        """データファイルがない場合にエラーになることを確認。"""
+        with pytest.raises(FileNotFoundError, match="File not found"):
+            NDJSONIndex(temp_dir / "missing.ndjson")
@@ -0,0 +1,167 @@
+"""Unit tests for parallel processing module."""
+
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+from template_package.core.example import CHUNKS_PER_WORKER, process_data
+from template_package.core.parallel import run_chunks_in_pool
+from template_package.types import ChunkTransport
+
+
+class DoublingProcessor:
+    """Picklable processor that doubles each value."""
+
+    def process(self, data: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Double the value of each item."""
+        return [{**item, "value": item["value"] * 2} for item in data]
+
+
+class FlaggingProcessor:
+    """Picklable processor whose output does not fit the columnar layout."""
+
+    def process(self, data: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Add a processed flag to each item."""
+        return [{**item, "processed": True} for item in data]
+
+
+class ChunkSizeProcessor:
+    """Picklable processor that records the size of its chunk in each value."""
+
+    def process(self, data: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Replace each value with the number of items in the chunk."""
+        return [{**item, "value": len(data)} for item in data]
+
+
+class FailingProcessor:
+    """Picklable processor that always fails."""
+
+    def process(self, data: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Raise an error."""
+        raise RuntimeError("worker failure")
+
+
+class FirstChunkFailingProcessor:
+    """Picklable processor that fails on the first chunk and is slow otherwise."""
+
+    def process(self, data: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Raise for the chunk starting at id 0, else return data after a delay."""
+        if data[0]["id"] == 0:
+            raise RuntimeError("worker failure")
+        time.sleep(0.3)
+        return data
+
+
+SHM_DIR = Path("/dev/shm")
+
+
+def shared_memory_segments() -> set[str]:
+    """Return the names of the shared memory segments currently in /dev/shm."""
+    return {path.name for path in SHM_DIR.iterdir()}
+
+
+class TestRunChunksInPool:
+    """Test run_chunks_in_pool function."""
+
+    def test_正常系_指定したチャンクのみ処理される(
+        self, make_items: Callable[[int], list[dict[str, Any]]]
+    ) -> None:
+        """indicesで指定したチャンクだけが処理されることを確認。"""
+        chunks = [make_items(2), make_items(3), make_items(1)]
+        completed: dict[int, list[dict[str, Any]]] = {}
+
+        run_chunks_in_pool(
+            DoublingProcessor(),
+            chunks,
+            [0, 2],
+            max_workers=2,
+            on_complete=completed.__setitem__,
+        )
+
+        assert sorted(completed) == [0, 2]
+        assert completed[2] == [{"id": 0, "name": "Item 0", "value": 0}]
+
+    def test_異常系_max_workersが0以下でValueError(self) -> None:
+        """max_workersが0以下の場合、ValueErrorが発生することを確認。"""
+        with pytest.raises(ValueError, match="max_workers must be positive"):
+            run_chunks_in_pool(
+                DoublingProcessor(),
+                [],
+                [],
+                max_workers=0,
+                on_complete=lambda index, output: None,
+            )
+
+
+class TestProcessDataParallel:
+    """Test process_data with worker processes."""
+
+    @pytest.mark.parametrize("transport", ["pickle", "shared_memory"])
+    def test_正常系_並列処理でも順序と結果が保たれる(
+        self,
+        transport: ChunkTransport,
+        make_items: Callable[[int], list[dict[str, Any]]],
+    ) -> None:
+        """並列処理の結果が逐次処理と同じ順序・内容になることを確認。"""
+        items = make_items(50)
+
+        result = process_data(
+            items, DoublingProcessor(), max_workers=3, transport=transport
+        )
+
+        assert result == process_data(items, DoublingProcessor())
+
+    @pytest.mark.skipif(not SHM_DIR.is_dir(), reason="requires /dev/shm")
+    def test_異常系_失敗時に実行中チャンクの共有メモリが残らない(
+        self, make_items: Callable[[int], list[dict[str, Any]]]
+    ) -> None:
+        """失敗後に完了したチャンクの出力ブロックも破棄されることを確認。"""
+        before = shared_memory_segments()
+
+        with pytest.raises(RuntimeError, match="worker failure"):
+            process_data(
+                make_items(80),
+                FirstChunkFailingProcessor(),
+                max_workers=4,
+                chunk_size=10,
+                transport="shared_memory",
+                reuse_workers=False,
+            )
+
+        assert shared_memory_segments() - before == set()
+
+    def test_正常系_既定ではワーカーあたり複数のチャンクに分割される(
+        self, make_items: Callable[[int], list[dict[str, Any]]]
+    ) -> None:
+        """chunk_size未指定時はCHUNKS_PER_WORKER個ずつに分割され順序が保たれることを確認。"""
+        items = make_items(4 * CHUNKS_PER_WORKER)
+
+        result = process_data(items, ChunkSizeProcessor(), max_workers=2)
+
+        assert [item["id"] for item in result] == [item["id"] for item in items]
+        assert {item["value"] for item in result} == {2}
+
+    def test_正常系_列形式に収まらない出力はpickleで返される(
+        self, make_items: Callable[[int], list[dict[str, Any]]]
+    ) -> None:
+        """出力に追加キーがあっても共有メモリ経由で処理できることを確認。"""
+        items = make_items(10)
+
+        result = process_data(
+            items,
+            FlaggingProcessor(),
+            max_workers=2,
+            chunk_size=3,
+            transport="shared_memory",
+        )
+
+        assert result == [{**item, "processed": True} for item in items]
+
+    def test_異常系_ワーカーの例外が伝播する(
+        self, make_items: Callable[[int], list[dict[str, Any]]]
+    ) -> None:
+        """ワーカー内の例外が呼び出し元に伝播することを確認。"""
+        with pytest.raises(RuntimeError, match="worker failure"):
+            process_data(make_items(4), FailingProcessor(), max_workers=2)
@@ -0,0 +1,192 @@
+"""Unit tests for worker pool registry module."""
+
+import multiprocessing
+import os
+import time
+from collections.abc import Callable, Iterator
+from typing import Any
+
+import pytest
+from template_package.core.deadline import Deadline
+from template_package.core.example import process_data
+from template_package.core.parallel import run_chunks_in_pool
+from template_package.core.pool import WorkerPoolRegistry
+from template_package.utils.multiprocessing_config import DEFAULT_START_METHOD
+
+# ウォームアップフックが設定するワーカー内の状態
+_WARM_STATE: dict[str, bool] = {"warm": False}
+
+
+def mark_warm() -> None:
+    """Warm-up hook recording that it ran."""
+    _WARM_STATE["warm"] = True
+
+
+def is_warm() -> bool:
+    """Task reporting whether the warm-up hook ran in this worker."""
+    return _WARM_STATE["warm"]
+
+
+class PidProcessor:
+    """Picklable processor that stores the worker's process id in each value."""
+
+    def process(self, data: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Replace each value with the current process id."""
+        return [{**item, "value": os.getpid()} for item in data]
+
+
+class SleepingProcessor:
+    """Picklable processor that sleeps before returning its input."""
+
+    def process(self, data: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Sleep, then return the data unchanged."""
+        time.sleep(30)
+        return data
+
+
+@pytest.fixture
+def registry() -> Iterator[WorkerPoolRegistry]:
+    """Create a registry that is shut down after the test."""
+    registry = WorkerPoolRegistry()
+    yield registry
+    registry.shutdown()
+
+
+class TestWorkerPoolRegistry:
+    """Test WorkerPoolRegistry class."""
+
+    def test_正常系_同じ型とワーカー数ならプールを再利用する(
+        self,
+        registry: WorkerPoolRegistry,
+    ) -> None:
+        """同じキーのleaseで同一のプールが返されることを確認。"""
+        with registry.lease(PidProcessor, 2) as first:
+            pass
+        with registry.lease(PidProcessor, 2) as second:
+            pass
+        with registry.lease(PidProcessor, 3) as other:
+            pass
+
+        assert first is second
+        assert other is not first
+        assert len(registry) == 2
+
+    def test_正常系_既定ではforkを使わずにワーカーを起動する(
+        self,
+        registry: WorkerPoolRegistry,
+    ) -> None:
+        """スレッドを持つ親プロセスをforkしない起動方式が使われることを確認。"""
+        assert registry.mp_context.get_start_method() == DEFAULT_START_METHOD
+        assert DEFAULT_START_METHOD != "fork"
+
+        with registry.lease(PidProcessor, max_workers=1) as executor:
+            assert executor.submit(os.getpid).result() != os.getpid()
+
+    def test_正常系_起動方式を指定できる(self) -> None:
+        """mp_contextで指定したコンテキストでプールが起動されることを確認。"""
+        context = multiprocessing.get_context("spawn")
+        registry = WorkerPoolRegistry(mp_context=context)
+        try:
+            with registry.lease(PidProcessor, max_workers=1) as executor:
+                assert executor.submit(is_warm).result() is False
+        finally:
+            registry.shutdown()
+
+        assert registry.mp_context is context
+
+    def test_正常系_ウォームアップフックがワーカーで実行される(
+        self,
+        registry: WorkerPoolRegistry,
+    ) -> None:
+        """登録したフックが各ワーカーの起動時に実行されることを確認。"""
+        registry.register_warmup(PidProcessor, mark_warm)
+        registry.warm_up(PidProcessor, 2)
+
+        with registry.lease(PidProcessor, 2) as pool:
+            results = [pool.submit(is_warm).result() for _ in range(4)]
+
+        assert all(results)
+
+    def test_正常系_retireしたプールは貸出中の処理が終わるまで使える(
+        self,
+        registry: WorkerPoolRegistry,
+    ) -> None:
+        """retire後も貸出中のプールは使え、以後は新しいプールが返ることを確認。"""
+        with registry.lease(PidProcessor, 1) as pool:
+            registry.retire(pool)
+            assert pool.submit(pow, 2, 10).result() == 1024
+
+            with registry.lease(PidProcessor, 1) as replacement:
+                assert replacement is not pool
+
+    def test_正常系_shutdownで全プールが破棄される(
+        self,
+        registry: WorkerPoolRegistry,
+    ) -> None:
+        """shutdown後はレジストリが空になることを確認。"""
+        registry.warm_up(PidProcessor, 1)
+
+        registry.shutdown()
+
+        assert len(registry) == 0
+
+    def test_正常系_期限切れのプールはレジストリから外される(
+        self,
+        registry: WorkerPoolRegistry,
+        make_items: Callable[[int], list[dict[str, Any]]],
+    ) -> None:
+        """期限切れで中断したプールが再利用されないことを確認。"""
+        started = time.monotonic()
+
+        unfinished = run_chunks_in_pool(
+            SleepingProcessor(),
+            [make_items(1), make_items(1)],
+            [0, 1],
+            max_workers=1,
+            on_complete=lambda index, output: None,
+            deadline=Deadline(0.2),
+            registry=registry,
+        )
+
+        assert unfinished == [0, 1]
+        assert len(registry) == 0
+        assert time.monotonic() - started < 10
+
+    def test_異常系_max_workersが0以下でValueError(
+        self,
+        registry: WorkerPoolRegistry,
+    ) -> None:
+        """max_workersが0以下の場合、ValueErrorが発生することを確認。"""
+        with (
+            pytest.raises(ValueError, match="max_workers must be positive"),
+            registry.lease(PidProcessor, 0),
+        ):
+            pass
+
+
+class TestProcessDataWorkerReuse:
+    """Test worker reuse across process_data calls."""
+
+    def test_正常系_連続した呼び出しで同じワーカーが使われる(
+        self, make_items: Callable[[int], list[dict[str, Any]]]
+    ) -> None:
+        """reuse_workers=Trueでは2回目の呼び出しも同じプロセスで動くことを確認。"""
+        items = make_items(20)
+
+        first = process_data(items, PidProcessor(), max_workers=2, chunk_size=1)
+        second = process_data(items, PidProcessor(), max_workers=2, chunk_size=1)
+
+        assert {item["value"] for item in second} <= {item["value"] for item in first}
+
+    def test_正常系_reuse_workersがFalseならワーカーを使い回さない(
+        self, make_items: Callable[[int], list[dict[str, Any]]]
+    ) -> None:
+        """reuse_workers=Falseでは呼び出しごとに新しいプロセスが起動することを確認。"""
+        items = make_items(4)
+
+        first = process_data(items, PidProcessor(), max_workers=2, reuse_workers=False)
+        second = process_data(items, PidProcessor(), max_workers=2, reuse_workers=False)
+
+        assert not {item["value"] for item in first} & {
+            item["value"] for item in second
+        }
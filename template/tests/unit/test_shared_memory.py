@@ -0,0 +1,118 @@
+"""Unit tests for shared memory transport module."""
+
+import pickle
+from typing import Any
+
+import pytest
+from template_package.core.shared_memory import (
+    SharedItemChunk,
+    is_columnar_compatible,
+)
+
+
+class TestIsColumnarCompatible:
+    """Test is_columnar_compatible function."""
+
+    def test_正常系_ItemDictのみならTrue(self) -> None:
+        """ItemDictの形式に一致するアイテムはTrueになることを確認。"""
+        items = [{"id": 1, "name": "a", "value": 2}]
+
+        assert is_columnar_compatible(items)
+
+    @pytest.mark.parametrize(
+        "item",
+        [
+            {"id": 1, "name": "a"},  # キー不足
+            {"id": 1, "name": "a", "value": 2, "processed": True},  # 余分なキー
+            {"id": "1", "name": "a", "value": 2},  # idが文字列
+            {"id": 1, "name": None, "value": 2},  # nameがNone
+            {"id": 1, "name": "a", "value": 2.5},  # valueがfloat
+        ],
+    )
+    def test_異常系_形式が異なるとFalse(self, item: dict[str, Any]) -> None:
+        """列形式で表現できないアイテムはFalseになることを確認。"""
+        assert not is_columnar_compatible([item])
+
+
+class TestSharedItemChunk:
+    """Test SharedItemChunk class."""
+
+    def test_正常系_作成したチャンクを別ハンドルから復元できる(self) -> None:
+        """共有メモリに書き込んだアイテムをattachで復元できることを確認。"""
+        items = [
+            {"id": 1, "name": "Item 1", "value": 100},
+            {"id": -2, "name": "", "value": 2**62},
+            {"id": 3, "name": "日本語の名前", "value": 0},
+        ]
+
+        with SharedItemChunk.create(items) as chunk:
+            reader = SharedItemChunk.attach(chunk.handle)
+            try:
+                assert reader.to_items() == items
+                assert len(reader) == 3
+            finally:
+                reader.close()
+
+    def test_正常系_NUL文字を含む名前も復元できる(self) -> None:
+        """区切り文字と同じNUL文字を含む名前でも正しく復元できることを確認。"""
+        items = [
+            {"id": 1, "name": "a\x00b", "value": 1},
+            {"id": 2, "name": "", "value": 2},
+            {"id": 3, "name": "\x00", "value": 3},
+        ]
+
+        with SharedItemChunk.create(items) as chunk:
+            assert not chunk.handle.delimited
+            assert chunk.to_items() == items
+
+    def test_正常系_列をmemoryviewとして参照できる(self) -> None:
+        """id列とvalue列をコピーせずに参照できることを確認。"""
+        items = [{"id": i, "name": f"n{i}", "value": i * 10} for i in range(5)]
+
+        with SharedItemChunk.create(items) as chunk:
+            ids = chunk.ids
+            values = chunk.values
+            assert ids.tolist() == [0, 1, 2, 3, 4]
+            assert values.tolist() == [0, 10, 20, 30, 40]
+            assert chunk.names() == ["n0", "n1", "n2", "n3", "n4"]
+            ids.release()
+            values.release()
+
+    def test_正常系_ハンドルは小さくpickle可能(self) -> None:
+        """ハンドルのpickleサイズがデータ量に依存しないことを確認。"""
+        items = [{"id": i, "name": "x" * 100, "value": i} for i in range(1000)]
+
+        with SharedItemChunk.create(items) as chunk:
+            payload = pickle.dumps(chunk.handle)
+
+            assert pickle.loads(payload) == chunk.handle
+            assert len(payload) < 200
+            assert chunk.handle.nbytes >= 100 * 1000
+
+    def test_エッジケース_空のチャンクを扱える(self) -> None:
+        """アイテムが0件でも作成と復元ができることを確認。"""
+        with SharedItemChunk.create([]) as chunk:
+            assert chunk.to_items() == []
+
+    def test_異常系_列形式で表現できないとValueError(self) -> None:
+        """余分なキーを持つアイテムではValueErrorが発生することを確認。"""
+        items = [{"id": 1, "name": "a", "value": 2, "extra": 3}]
+
+        with pytest.raises(ValueError, match="must contain exactly"):
+            SharedItemChunk.create(items)
+
+    def test_異常系_int64に収まらない値でValueError(self) -> None:
+        """int64の範囲外の値ではValueErrorが発生することを確認。"""
+        items = [{"id": 1, "name": "a", "value": 2**64}]
+
+        with pytest.raises(ValueError, match="does not fit in int64"):
+            SharedItemChunk.create(items)
+
+    def test_異常系_close後の参照でValueError(self) -> None:
+        """close後に列を参照するとValueErrorが発生することを確認。"""
+        chunk = SharedItemChunk.create([{"id": 1, "name": "a", "value": 2}])
+        chunk.close()
+        chunk.unlink()
+
+        with pytest.raises(ValueError, match="is closed"):
+            chunk.to_items()
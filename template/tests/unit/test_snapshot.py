@@ -0,0 +1,95 @@
+"""Unit tests for item snapshot module."""
+
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pytest
+from template_package.core.snapshot import (
+    ItemSnapshot,
+    load_item_snapshot,
+    save_item_snapshot,
+)
+
+ITEMS: list[Any] = [
+    {"id": 1, "name": "Item 1", "value": 100},
+    {"id": -2, "name": "", "value": 2**63 - 1},
+    {"id": 3, "name": "a\x00b", "value": -(2**63)},
+]
+
+
+class TestItemSnapshot:
+    """Test snapshot reading and writing."""
+
+    @pytest.mark.parametrize(
+        "items",
+        [
+            ITEMS,
+            [*ITEMS, {"id": 4, "name": "日本語の名前", "value": 0}],
+            [],
+        ],
+    )
+    def test_正常系_保存したアイテムを復元できる(
+        self, temp_dir: Path, items: list[Any]
+    ) -> None:
+        """ASCII以外の名前や空のリストも含めて往復できることを確認。"""
+        path = temp_dir / "out" / "items.snap"
+
+        size = save_item_snapshot(items, path)
+
+        assert size == path.stat().st_size
+        assert load_item_snapshot(path) == items
+
+    def test_正常系_列をNumPy配列として読み込める(self, temp_dir: Path) -> None:
+        """メモリマップ上の列をnp.frombufferでコピーせずに読めることを確認。"""
+        path = temp_dir / "items.snap"
+        save_item_snapshot(ITEMS, path)
+
+        with ItemSnapshot.open(path) as snapshot:
+            ids = np.frombuffer(snapshot.ids, dtype="<i8")
+            values = np.frombuffer(snapshot.values, dtype="<i8")
+            assert ids.tolist() == [1, -2, 3]
+            assert values[0] == 100
+            assert len(snapshot) == 3
+            assert snapshot.names() == ["Item 1", "", "a\x00b"]
+            del ids, values
+
+    def test_異常系_ItemDict以外の形式でValueError(self, temp_dir: Path) -> None:
+        """列形式で表現できないアイテムはエラーになることを確認。"""
+        with pytest.raises(ValueError, match="exactly int 'id'"):
+            save_item_snapshot([{"id": 1, "name": "a"}], temp_dir / "x.snap")  # type: ignore[list-item]
+        with pytest.raises(ValueError, match="int64"):
+            save_item_snapshot(
+                [{"id": 2**63, "name": "a", "value": 0}], temp_dir / "x.snap"
+            )
+
+    @pytest.mark.parametrize(
+        ("content", "message"),
+        [
+            (b"short", "too short"),
+            (b"NOTASNAP" + bytes(24), "not a snapshot"),
+        ],
+    )
+    def test_異常系_不正なファイルでValueError(
+        self, temp_dir: Path, content: bytes, message: str
+    ) -> None:
+        """スナップショット形式でないファイルはエラーになることを確認。"""
+        path = temp_dir / "bad.snap"
+        path.write_bytes(content)
+
+        with pytest.raises(ValueError, match=message):
+            load_item_snapshot(path)
+
+    def test_異常系_途中で切れたファイルでValueError(self, temp_dir: Path) -> None:
+        """ヘッダーと実際のサイズが一致しない場合にエラーになることを確認。"""
+        path = temp_dir / "items.snap"
+        save_item_snapshot(ITEMS, path)
+        path.write_bytes(path.read_bytes()[:-1])
+
+        with pytest.raises(ValueError, match="expected"):
+            load_item_snapshot(path)
+
+    def test_異常系_存在しないファイルでFileNotFoundError(self, temp_dir: Path) -> None:
+        """存在しないファイルでエラーになることを確認。"""
+        with pytest.raises(FileNotFoundError, match="File not found"):
+            load_item_snapshot(temp_dir / "missing.snap")